@@ -1,8 +1,10 @@
+import gc
 import logging
 import os
 
 from django.apps import AppConfig
 from django.conf import settings
+from django.db import connections
 
 from CreeDictionary import cvd
 
@@ -32,13 +34,36 @@ class APIConfig(AppConfig):
             self.perform_time_consuming_initializations()
 
     def perform_time_consuming_initializations(self):
-        from CreeDictionary.API.search import affix
+        """Load everything that searches and paradigms need
+
+        Under uWSGI this runs in the master process, before it forks the
+        workers, so that they all start out sharing what gets loaded here.
+        """
+        import morphodict.analysis
+        from CreeDictionary.API.search import affix, wordform_index
+        from CreeDictionary.CreeDictionary.paradigm.generation import (
+            default_paradigm_manager,
+        )
+        from CreeDictionary.CreeDictionary.relabelling import read_labels
         from morphodict.lexicon.models import wordform_cache
 
         logger.debug("preloading caches")
         affix.cache.preload()
+        wordform_index.cache.preload()
         wordform_cache.preload()
         if settings.MORPHODICT_ENABLE_CVD:
             cvd.preload_models()
+        morphodict.analysis.strict_analyzer()
+        morphodict.analysis.relaxed_analyzer()
+        default_paradigm_manager()
+        read_labels()
+
+        # Forked workers must not share the database connection used above
+        connections.close_all()
+        # The garbage collector writes to every object it looks at, which
+        # would give each worker its own copy of the memory holding them.
+        # Everything loaded so far lives as long as the process anyway.
+        gc.collect()
+        gc.freeze()
 
         logger.debug("done")
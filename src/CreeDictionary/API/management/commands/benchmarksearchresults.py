@@ -0,0 +1,57 @@
+import timeit
+from argparse import ArgumentParser
+
+from django.core.management.base import BaseCommand
+
+from CreeDictionary.API.search.types import Result
+from morphodict.lexicon.models import Wordform, wordform_cache
+
+
+class Command(BaseCommand):
+    help = """Time creating and merging search Result objects
+
+    Affix and keyword searches create a Result for every candidate wordform,
+    and merge the ones for the same wordform. This times both, without the
+    database, on made-up wordforms, and prints the average time for each.
+    """
+
+    def add_arguments(self, parser: ArgumentParser):
+        parser.add_argument(
+            "--count", type=int, default=1000, help="How many results to create"
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=5, help="Keep the best of this many runs"
+        )
+
+    def handle(self, count, repeat, **options):
+        wordforms = []
+        for i in range(count):
+            wordform = Wordform(text=f"wâpamêw{i}", is_lemma=True)
+            wordform.lemma = wordform
+            wordforms.append(wordform)
+        # Load the rankings before timing anything
+        wordform_cache.MORPHEME_RANKINGS.get("")
+
+        def create_affix_results():
+            return [Result(wf, target_language_affix_match=True) for wf in wordforms]
+
+        def create_keyword_results():
+            return [
+                Result(wf, target_language_keyword_match=["see", "look"])
+                for wf in wordforms
+            ]
+
+        affix_results = create_affix_results()
+        keyword_results = create_keyword_results()
+
+        def merge():
+            for result, other in zip(affix_results, keyword_results):
+                result.add_features_from(other)
+
+        for name, function in [
+            ("create affix result", create_affix_results),
+            ("create keyword result", create_keyword_results),
+            ("merge results", merge),
+        ]:
+            best = min(timeit.repeat(function, number=1, repeat=repeat))
+            self.stdout.write(f"{name}: {best / count * 1e6:.2f} µs")
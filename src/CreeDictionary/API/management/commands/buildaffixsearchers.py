@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from CreeDictionary.API.search.affix import AFFIX_SEARCHER_SOURCES, load_affix_searcher
+
+
+class Command(BaseCommand):
+    help = """Build the affix search tries for the current import ahead of time
+
+    They are saved under MORPHODICT_DATA_CACHE_DIR, where server processes
+    load them from instead of building their own. `importjsondict` runs this
+    after every import; the tries are only rebuilt if the import changed.
+    """
+
+    def handle(self, *args, **options):
+        for name in AFFIX_SEARCHER_SOURCES:
+            load_affix_searcher(name)
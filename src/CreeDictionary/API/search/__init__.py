@@ -1,7 +1,29 @@
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.db.models import prefetch_related_objects
+
+from crkeng.app.preferences import DisplayMode, AnimateEmoji
+from morphodict.analysis import rich_analyze_relaxed_many
 from .runner import search
+from .core import PRESENTATION_PREFETCH_LOOKUPS
+from .query import Query
+
+
+def page_bounds(page: int) -> tuple[int, int]:
+    """
+    The limit and offset of the given page of search results, counting from 1
+    """
+    per_page = settings.MORPHODICT_SEARCH_RESULTS_PER_PAGE
+    return per_page, (page - 1) * per_page
 
 
-def search_with_affixes(query: str, include_auto_definitions=False):
+def search_with_affixes(
+    query: str,
+    include_auto_definitions=False,
+    limit: Optional[int] = None,
+    offset: int = 0,
+):
     """
     Search for wordforms matching:
      - the wordform text
@@ -10,10 +32,22 @@ def search_with_affixes(query: str, include_auto_definitions=False):
      - affixes of the definition keyword text
     """
 
-    return search(query=query, include_auto_definitions=include_auto_definitions)
+    return search(
+        query=query,
+        include_auto_definitions=include_auto_definitions,
+        limit=limit,
+        offset=offset,
+    )
 
 
-def simple_search(query: str, include_auto_definitions=False):
+def simple_search(
+    query: str,
+    include_auto_definitions=False,
+    display_mode=DisplayMode.default,
+    animate_emoji=AnimateEmoji.default,
+    limit: Optional[int] = None,
+    offset: int = 0,
+):
     """
     Search, trying to match full wordforms or keywords within definitions.
 
@@ -24,4 +58,64 @@ def simple_search(query: str, include_auto_definitions=False):
         query=query,
         include_affixes=False,
         include_auto_definitions=include_auto_definitions,
-    ).serialized_presentation_results()
+        limit=limit,
+        offset=offset,
+    ).serialized_presentation_results(
+        display_mode=display_mode, animate_emoji=animate_emoji
+    )
+
+
+def simple_search_many(
+    queries: Iterable[str],
+    include_auto_definitions=False,
+    display_mode=DisplayMode.default,
+    animate_emoji=AnimateEmoji.default,
+    limit: Optional[int] = None,
+):
+    """
+    simple_search() for many queries at once, e.g., every word in a paragraph
+
+    Each distinct query is only searched once, and the database lookups for
+    presenting the results are done once for the whole batch.
+
+    :param limit: if given, only the first this many results of each query are
+        presented
+    :return: a dict mapping each query to its serialized results, and whether
+        it has more results than those
+    """
+    queries = list(dict.fromkeys(queries))
+
+    # Analyze each distinct query once up front; the searches below then find
+    # the analyses already memoized.
+    rich_analyze_relaxed_many(Query(query).query_string for query in queries)
+
+    search_runs = {
+        query: search(
+            query=query,
+            include_affixes=False,
+            include_auto_definitions=include_auto_definitions,
+            limit=limit,
+        )
+        for query in queries
+    }
+
+    prefetch_related_objects(
+        [
+            result.wordform
+            for search_run in search_runs.values()
+            for result in search_run.unsorted_results()
+        ],
+        *PRESENTATION_PREFETCH_LOOKUPS,
+    )
+
+    # Already-prefetched wordforms are skipped by the prefetch each of these
+    # does for itself.
+    return {
+        query: (
+            search_run.serialized_presentation_results(
+                display_mode=display_mode, animate_emoji=animate_emoji
+            ),
+            search_run.has_more_results(),
+        )
+        for query, search_run in search_runs.items()
+    }
@@ -9,18 +9,21 @@ tab-completion. It uses tries to expand queries, so that searching for ‘snowm
 also returns results for ‘snowmobile’
 """
 
+from __future__ import annotations
+
 from collections import defaultdict
 from functools import cached_property
-from itertools import chain
 from typing import Dict, Iterable, List, NewType, Tuple
 
 import dawg
+import numpy as np
 from django.conf import settings
 
-from morphodict.lexicon.models import Wordform, TargetLanguageKeyword
-from CreeDictionary.utils import get_modified_distance
+from morphodict.lexicon.models import ImportStamp, Wordform, TargetLanguageKeyword
+from CreeDictionary.utils import modified_distance_many
 from CreeDictionary.utils.cree_lev_dist import remove_cree_diacritics
 from morphodict.lexicon.util import to_source_language_keyword
+from morphodict.site.data_cache import load_arrays
 from .types import (
     InternalForm,
     Result,
@@ -34,45 +37,97 @@ SimplifiedForm = NewType("SimplifiedForm", str)
 class AffixSearcher:
     """
     Enables prefix and suffix searches given a list of words and their wordform IDs.
-    """
-
-    def __init__(self, words: Iterable[Tuple[str, int]]):
-        self.text_to_ids: Dict[str, List[int]] = defaultdict(list)
 
-        words_marked_for_indexing = [
-            (simplified_text, wordform_id)
-            for raw_text, wordform_id in words
-            if (simplified_text := self.to_simplified_form(raw_text))
-        ]
+    Everything is kept in numpy arrays, which can be saved after each import
+    and memory-mapped by every worker process; see load_affix_searcher().
+    """
 
-        for text, wordform_id in words_marked_for_indexing:
-            self.text_to_ids[self.to_simplified_form(text)].append(wordform_id)
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        """
+        :param arrays: from AffixSearcher.build_arrays()
+        """
+        # The wordform IDs for the text with index i in the tries are
+        # self._ids[self._offsets[i] : self._offsets[i + 1]]
+        self._offsets = arrays["offsets"]
+        self._ids = arrays["ids"]
+        # The original, unsimplified text for each ID, for computing edit
+        # distances without going to the database, sorted by ID
+        self._text_ids = arrays["text_ids"]
+        self._texts = arrays["texts"]
 
         if settings.MORPHODICT_ENABLE_AFFIX_SEARCH:
-            self._prefixes = dawg.CompletionDAWG(
-                [text for text, _ in words_marked_for_indexing]
+            self._prefixes = dawg.IntCompletionDAWG().frombytes(
+                arrays["prefixes"].tobytes()
+            )
+            self._suffixes = dawg.IntCompletionDAWG().frombytes(
+                arrays["suffixes"].tobytes()
             )
-            self._suffixes = dawg.CompletionDAWG(
-                [_reverse(text) for text, _ in words_marked_for_indexing]
+
+    @classmethod
+    def build(cls, words: Iterable[Tuple[str, int]]) -> AffixSearcher:
+        return cls(cls.build_arrays(words))
+
+    @classmethod
+    def build_arrays(cls, words: Iterable[Tuple[str, int]]) -> Dict[str, np.ndarray]:
+        text_to_ids: Dict[SimplifiedForm, List[int]] = defaultdict(list)
+        id_to_text: Dict[int, str] = {}
+        for raw_text, wordform_id in words:
+            if simplified_text := cls.to_simplified_form(raw_text):
+                text_to_ids[simplified_text].append(wordform_id)
+                id_to_text[wordform_id] = raw_text
+
+        texts = list(text_to_ids)
+        text_ids = sorted(id_to_text)
+        arrays = {
+            "offsets": np.cumsum(
+                [0] + [len(text_to_ids[t]) for t in texts], dtype=np.int64
+            ),
+            "ids": np.array([i for t in texts for i in text_to_ids[t]], dtype=np.int64),
+            "text_ids": np.array(text_ids, dtype=np.int64),
+            "texts": np.array(
+                [id_to_text[i].encode("UTF-8") for i in text_ids], dtype=bytes
+            ),
+            "prefixes": np.zeros(0, dtype=np.uint8),
+            "suffixes": np.zeros(0, dtype=np.uint8),
+        }
+        if settings.MORPHODICT_ENABLE_AFFIX_SEARCH:
+            arrays["prefixes"] = _dawg_array((text, i) for i, text in enumerate(texts))
+            arrays["suffixes"] = _dawg_array(
+                (_reverse(text), i) for i, text in enumerate(texts)
             )
+        return arrays
 
     def search_by_prefix(self, prefix: str) -> Iterable[int]:
         """
         :return: an iterable of Wordform IDs that match the prefix
         """
         term = self.to_simplified_form(prefix)
-        matched_words = self._prefixes.keys(term)
-        return chain.from_iterable(self.text_to_ids[t] for t in matched_words)
+        return self._ids_for(self._prefixes.items(term))
 
     def search_by_suffix(self, suffix: str) -> Iterable[int]:
         """
         :return: an iterable of Wordform IDs that match the suffix
         """
         term = self.to_simplified_form(suffix)
-        matched_reversed_words = self._suffixes.keys(_reverse(term))
-        return chain.from_iterable(
-            self.text_to_ids[_reverse(t)] for t in matched_reversed_words
-        )
+        return self._ids_for(self._suffixes.items(_reverse(term)))
+
+    def _ids_for(self, matches: List[Tuple[str, int]]) -> List[int]:
+        """The wordform IDs for (text, index) pairs from the tries, in order"""
+        indices = np.array([i for _, i in matches], dtype=np.int64)
+        starts = self._offsets[indices]
+        lengths = self._offsets[indices + 1] - starts
+        # Positions in self._ids of every ID for every match, in one go
+        positions = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        positions += np.arange(len(positions))
+        return self._ids[positions].tolist()
+
+    def texts_for_ids(self, wordform_ids: List[int]) -> List[str]:
+        """
+        :return: the original text of each of wordform_ids, which must have
+            come from a search
+        """
+        positions = np.searchsorted(self._text_ids, wordform_ids)
+        return [self._texts[p].decode("UTF-8") for p in positions]
 
     @staticmethod
     def to_simplified_form(query: str) -> SimplifiedForm:
@@ -84,6 +139,10 @@ class AffixSearcher:
         return SimplifiedForm(to_source_language_keyword(query.lower()))
 
 
+def _dawg_array(items: Iterable[Tuple[str, int]]) -> np.ndarray:
+    return np.frombuffer(dawg.IntCompletionDAWG(items).tobytes(), dtype=np.uint8)
+
+
 def _reverse(text: SimplifiedForm) -> SimplifiedForm:
     return SimplifiedForm(text[::-1])
 
@@ -92,9 +151,16 @@ def do_affix_search(query: InternalForm, affixes: AffixSearcher) -> Iterable[Wor
     """
     Augments the given set with results from performing both a suffix and prefix search on the wordforms.
     """
+    return Wordform.objects.filter(id__in=affix_search_ids(query, affixes))
+
+
+def affix_search_ids(query: InternalForm, affixes: AffixSearcher) -> set[int]:
+    """
+    Return the IDs of wordforms matched by either a prefix or a suffix search
+    """
     matched_ids = set(affixes.search_by_prefix(query))
     matched_ids |= set(affixes.search_by_suffix(query))
-    return Wordform.objects.filter(id__in=matched_ids)
+    return matched_ids
 
 
 def do_target_language_affix_search(search_run: core.SearchRun):
@@ -107,22 +173,53 @@ def do_target_language_affix_search(search_run: core.SearchRun):
 
 
 def do_source_language_affix_search(search_run: core.SearchRun):
-    matching_words = do_affix_search(
-        search_run.internal_query,
-        cache.source_language_affix_searcher,
+    query = search_run.internal_query
+    affixes = cache.source_language_affix_searcher
+    matched_ids = list(affix_search_ids(query, affixes))
+    edit_distances = affix_edit_distances(
+        query, matched_ids, affixes.texts_for_ids(matched_ids)
     )
-    for word in matching_words:
+
+    for word in Wordform.objects.filter(id__in=edit_distances):
         search_run.add_result(
             Result(
                 word,
                 source_language_affix_match=True,
-                query_wordform_edit_distance=get_modified_distance(
-                    word.text, search_run.internal_query
-                ),
+                query_wordform_edit_distance=edit_distances[word.id],
             )
         )
 
 
+def affix_edit_distances(
+    query: str, matched_ids: List[int], matched_texts: List[str]
+) -> Dict[int, float]:
+    """
+    The edit distance from the query to each affix match that is close enough
+    to keep, by wordform ID
+
+    Every affix match differs from the query by at least the unmatched part of
+    the word, so a match is only dropped if its distance is more than
+    AFFIX_SEARCH_MAX_EXTRA_EDIT_DISTANCE beyond the difference in length. That
+    way, candidates that would rank badly never reach the database, but long
+    words that start or end with the query are kept.
+    """
+    # Short queries can match hundreds of words, so compute all the edit
+    # distances in one batch.
+    distances = modified_distance_many(query, matched_texts)
+
+    max_extra_distance = settings.AFFIX_SEARCH_MAX_EXTRA_EDIT_DISTANCE
+    edit_distances: Dict[int, float] = {}
+    for wordform_id, text, distance in zip(
+        matched_ids, matched_texts, distances.tolist()
+    ):
+        if (
+            max_extra_distance is None
+            or distance <= abs(len(text) - len(query)) + max_extra_distance
+        ):
+            edit_distances[wordform_id] = distance
+    return edit_distances
+
+
 def query_would_return_too_many_results(query: InternalForm) -> bool:
     """
     If we do an search on too short an affix, the tries will match
@@ -149,6 +246,37 @@ def fetch_source_language_lemmas_with_ids():
     return tuple(Wordform.objects.filter(is_lemma=True).values_list("text", "id"))
 
 
+AFFIX_SEARCHER_SOURCES = {
+    "source_language_affixes": fetch_source_language_lemmas_with_ids,
+    "target_language_affixes": fetch_target_language_keywords_with_ids,
+}
+
+
+def load_affix_searcher(name: str) -> AffixSearcher:
+    """
+    Load the affix searcher saved for the current import, building and saving
+    it first if there is none
+
+    `importjsondict` builds them right after each import, so that server
+    startup only has to load the files.
+    """
+    timestamp = ImportStamp.current_timestamp()
+
+    def build():
+        return AffixSearcher.build_arrays(AFFIX_SEARCHER_SOURCES[name]())
+
+    if timestamp is None:
+        # Nothing to tell this database’s contents apart from any other’s
+        return AffixSearcher(build())
+
+    if settings.USE_TEST_DB:
+        name = f"test_db_{name}"
+    key = repr(timestamp)
+    if not settings.MORPHODICT_ENABLE_AFFIX_SEARCH:
+        key += "-without-tries"
+    return AffixSearcher(load_arrays(name, key, build))
+
+
 class _Cache:
     """A holder for cached properties since caching module attributes is messy
 
@@ -161,7 +289,7 @@ class _Cache:
         """
         Returns the affix searcher that matches source language lemmas
         """
-        return AffixSearcher(fetch_source_language_lemmas_with_ids())
+        return load_affix_searcher("source_language_affixes")
 
     @cached_property
     def target_language_affix_searcher(self) -> AffixSearcher:
@@ -169,7 +297,7 @@ class _Cache:
         Returns the affix searcher that matches target language keywords mined from the dictionary
         definitions
         """
-        return AffixSearcher(fetch_target_language_keywords_with_ids())
+        return load_affix_searcher("target_language_affixes")
 
     def preload(self):
         """Preload caches by accessing cached properties
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from CreeDictionary.API.search import affix
+from CreeDictionary.API.search.affix import AffixSearcher, affix_edit_distances
+from morphodict.site.data_cache import load_arrays
+
+WORDS = [
+    ("wâpamêw", 1),
+    ("wapamew", 2),
+    ("wâpahtam", 3),
+    ("nipâw", 4),
+    ("kinipâw", 5),
+    ("", 6),
+    ("nipâw", 7),
+]
+
+
+@pytest.fixture
+def searcher():
+    return AffixSearcher.build(WORDS)
+
+
+def test_search_by_prefix(searcher):
+    assert list(searcher.search_by_prefix("wâpa")) == [3, 1, 2]
+    assert list(searcher.search_by_prefix("wapam")) == [1, 2]
+    assert list(searcher.search_by_prefix("x")) == []
+
+
+def test_search_by_suffix(searcher):
+    assert list(searcher.search_by_suffix("ipaw")) == [4, 7, 5]
+    assert list(searcher.search_by_suffix("mew")) == [1, 2]
+
+
+def test_texts_for_ids(searcher):
+    assert searcher.texts_for_ids([5, 1, 7]) == ["kinipâw", "wâpamêw", "nipâw"]
+
+
+def test_saved_searcher_works_the_same(searcher, settings, tmp_path):
+    settings.MORPHODICT_DATA_CACHE_DIR = tmp_path
+    load_arrays("affixes", "1", lambda: AffixSearcher.build_arrays(WORDS))
+
+    loaded = AffixSearcher(load_arrays("affixes", "1", None))
+
+    assert isinstance(loaded._ids, np.memmap)
+    assert list(loaded.search_by_prefix("wâpa")) == [3, 1, 2]
+    assert list(loaded.search_by_suffix("ipaw")) == [4, 7, 5]
+    assert loaded.texts_for_ids([3]) == ["wâpahtam"]
+
+
+@pytest.mark.django_db
+def test_affix_searcher_is_saved_for_the_import(settings, tmp_path):
+    settings.MORPHODICT_DATA_CACHE_DIR = tmp_path
+
+    searcher = affix.load_affix_searcher("source_language_affixes")
+
+    assert list(searcher.search_by_prefix("wâpamê"))
+    assert [p.name.rsplit("-", 1)[0] for p in tmp_path.iterdir()] == [
+        "test_db_source_language_affixes"
+    ]
+
+
+def test_long_prefix_matches_are_kept():
+    distances = affix_edit_distances(
+        "wâp", [1, 2], ["wâpiskiwiyâsowêwinihkêw", "wâpamêw"]
+    )
+
+    assert distances == {1: 19.5, 2: 4.0}
+
+
+def test_affix_matches_far_beyond_the_unmatched_part_are_dropped(settings):
+    settings.AFFIX_SEARCH_MAX_EXTRA_EDIT_DISTANCE = 0
+
+    distances = affix_edit_distances("wâpamêw", [1, 2], ["wâpamêwak", "wapamewak"])
+
+    assert distances == {1: 2.0}
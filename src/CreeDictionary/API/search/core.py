@@ -1,12 +1,25 @@
-from typing import Any, Iterable
+import heapq
+from functools import cached_property
+from typing import Any, Iterable, Optional, cast
 
 from django.db.models import prefetch_related_objects
 
 from crkeng.app.preferences import DisplayMode, AnimateEmoji
-from . import types, presentation
+from . import types, presentation, ranking
 from .query import Query
 from .util import first_non_none_value
-from morphodict.lexicon.models import Wordform, wordform_cache, WordformKey
+from morphodict.lexicon.models import (
+    ImportStamp,
+    Wordform,
+    wordform_cache,
+    WordformKey,
+)
+
+# Related objects that presenting a result needs
+PRESENTATION_PREFETCH_LOOKUPS = (
+    "lemma__definitions__citations",
+    "definitions__citations",
+)
 
 
 class SearchRun:
@@ -16,21 +29,44 @@ class SearchRun:
     This class does not directly perform searches; for that, see runner.py.
     Instead, it provides an API for various search methods to access the query,
     and to add results to the result collection for future ranking.
+
+    limit and offset pick the page of ranked results that sorted_results() and
+    the presentation methods return; only that page is fully sorted and
+    presented. All results are still gathered, since any of them may rank
+    first.
     """
 
-    def __init__(self, query: str, include_auto_definitions=None):
+    def __init__(
+        self,
+        query: str,
+        include_auto_definitions=None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ):
         self.query = Query(query)
         self.include_auto_definitions = first_non_none_value(
             self.query.auto, include_auto_definitions, default=False
         )
+        self.limit = limit
+        self.offset = offset
         self._results = {}
         self._verbose_messages = []
 
     include_auto_definition: bool
+    limit: Optional[int]
+    offset: int
     _results: dict[WordformKey, types.Result]
     VerboseMessage = dict[str, str]
     _verbose_messages: list[VerboseMessage]
 
+    @cached_property
+    def import_timestamp(self) -> Optional[float]:
+        """
+        The current ImportStamp timestamp, read once for everything in this
+        search that is cached on it
+        """
+        return ImportStamp.current_timestamp()
+
     def add_result(self, result: types.Result):
         if not isinstance(result, types.Result):
             raise TypeError(f"{result} is {type(result)}, not Result")
@@ -49,12 +85,29 @@ class SearchRun:
     def unsorted_results(self) -> Iterable[types.Result]:
         return self._results.values()
 
+    def result_count(self) -> int:
+        """How many results there are on all pages together"""
+        return len(self._results)
+
+    def has_more_results(self) -> bool:
+        """Whether there are results after the current page"""
+        return self.limit is not None and self.offset + self.limit < len(self._results)
+
     def sorted_results(self) -> list[types.Result]:
         results = list(self._results.values())
-        for r in results:
-            r.assign_default_relevance_score()
-        results.sort()
-        return results
+        ranking.score_results(results)
+        if self.limit is None:
+            results.sort()
+            return results[self.offset :]
+        # Only the first offset + limit results get ordered. The key has to be
+        # a number, not the result itself, for tied results to stay in the
+        # order they were added, as they do when sorting. score_results() has
+        # just set every relevance_score.
+        return heapq.nsmallest(
+            self.offset + self.limit,
+            results,
+            key=lambda r: -cast(float, r.relevance_score),
+        )[self.offset :]
 
     def presentation_results(
         self,
@@ -63,16 +116,16 @@ class SearchRun:
     ) -> list[presentation.PresentationResult]:
         results = self.sorted_results()
         prefetch_related_objects(
-            [r.wordform for r in results],
-            "lemma__definitions__citations",
-            "definitions__citations",
+            [r.wordform for r in results], *PRESENTATION_PREFETCH_LOOKUPS
         )
+        preverbs = presentation.preverb_cache.for_timestamp(self.import_timestamp)
         return [
             presentation.PresentationResult(
                 r,
                 search_run=self,
                 display_mode=display_mode,
                 animate_emoji=animate_emoji,
+                preverbs=preverbs,
             )
             for r in results
         ]
@@ -0,0 +1,40 @@
+import pytest
+
+from morphodict.lexicon.models import Wordform
+from CreeDictionary.API.search.core import SearchRun
+from CreeDictionary.API.search.types import Result
+
+
+def make_results():
+    results = []
+    for i, distance in enumerate([0.5, 0.1, 0.9, 0.1, 0.3, 0.7, 0.2, 0.1]):
+        wordform = Wordform(text=f"word{i}", is_lemma=True)
+        wordform.lemma = wordform
+        results.append(Result(wordform, cosine_vector_distance=distance))
+    return results
+
+
+def texts(search_run):
+    return [r.wordform.text for r in search_run.sorted_results()]
+
+
+@pytest.mark.parametrize("limit,offset", [(3, 0), (3, 3), (3, 6), (20, 0), (2, 20)])
+def test_a_page_of_results_is_a_slice_of_all_results(limit, offset):
+    all_results = SearchRun("dog")
+    page = SearchRun("dog", limit=limit, offset=offset)
+    for result in make_results():
+        all_results.add_result(result)
+    for result in make_results():
+        page.add_result(result)
+
+    assert texts(page) == texts(all_results)[offset : offset + limit]
+    assert page.result_count() == 8
+    assert page.has_more_results() == (offset + limit < 8)
+
+
+def test_results_with_the_same_score_keep_their_order():
+    search_run = SearchRun("dog", limit=2, offset=1)
+    for result in make_results():
+        search_run.add_result(result)
+
+    assert texts(search_run) == ["word3", "word7"]
@@ -4,7 +4,7 @@ import logging
 from CreeDictionary.API.search.core import SearchRun
 from CreeDictionary.API.search.types import Result
 from CreeDictionary.cvd import (
-    definition_vectors,
+    similar_definitions,
     google_news_vectors,
     extract_keyed_words,
     vector_for_keys,
@@ -33,7 +33,7 @@ def do_cvd_search(search_run: SearchRun):
     query_vector = vector_for_keys(google_news_vectors(), keys)
 
     try:
-        closest = definition_vectors().similar_by_vector(query_vector, 50)
+        closest = similar_definitions(query_vector, 50)
     except DefinitionVectorsNotFoundException:
         logger.exception("")
         return
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 import logging
-
-from django.db.models import Q
+from collections import defaultdict
 
 from CreeDictionary.utils import (
     get_modified_distance,
@@ -12,9 +11,9 @@ from morphodict.analysis import (
     strict_generator,
     rich_analyze_relaxed,
 )
-from morphodict.lexicon.models import Wordform, SourceLanguageKeyword
+from morphodict.lexicon.models import Wordform, TargetLanguageKeyword
 from morphodict.lexicon.util import to_source_language_keyword
-from . import core
+from . import core, wordform_index
 from .types import Result
 
 logger = logging.getLogger(__name__)
@@ -29,10 +28,24 @@ def fetch_results(search_run: core.SearchRun):
     #         thus, we can match "acâhkos" in the dictionary!
     fst_analyses = set(rich_analyze_relaxed(search_run.internal_query))
 
-    db_matches = list(
-        Wordform.objects.filter(raw_analysis__in=[a.tuple for a in fst_analyses])
+    # Look up the wordforms for all the analyses, and all the lemmas those
+    # analyses could belong to, in one query.
+    index = wordform_index.cache.for_timestamp(search_run.import_timestamp)
+    lemma_ids_by_text = {
+        analysis.lemma: index.lemma_ids_for_text(analysis.lemma)
+        for analysis in fst_analyses
+    }
+    wordforms_by_id = Wordform.objects.in_bulk(
+        index.ids_for_analyses(fst_analyses)
+        + [wordform_id for ids in lemma_ids_by_text.values() for wordform_id in ids]
     )
 
+    db_matches = [
+        wf
+        for wf in wordforms_by_id.values()
+        if wf.raw_analysis is not None and wf.analysis in fst_analyses
+    ]
+
     for wf in db_matches:
         search_run.add_result(
             Result(
@@ -72,7 +85,12 @@ def fetch_results(search_run: core.SearchRun):
         )
 
         possible_lemma_wordforms = best_lemma_matches(
-            analysis, Wordform.objects.filter(text=analysis.lemma, is_lemma=True)
+            analysis,
+            [
+                wordforms_by_id[wordform_id]
+                for wordform_id in lemma_ids_by_text[analysis.lemma]
+                if wordform_id in wordforms_by_id
+            ],
         )
 
         for lemma_wordform in possible_lemma_wordforms:
@@ -136,26 +154,37 @@ def best_lemma_matches(analysis, possible_lemmas) -> list[Wordform]:
 
 
 def fetch_results_from_target_language_keywords(search_run):
-    for stemmed_keyword in stem_keywords(search_run.internal_query):
-        for wordform in Wordform.objects.filter(
-            target_language_keyword__text__iexact=stemmed_keyword
-        ):
-            search_run.add_result(
-                Result(wordform, target_language_keyword_match=[stemmed_keyword])
+    # Keywords are stored as the lowercased stems that stem_keywords()
+    # produces, so one plain `IN` query, which can use the index on text,
+    # finds the matches for every word of the query at once.
+    wordforms = {}
+    matched_keywords = defaultdict(list)
+    for keyword in TargetLanguageKeyword.objects.filter(
+        text__in=stem_keywords(search_run.internal_query)
+    ).select_related("wordform__lemma"):
+        wordforms[keyword.wordform_id] = keyword.wordform
+        matched_keywords[keyword.wordform_id].append(keyword.text)
+
+    for wordform_id, wordform in wordforms.items():
+        search_run.add_result(
+            Result(
+                wordform,
+                target_language_keyword_match=sorted(matched_keywords[wordform_id]),
             )
+        )
 
 
 def fetch_results_from_source_language_keywords(search_run):
-    res = SourceLanguageKeyword.objects.filter(
-        Q(text=to_source_language_keyword(search_run.internal_query))
-    )
-    for kw in res:
+    keyword = to_source_language_keyword(search_run.internal_query)
+    index = wordform_index.cache.for_timestamp(search_run.import_timestamp)
+    wordform_ids = index.ids_for_source_language_keyword(keyword)
+    for wordform in Wordform.objects.filter(id__in=wordform_ids):
         search_run.add_result(
             Result(
-                kw.wordform,
-                source_language_keyword_match=[kw.text],
+                wordform,
+                source_language_keyword_match=[keyword],
                 query_wordform_edit_distance=get_modified_distance(
-                    search_run.internal_query, kw.wordform.text
+                    search_run.internal_query, wordform.text
                 ),
             )
         )
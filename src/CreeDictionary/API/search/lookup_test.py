@@ -0,0 +1,23 @@
+import pytest
+
+from CreeDictionary.API.search.core import SearchRun
+from CreeDictionary.API.search.lookup import (
+    fetch_results_from_target_language_keywords,
+)
+
+
+@pytest.mark.django_db
+def test_target_language_keywords_are_fetched_in_one_query(
+    django_assert_num_queries,
+):
+    search_run = SearchRun("little cat elbow")
+
+    with django_assert_num_queries(1):
+        fetch_results_from_target_language_keywords(search_run)
+
+    matches = {
+        r.wordform.text: r.target_language_keyword_match
+        for r in search_run.unsorted_results()
+    }
+    # minôsis, “kitten, little cat”, matches two of the query words
+    assert matches["minôsis"] == ["cat", "littl"]
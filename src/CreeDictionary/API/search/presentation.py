@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Literal, Optional, TypedDict, cast
 
@@ -8,12 +9,11 @@ from django.forms import model_to_dict
 
 from CreeDictionary.API.search import core, types
 from CreeDictionary.CreeDictionary.relabelling import read_labels
-from CreeDictionary.utils import get_modified_distance
 from CreeDictionary.utils.fst_analysis_parser import partition_analysis
 from CreeDictionary.utils.types import ConcatAnalysis, FSTTag, Label
 from crkeng.app.preferences import DisplayMode, AnimateEmoji
 from morphodict.analysis import RichAnalysis
-from morphodict.lexicon.models import Wordform
+from morphodict.lexicon.models import ImportStamp, Wordform
 
 from ..schema import SerializedDefinition, SerializedWordform
 from .types import Preverb
@@ -97,6 +97,7 @@ class PresentationResult:
         search_run: core.SearchRun,
         display_mode="community",
         animate_emoji=AnimateEmoji.default,
+        preverbs: Optional[PreverbTable] = None,
     ):
         self._result = result
         self._search_run = search_run
@@ -135,7 +136,9 @@ class PresentationResult:
         else:
             raise Exception(f"Unknown {settings.MORPHODICT_TAG_STYLE=}")
 
-        self.lexical_info = get_lexical_info(result.wordform.analysis, animate_emoji)
+        self.lexical_info = get_lexical_info(
+            result.wordform.analysis, animate_emoji, preverbs
+        )
 
         self.preverbs = [
             lexical_entry["entry"]
@@ -319,7 +322,14 @@ def emoji_for_value(choice: str) -> str:
     return AnimateEmoji.choices[AnimateEmoji.default]
 
 
-def get_lexical_info(result_analysis: RichAnalysis, animate_emoji: str) -> List[Dict]:
+def get_lexical_info(
+    result_analysis: RichAnalysis,
+    animate_emoji: str,
+    preverbs: Optional[PreverbTable] = None,
+) -> List[Dict]:
+    """
+    :param preverbs: defaults to preverb_cache.current(), if any are needed
+    """
     if not result_analysis:
         return []
 
@@ -329,7 +339,7 @@ def get_lexical_info(result_analysis: RichAnalysis, animate_emoji: str) -> List[
     lexical_info: List[Dict] = []
 
     for (i, tag) in enumerate(result_analysis_tags):
-        preverb_result: Optional[Preverb] = None
+        preverb_entry: Optional[SerializedWordform] = None
         reduplication_string: Optional[str] = None
         _type: Optional[LexicalEntryType] = None
         entry: Optional[
@@ -347,53 +357,29 @@ def get_lexical_info(result_analysis: RichAnalysis, animate_emoji: str) -> List[
             entry = _InitialChangeResult(text=" ", definitions=change_types).serialize()
 
         elif tag.startswith("PV/"):
-            # use altlabel.tsv to figure out the preverb
-
-            # ling_short looks like: "Preverb: âpihci-"
-            ling_short = read_labels().linguistic_short.get(
-                cast(FSTTag, tag.rstrip("+"))
+            if preverbs is None:
+                preverbs = preverb_cache.current()
+            preverb_entry = preverbs.serialized_preverb(
+                cast(FSTTag, tag.rstrip("+")), animate_emoji
             )
-            if ling_short:
-                # convert to "âpihci" by dropping prefix and last character
-                normative_preverb_text = ling_short[len("Preverb: ") :]
-                preverb_results = Wordform.objects.filter(
-                    text=normative_preverb_text, raw_analysis__isnull=True
-                )
-
-                # find the one that looks the most similar
-                if preverb_results:
-                    preverb_result = min(
-                        preverb_results,
-                        key=lambda pr: get_modified_distance(
-                            normative_preverb_text,
-                            pr.text.strip("-"),
-                        ),
-                    )
-
-                else:
-                    # Can't find a match for the preverb in the database.
-                    # This happens when searching against the test database for
-                    # ê-kî-nitawi-kâh-kîmôci-kotiskâwêyâhk, as the test database
-                    # lacks lacks ê and kî.
-                    preverb_result = Wordform(
-                        text=normative_preverb_text, is_lemma=True
-                    )
 
         if reduplication_string is not None:
             entry = _ReduplicationResult(
                 text=reduplication_string,
                 definitions=[
                     {
-                        "text": "Strong reduplication: intermittent, repeatedly, iteratively; again and again; here and there"
-                        if tag == "RdplS+"
-                        else "Weak Reduplication: ongoing, continuing"
+                        "text": (
+                            "Strong reduplication: intermittent, repeatedly, iteratively; again and again; here and there"
+                            if tag == "RdplS+"
+                            else "Weak Reduplication: ongoing, continuing"
+                        )
                     }
                 ],
             ).serialize()
             _type = "Reduplication"
 
-        if preverb_result is not None:
-            entry = serialize_wordform(preverb_result, animate_emoji)
+        if preverb_entry is not None:
+            entry = preverb_entry
             _type = "Preverb"
 
         if entry and _type:
@@ -465,3 +451,90 @@ def to_list_of_fst_tags(raw_tags: Iterable[str]) -> list[FSTTag]:
     analysis) to a list of FSTTag. FSTTag instances can be used to looup relabellings!
     """
     return [FSTTag(t.strip("+")) for t in raw_tags]
+
+
+class PreverbTable:
+    """
+    The preverb wordform for every PV/ tag that has a relabelling
+
+    Results with preverbs all need the same few dozen wordforms, which only
+    change with an import, so they are looked up all at once and kept for as
+    long as the ImportStamp stays the same.
+    """
+
+    def __init__(self, import_timestamp: Optional[float]):
+        self.import_timestamp = import_timestamp
+
+        # ling_short looks like: "Preverb: âpihci-"
+        texts = {
+            tag: ling_short[len("Preverb: ") :]
+            for tag, ling_short in read_labels().linguistic_short.items()
+            if tag.startswith("PV/")
+        }
+
+        # Every match has exactly the preverb text, so there is nothing to
+        # choose between them by; take the first.
+        wordforms_by_text: dict[str, Wordform] = {}
+        for wordform in (
+            Wordform.objects.filter(
+                text__in=set(texts.values()), raw_analysis__isnull=True
+            )
+            .order_by("id")
+            .prefetch_related("definitions__citations")
+        ):
+            wordforms_by_text.setdefault(wordform.text, wordform)
+
+        self._wordforms: dict[FSTTag, Preverb] = {
+            tag: wordforms_by_text.get(text)
+            # Can't find a match for the preverb in the database. This
+            # happens when searching against the test database for
+            # ê-kî-nitawi-kâh-kîmôci-kotiskâwêyâhk, as the test database
+            # lacks ê and kî.
+            or Wordform(text=text, is_lemma=True)
+            for tag, text in texts.items()
+        }
+        self._serialized: dict[tuple[FSTTag, str], SerializedWordform] = {}
+
+    def serialized_preverb(
+        self, tag: FSTTag, animate_emoji: str
+    ) -> Optional[SerializedWordform]:
+        """
+        The serialized preverb wordform for tag, which has no trailing `+`
+        """
+        key = (tag, animate_emoji)
+        serialized = self._serialized.get(key)
+        if serialized is None:
+            if (wordform := self._wordforms.get(tag)) is None:
+                return None
+            serialized = self._serialized[key] = serialize_wordform(
+                wordform, animate_emoji
+            )
+        # So that results cannot change each other’s copies
+        return cast(SerializedWordform, dict(serialized))
+
+
+class _PreverbCache:
+    """Holds the process-wide PreverbTable, rebuilding it after imports"""
+
+    def __init__(self):
+        self._table: Optional[PreverbTable] = None
+        self._lock = threading.Lock()
+
+    def current(self) -> PreverbTable:
+        return self.for_timestamp(ImportStamp.current_timestamp())
+
+    def for_timestamp(self, timestamp: Optional[float]) -> PreverbTable:
+        """
+        Like current(), but for an import timestamp that the caller already has
+        """
+        table = self._table
+        if table is not None and table.import_timestamp == timestamp:
+            return table
+
+        with self._lock:
+            if self._table is None or self._table.import_timestamp != timestamp:
+                self._table = PreverbTable(timestamp)
+            return self._table
+
+
+preverb_cache = _PreverbCache()
@@ -0,0 +1,41 @@
+import pytest
+
+from CreeDictionary.API.search import presentation
+from morphodict.analysis import RichAnalysis
+from morphodict.lexicon.models import ImportStamp
+
+ANALYSIS = RichAnalysis(
+    (["PV/nitawi+", "PV/e+"], "nipâw", ["+V", "+AI", "+Ind", "+3Sg"])
+)
+
+
+@pytest.mark.django_db
+def test_preverbs_come_from_the_table(django_assert_num_queries):
+    table = presentation.preverb_cache.current()
+    # Fill in the serialized wordforms
+    presentation.get_lexical_info(ANALYSIS, "cat", table)
+
+    with django_assert_num_queries(0):
+        lexical_info = presentation.get_lexical_info(ANALYSIS, "cat", table)
+
+    assert [entry["type"] for entry in lexical_info] == ["Preverb", "Preverb"]
+    assert [entry["original_tag"] for entry in lexical_info] == ["PV/nitawi+", "PV/e+"]
+    nitawi = lexical_info[0]["entry"]
+    assert nitawi["text"] == "nitawi-"
+    assert nitawi["definitions"]
+    # The test database lacks ê-
+    assert lexical_info[1]["entry"]["text"] == "ê-"
+
+
+@pytest.mark.django_db
+def test_preverb_table_is_reused_until_an_import():
+    table = presentation.preverb_cache.current()
+    assert presentation.preverb_cache.current() is table
+
+    stamp = ImportStamp.objects.get()
+    stamp.timestamp += 1
+    stamp.save()
+
+    new_table = presentation.preverb_cache.current()
+    assert new_table is not table
+    assert new_table.import_timestamp == stamp.timestamp
@@ -1,46 +1,130 @@
 from __future__ import annotations
 
-from math import log
+from typing import Sequence
+
+import numpy as np
 
 from . import types
 
+# The source-language score keeps the intent of the old sort order, until we
+# have some training data for Cree queries:
+#   - Cree wordforms in the query take precedence over any English hits
+#   - Then use edit distance
+#   - Finally, prefer lemmas
+# The coefficients here are wild guesses that should accomplish that. They can
+# be replaced with computed values when we have some training data for
+# Cree-language queries.
+SOURCE_LANGUAGE_FEATURES = (
+    "intercept",
+    "query_wordform_edit_distance, default 0",
+    "morpheme_ranking, default 20",
+    "is_lemma",
+)
+SOURCE_LANGUAGE_WEIGHTS = np.array([1000.0, -20.0, -1.0, 1.0])
 
-def _has_value(value):
-    if value is None:
-        return 0
-    return 1
+# See weighting.ipynb for the model that produced these coefficients.
+TARGET_LANGUAGE_FEATURES = (
+    "intercept",
+    "wordform_length",
+    "len(target_language_keyword_match)",
+    "has morpheme_ranking",
+    "morpheme_ranking, default 1",
+    "log(1 + cosine_vector_distance), default distance 1.1",
+)
+TARGET_LANGUAGE_WEIGHTS = np.array(
+    [
+        0.0559011609,
+        -0.0005685605,
+        0.0325909057,
+        0.022778805,
+        -0.0009984537,
+        -0.1190890019,
+    ]
+)
 
 
-def _default_if_none(value, *, default):
-    if value is not None:
-        return value
-    return default
+def score_results(
+    results: Sequence[types.Result],
+    *,
+    source_language_weights: np.ndarray = SOURCE_LANGUAGE_WEIGHTS,
+    target_language_weights: np.ndarray = TARGET_LANGUAGE_WEIGHTS,
+):
+    """
+    Set the relevance_score of every result
 
+    The features of all the results are packed into one array for each
+    language, so that scoring is one matrix product however many results there
+    are. Each score is the dot product of a result’s features, as listed in
+    SOURCE_LANGUAGE_FEATURES or TARGET_LANGUAGE_FEATURES, with the weights.
+    """
+    source_language_results = []
+    target_language_results = []
+    for result in results:
+        if result.did_match_source_language:
+            source_language_results.append(result)
+        else:
+            target_language_results.append(result)
 
-def assign_relevance_score(result: types.Result):
-    # Until we have some training data for Cree queries, we keep the intent of
-    # the old sort order:
-    #   - Cree wordforms in the query take precedence over any English hits
-    #   - Then use edit distance
-    #   - Finally, prefer lemmas
-    # The coefficients here are wild guesses that should accomplish that. They
-    # can be replaced with computed values when we have some training data for
-    # Cree-language queries.
-    if result.did_match_source_language:
-        result.relevance_score = (
-            1000
-            - 20 * _default_if_none(result.query_wordform_edit_distance, default=0)
-            - _default_if_none(result.morpheme_ranking, default=20)
-            + (1 if result.is_lemma else 0)
+    if source_language_results:
+        _assign_scores(
+            source_language_results,
+            _source_language_features(source_language_results),
+            source_language_weights,
         )
-    else:
-        result.relevance_score = (
-            # See weighting.ipynb for the model that produced these coefficients.
-            0.0559011609
-            + -0.0005685605 * result.wordform_length
-            + 0.0325909057 * len(result.target_language_keyword_match)
-            + 0.022778805 * _has_value(result.morpheme_ranking)
-            + -0.0009984537 * _default_if_none(result.morpheme_ranking, default=1)
-            + -0.1190890019
-            * log(1 + _default_if_none(result.cosine_vector_distance, default=1.1))
+    if target_language_results:
+        _assign_scores(
+            target_language_results,
+            _target_language_features(target_language_results),
+            target_language_weights,
         )
+
+
+def assign_relevance_score(result: types.Result):
+    score_results([result])
+
+
+def _assign_scores(
+    results: list[types.Result], features: np.ndarray, weights: np.ndarray
+):
+    for result, score in zip(results, (features @ weights).tolist()):
+        result.relevance_score = score
+
+
+def _source_language_features(results: list[types.Result]) -> np.ndarray:
+    return np.array(
+        [
+            (
+                1,
+                _default_if_none(r.query_wordform_edit_distance, 0),
+                _default_if_none(r.morpheme_ranking, 20),
+                r.is_lemma,
+            )
+            for r in results
+        ],
+        dtype=float,
+    )
+
+
+def _target_language_features(results: list[types.Result]) -> np.ndarray:
+    features = np.array(
+        [
+            (
+                1,
+                r.wordform_length,
+                len(r.target_language_keyword_match),
+                r.morpheme_ranking is not None,
+                _default_if_none(r.morpheme_ranking, 1),
+                _default_if_none(r.cosine_vector_distance, 1.1),
+            )
+            for r in results
+        ],
+        dtype=float,
+    )
+    features[:, 5] = np.log(1 + features[:, 5])
+    return features
+
+
+def _default_if_none(value, default):
+    if value is not None:
+        return value
+    return default
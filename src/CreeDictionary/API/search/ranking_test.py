@@ -1,8 +1,13 @@
+import numpy as np
 import pytest
 from pytest import approx
 
 from morphodict.lexicon.models import Wordform
-from CreeDictionary.API.search.ranking import assign_relevance_score
+from CreeDictionary.API.search.ranking import (
+    TARGET_LANGUAGE_WEIGHTS,
+    assign_relevance_score,
+    score_results,
+)
 from CreeDictionary.API.search.types import Result
 
 
@@ -52,3 +57,31 @@ def test_model_evaluation(expected, kwargs):
     result = build_result(**kwargs)
     assign_relevance_score(result)
     assert result.relevance_score == approx(expected, abs=1e-6)
+
+
+def test_scoring_many_results_at_once():
+    results = [
+        build_result(did_match_target_language=True),
+        build_result(
+            wordform_length=5,
+            source_language_match="nipâw",
+            query_wordform_edit_distance=1,
+        ),
+        build_result(cosine_vector_distance=0.7, morpheme_ranking=12.8),
+    ]
+
+    score_results(results)
+
+    assert [r.relevance_score for r in results] == approx(
+        [-0.033_454, 1000 - 20 - 20 + 1, 0.002_708], abs=1e-6
+    )
+
+
+def test_scoring_with_other_weights():
+    result = build_result(wordform_length=9, morpheme_ranking=12.8)
+    weights = np.zeros_like(TARGET_LANGUAGE_WEIGHTS)
+    weights[1] = 2.0
+
+    score_results([result], target_language_weights=weights)
+
+    assert result.relevance_score == 18.0
@@ -0,0 +1,139 @@
+"""
+Cache of search results, keyed on the normalized query and search options
+
+The site sees the same common queries over and over, especially from
+click-in-text, so the results of a search are kept in Django’s cache.
+Only references to the result wordforms are stored, along with their features,
+so that a cache hit costs one database query to rehydrate the wordforms instead
+of running FST analysis, affix search, CVD, and ESPT again.
+
+The cache key includes the ImportStamp, so entries from before an import are
+never used again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Optional, Union
+
+from django.conf import settings
+from django.core.cache import cache
+
+from morphodict import morphodict_language_pair
+from morphodict.lexicon.models import Wordform
+from . import core
+from .types import Result
+
+# Bump this when changing what gets stored, so that a shared cache doesn’t hand
+# old-format entries to new code.
+CACHE_FORMAT = 1
+
+# A saved wordform is stored by ID; synthetic wordforms, e.g., inflections
+# that are not in the database, as (text, raw_analysis, lemma ID)
+_WordformReference = Union[int, tuple[str, Any, int]]
+
+
+def cache_key(search_run: core.SearchRun, *, include_affixes: bool) -> Optional[str]:
+    """
+    Return the cache key for this search, or None if caching is disabled
+    """
+    if not settings.MORPHODICT_SEARCH_CACHE_TIMEOUT:
+        return None
+
+    query = search_run.query
+    key_parts = [
+        CACHE_FORMAT,
+        morphodict_language_pair(),
+        search_run.import_timestamp,
+        query.query_string,
+        query.verbose,
+        query.auto,
+        query.espt,
+        query.cvd.name if query.cvd is not None else None,
+        include_affixes,
+        search_run.include_auto_definitions,
+    ]
+    digest = hashlib.sha256(
+        json.dumps(key_parts, ensure_ascii=False).encode("UTF-8")
+    ).hexdigest()
+    return f"morphodict-search:{digest}"
+
+
+def store(search_run: core.SearchRun, key: Optional[str]):
+    """
+    Save the results of a completed search under key
+
+    All the results are saved, whichever page search_run is for, and they get
+    ranked again when restored.
+    """
+    if key is None:
+        return
+
+    entry = {
+        "query_terms": search_run.query.query_terms,
+        "results": [
+            (_reference_to(result.wordform), _features_of(result))
+            for result in search_run.unsorted_results()
+        ],
+        "verbose_messages": search_run.verbose_messages,
+    }
+    cache.set(key, entry, settings.MORPHODICT_SEARCH_CACHE_TIMEOUT)
+
+
+def restore(search_run: core.SearchRun, key: Optional[str]) -> bool:
+    """
+    Fill in search_run with the cached results for key, if there are any
+
+    :return: whether search_run was restored from the cache
+    """
+    if key is None:
+        return False
+
+    entry = cache.get(key)
+    if entry is None:
+        return False
+
+    ids = set()
+    for reference, _ in entry["results"]:
+        ids.add(reference if isinstance(reference, int) else reference[2])
+    wordforms_by_id = Wordform.objects.in_bulk(ids)
+
+    results = []
+    for reference, features in entry["results"]:
+        if isinstance(reference, int):
+            wordform = wordforms_by_id.get(reference)
+        else:
+            text, raw_analysis, lemma_id = reference
+            lemma = wordforms_by_id.get(lemma_id)
+            wordform = (
+                Wordform(text=text, raw_analysis=raw_analysis, lemma=lemma)
+                if lemma is not None
+                else None
+            )
+        if wordform is None:
+            # The database changed without a new import stamp
+            return False
+        results.append(Result(wordform, **features))
+
+    search_run.query.query_terms = entry["query_terms"]
+    for result in results:
+        search_run.add_result(result)
+    for message in entry["verbose_messages"]:
+        search_run.add_verbose_message(message)
+    return True
+
+
+def _reference_to(wordform: Wordform) -> _WordformReference:
+    if wordform.id is not None:
+        return wordform.id
+    return (wordform.text, wordform.raw_analysis, wordform.lemma_id)
+
+
+def _features_of(result: Result) -> dict[str, Any]:
+    features = {}
+    for name in Result.FEATURE_NAMES:
+        value = getattr(result, name)
+        if value is not None and value != []:
+            features[name] = value
+    return features
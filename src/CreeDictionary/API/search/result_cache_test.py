@@ -0,0 +1,43 @@
+import pytest
+
+from CreeDictionary.API.search import result_cache, search
+from CreeDictionary.API.search.core import SearchRun
+
+
+def result_keys(search_run):
+    return [r.wordform.key for r in search_run.sorted_results()]
+
+
+@pytest.mark.django_db
+def test_cached_search_returns_same_results(django_assert_max_num_queries):
+    uncached = search(query="wapamew")
+    assert uncached.unsorted_results()
+
+    # One query for the import stamp, one to rehydrate the wordforms
+    with django_assert_max_num_queries(2):
+        cached = search(query="wapamew")
+
+    assert result_keys(cached) == result_keys(uncached)
+    assert [r.features() for r in cached.sorted_results()] == [
+        r.features() for r in uncached.sorted_results()
+    ]
+
+
+@pytest.mark.django_db
+def test_cache_key_depends_on_options():
+    def key(query, **kwargs):
+        return result_cache.cache_key(SearchRun(query), **kwargs)
+
+    assert key("wâpamêw", include_affixes=True) == key(
+        "  Wâpamêw ", include_affixes=True
+    )
+    assert key("wâpamêw", include_affixes=True) != key("wâpamêw", include_affixes=False)
+    assert key("wâpamêw", include_affixes=True) != key(
+        "verbose:1 wâpamêw", include_affixes=True
+    )
+
+
+@pytest.mark.django_db
+def test_cache_can_be_disabled(settings):
+    settings.MORPHODICT_SEARCH_CACHE_TIMEOUT = 0
+    assert result_cache.cache_key(SearchRun("wâpamêw"), include_affixes=True) is None
@@ -1,4 +1,5 @@
 import re
+from typing import Optional
 
 from django.conf import settings
 
@@ -12,6 +13,7 @@ from CreeDictionary.API.search.cvd_search import do_cvd_search
 from CreeDictionary.API.search.espt import EsptSearch
 from CreeDictionary.API.search.lookup import fetch_results
 from CreeDictionary.API.search.query import CvdSearchType
+from CreeDictionary.API.search import result_cache
 from CreeDictionary.API.search.util import first_non_none_value
 from CreeDictionary.utils.types import cast_away_optional
 
@@ -19,18 +21,38 @@ CREE_LONG_VOWEL = re.compile("[êîôâēīōā]")
 
 
 def search(
-    *, query: str, include_affixes=True, include_auto_definitions=False
+    *,
+    query: str,
+    include_affixes=True,
+    include_auto_definitions=False,
+    limit: Optional[int] = None,
+    offset: int = 0,
 ) -> SearchRun:
     """
     Perform an actual search, using the provided options.
 
     This class encapsulates the logic of which search methods to try, and in
-    which order, to build up results in a SearchRun.
+    which order, to build up results in a SearchRun. limit and offset select
+    the page of results that the SearchRun ranks and presents.
     """
     search_run = SearchRun(
-        query=query, include_auto_definitions=include_auto_definitions
+        query=query,
+        include_auto_definitions=include_auto_definitions,
+        limit=limit,
+        offset=offset,
     )
 
+    cache_key = result_cache.cache_key(search_run, include_affixes=include_affixes)
+    if result_cache.restore(search_run, cache_key):
+        return search_run
+
+    _do_search(search_run, include_affixes=include_affixes)
+
+    result_cache.store(search_run, cache_key)
+    return search_run
+
+
+def _do_search(search_run: SearchRun, *, include_affixes: bool):
     if search_run.query.espt:
         espt_search = EsptSearch(search_run)
         espt_search.analyze_query()
@@ -43,7 +65,7 @@ def search(
         # For when you type 'cvd:exclusive' in a query to debug ONLY CVD results!
         if cvd_search_type == CvdSearchType.EXCLUSIVE:
             do_cvd_search(search_run)
-            return search_run
+            return
 
     fetch_results(search_run)
 
@@ -64,8 +86,6 @@ def search(
     if search_run.query.espt:
         espt_search.inflect_search_results()
 
-    return search_run
-
 
 def is_almost_certainly_cree(search_run: SearchRun) -> bool:
     """
@@ -1,15 +1,12 @@
 from __future__ import annotations
 
-import dataclasses
 import json
-from dataclasses import dataclass, field
 from enum import Enum
 from typing import NewType, Optional
 
 from morphodict.lexicon.models import Wordform, wordform_cache
 from CreeDictionary.API.search import ranking
 
-
 Preverb = Wordform
 Lemma = NewType("Lemma", Wordform)
 MatchedEnglish = NewType("MatchedEnglish", str)
@@ -21,7 +18,6 @@ class Language(Enum):
     TARGET = "Target"
 
 
-@dataclass
 class Result:
     """
     A target-language wordform and the features that link it to a query.
@@ -42,14 +38,108 @@ class Result:
     Search methods may generate candidate results that are ultimately not sent
     to users, so any user-friendly tagging/relabelling is instead done in
     PresentationResult class.
+
+    Searches create many of these, so this is a plain class with __slots__
+    instead of a dataclass, and the names of the features are worked out once
+    here instead of from dataclasses.fields() every time.
     """
 
-    def __post_init__(self):
-        if all(
-            getattr(self, field.name) in (None, [])
-            for field in dataclasses.fields(Result)
-            if field.init and field.name != "wordform"
-        ):
+    #: The features that can be given when creating a Result, in order
+    FEATURE_NAMES = (
+        "source_language_match",
+        "query_wordform_edit_distance",
+        "source_language_affix_match",
+        "target_language_affix_match",
+        "target_language_keyword_match",
+        "analyzable_inflection_match",
+        "source_language_keyword_match",
+        "is_espt_result",
+        "did_match_target_language",
+        "morpheme_ranking",
+        "cosine_vector_distance",
+        "relevance_score",
+    )
+    # Features that are lists of every match, without duplicates; the rest are
+    # None when not set
+    _LIST_FEATURE_NAMES = frozenset(
+        ["target_language_keyword_match", "source_language_keyword_match"]
+    )
+
+    __slots__ = ("wordform", "lemma_wordform", "is_lemma", "wordform_length") + (
+        FEATURE_NAMES
+    )
+
+    wordform: Wordform
+    lemma_wordform: Lemma
+    is_lemma: bool
+    wordform_length: int
+
+    #: What, if any, was the matching string?
+    source_language_match: Optional[str]
+    query_wordform_edit_distance: Optional[float]
+
+    source_language_affix_match: Optional[bool]
+    target_language_affix_match: Optional[bool]
+
+    target_language_keyword_match: list[str]
+
+    analyzable_inflection_match: Optional[bool]
+
+    source_language_keyword_match: list[str]
+
+    is_espt_result: Optional[bool]
+
+    #: Was anything in the query a target-language match for this result?
+    did_match_target_language: Optional[bool]
+
+    morpheme_ranking: Optional[float]
+
+    cosine_vector_distance: Optional[float]
+
+    relevance_score: Optional[float]
+
+    def __init__(
+        self,
+        wordform: Wordform,
+        source_language_match: Optional[str] = None,
+        query_wordform_edit_distance: Optional[float] = None,
+        source_language_affix_match: Optional[bool] = None,
+        target_language_affix_match: Optional[bool] = None,
+        target_language_keyword_match: Optional[list[str]] = None,
+        analyzable_inflection_match: Optional[bool] = None,
+        source_language_keyword_match: Optional[list[str]] = None,
+        is_espt_result: Optional[bool] = None,
+        did_match_target_language: Optional[bool] = None,
+        morpheme_ranking: Optional[float] = None,
+        cosine_vector_distance: Optional[float] = None,
+        relevance_score: Optional[float] = None,
+    ):
+        self.wordform = wordform
+        self.source_language_match = source_language_match
+        self.query_wordform_edit_distance = query_wordform_edit_distance
+        self.source_language_affix_match = source_language_affix_match
+        self.target_language_affix_match = target_language_affix_match
+        self.target_language_keyword_match = (
+            target_language_keyword_match
+            if target_language_keyword_match is not None
+            else []
+        )
+        self.analyzable_inflection_match = analyzable_inflection_match
+        self.source_language_keyword_match = (
+            source_language_keyword_match
+            if source_language_keyword_match is not None
+            else []
+        )
+        self.is_espt_result = is_espt_result
+        self.did_match_target_language = did_match_target_language
+        self.morpheme_ranking = morpheme_ranking
+        self.cosine_vector_distance = cosine_vector_distance
+        self.relevance_score = relevance_score
+
+        self._derive_features()
+
+    def _derive_features(self):
+        if not self._has_any_feature():
             raise Exception("No features were provided for why this is a result.")
 
         self.is_lemma = self.wordform.is_lemma
@@ -60,9 +150,20 @@ class Result:
             raise Exception("must include edit distance on source language matches")
 
         if self.morpheme_ranking is None:
-            self.morpheme_ranking = wordform_cache.MORPHEME_RANKINGS.get(
-                self.wordform.text, None
-            ) or wordform_cache.MORPHEME_RANKINGS.get(self.lemma_wordform.text, None)
+            rankings = wordform_cache.MORPHEME_RANKINGS
+            self.morpheme_ranking = rankings.get(self.wordform.text, None)
+            if (
+                not self.morpheme_ranking
+                and self.lemma_wordform.text != self.wordform.text
+            ):
+                self.morpheme_ranking = rankings.get(self.lemma_wordform.text, None)
+
+    def _has_any_feature(self) -> bool:
+        for name in self.FEATURE_NAMES:
+            value = getattr(self, name)
+            if value is not None and value != []:
+                return True
+        return False
 
     def add_features_from(self, other: Result):
         """Add the features from `other` into this object
@@ -75,40 +176,36 @@ class Result:
         self._copy_features_from(other)
 
     def _copy_features_from(self, other: Result):
-        for field_name, other_value in other.features().items():
-            if other_value is not None:
+        for field_name in self.FEATURE_NAMES:
+            other_value = getattr(other, field_name)
+            if other_value is None:
+                continue
+            # combine lists, applying uniq
+            if field_name in self._LIST_FEATURE_NAMES:
                 self_value = getattr(self, field_name)
-                # combine lists, applying uniq
-                if isinstance(self_value, list):
-                    self_value[:] = list(set(self_value + other_value))
-                elif (
-                    field_name == "cosine_vector_distance"
-                    and self.cosine_vector_distance is not None
-                    # We already checked that other.cosine_vector_distance is
-                    # not None, but mypy can’t infer that.
-                    and other.cosine_vector_distance is not None
-                ):
-                    self.cosine_vector_distance = min(
-                        self.cosine_vector_distance, other.cosine_vector_distance
-                    )
-                elif field_name == "query_wordform_edit_distance":
-                    self.query_wordform_edit_distance = min(
-                        v
-                        for v in (
-                            self.query_wordform_edit_distance,
-                            other.query_wordform_edit_distance,
-                        )
-                        if v is not None
-                    )
-                else:
-                    setattr(self, field_name, other_value)
+                for item in other_value:
+                    if item not in self_value:
+                        self_value.append(item)
+            elif (
+                field_name == "cosine_vector_distance"
+                and self.cosine_vector_distance is not None
+            ):
+                self.cosine_vector_distance = min(
+                    self.cosine_vector_distance, other_value
+                )
+            elif (
+                field_name == "query_wordform_edit_distance"
+                and self.query_wordform_edit_distance is not None
+            ):
+                self.query_wordform_edit_distance = min(
+                    self.query_wordform_edit_distance, other_value
+                )
+            else:
+                setattr(self, field_name, other_value)
 
     def create_related_result(self, new_wordform, **kwargs):
         """Create a new Result for new_wordform, with features copied over."""
 
-        # Note: we can’t use dataclasses.replace because it does shallow copies
-        # and we have list members.
-
         # TODO: write tests for this
 
         new_result = Result(new_wordform, **kwargs)
@@ -116,45 +213,15 @@ class Result:
         # That copy may have overwritten some features supplied in kwargs
         for k, v in kwargs.items():
             setattr(new_result, k, v)
-        new_result.__post_init__()
+        new_result._derive_features()
         return new_result
 
-    wordform: Wordform
-    lemma_wordform: Lemma = field(init=False)
-    is_lemma: bool = field(init=False)
-    wordform_length: int = field(init=False)
-
-    #: What, if any, was the matching string?
-    source_language_match: Optional[str] = None
-    query_wordform_edit_distance: Optional[float] = None
-
-    source_language_affix_match: Optional[bool] = None
-    target_language_affix_match: Optional[bool] = None
-
-    target_language_keyword_match: list[str] = field(default_factory=list)
-
-    analyzable_inflection_match: Optional[bool] = None
-
-    source_language_keyword_match: list[str] = field(default_factory=list)
-
-    is_espt_result: Optional[bool] = None
-
-    #: Was anything in the query a target-language match for this result?
-    did_match_target_language: Optional[bool] = None
-
-    morpheme_ranking: Optional[float] = None
-
-    cosine_vector_distance: Optional[float] = None
-
-    relevance_score: Optional[float] = None
-
     def features(self):
-        ret = {}
-        for field in dataclasses.fields(Result):
-            if field.name not in ["wordform", "lemma_wordform"]:
-                value = getattr(self, field.name)
-                if value is not None:
-                    ret[field.name] = value
+        ret = {"is_lemma": self.is_lemma, "wordform_length": self.wordform_length}
+        for name in self.FEATURE_NAMES:
+            value = getattr(self, name)
+            if value is not None:
+                ret[name] = value
         return ret
 
     def features_json(self):
@@ -181,7 +248,6 @@ class Result:
     #     should also be invalidated if the object is mutated. For now code
     #     that uses Result lists is responsible for calling this method
     #     explicitly when done adding results.
-    #  3. Dataclasses make doing custom caching a little trickier
     def assign_default_relevance_score(self):
         ranking.assign_relevance_score(self)
 
@@ -190,5 +256,23 @@ class Result:
         assert other.relevance_score is not None
         return self.relevance_score > other.relevance_score
 
+    def __eq__(self, other):
+        if not isinstance(other, Result):
+            return NotImplemented
+        return self.wordform == other.wordform and all(
+            getattr(self, name) == getattr(other, name) for name in self.FEATURE_NAMES
+        )
+
+    # Results are mutable, so like the dataclass this used to be, not hashable
+    __hash__ = None  # type: ignore
+
+    def __repr__(self):
+        features = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for name in self.FEATURE_NAMES
+            if getattr(self, name) not in (None, [])
+        )
+        return f"Result(wordform={self.wordform!r}, {features})"
+
     def __str__(self):
         return f"Result<wordform={self.wordform}>"
@@ -1,13 +1,16 @@
+import pytest
+
 from morphodict.lexicon.models import Wordform
 from CreeDictionary.API.search.types import Result
 
 
-def test_result_adding_cvd():
-    def make_wf(text: str = "foo"):
-        ret = Wordform(text=text, is_lemma=True)
-        ret.lemma = ret
-        return ret
+def make_wf(text: str = "foo"):
+    ret = Wordform(text=text, is_lemma=True)
+    ret.lemma = ret
+    return ret
 
+
+def test_result_adding_cvd():
     r = Result(make_wf(), query_wordform_edit_distance=1)
     assert r.cosine_vector_distance is None
 
@@ -25,3 +28,33 @@ def test_result_adding_cvd():
     r4 = Result(make_wf(), cosine_vector_distance=0.3)
     r.add_features_from(r4)
     assert r.cosine_vector_distance == 0.25
+
+
+def test_result_merges_keyword_matches_without_duplicates():
+    r = Result(make_wf(), target_language_keyword_match=["see", "look"])
+    keywords = r.target_language_keyword_match
+
+    r.add_features_from(
+        Result(make_wf(), target_language_keyword_match=["look", "watch"])
+    )
+
+    assert r.target_language_keyword_match is keywords
+    assert keywords == ["see", "look", "watch"]
+
+
+def test_result_needs_a_feature():
+    with pytest.raises(Exception, match="No features"):
+        Result(make_wf(), target_language_keyword_match=[])
+
+
+def test_result_features():
+    r = Result(make_wf("nipâw"), cosine_vector_distance=0.5, morpheme_ranking=2.0)
+
+    assert r.features() == {
+        "is_lemma": True,
+        "wordform_length": 5,
+        "target_language_keyword_match": [],
+        "source_language_keyword_match": [],
+        "morpheme_ranking": 2.0,
+        "cosine_vector_distance": 0.5,
+    }
@@ -0,0 +1,141 @@
+"""
+In-memory index of the wordform lookups done on every search
+
+The dictionary is read-only between imports, so instead of asking the database
+to find wordforms by analysis, by lemma text, or by source-language keyword on
+every query, we build maps from those to wordform IDs once per process. The
+index remembers the ImportStamp it was built from, and is rebuilt when a new
+import changes that stamp.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import defaultdict
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+from morphodict.analysis import RichAnalysis
+from morphodict.lexicon.models import ImportStamp, SourceLanguageKeyword, Wordform
+
+logger = logging.getLogger(__name__)
+
+
+def _analysis_hash(analysis: RichAnalysis) -> int:
+    """
+    A stable 64-bit hash of an analysis
+
+    Storing hashes instead of the analyses themselves keeps the index small,
+    even with every generated inflection in the database. Callers must check
+    that the wordforms they get back really do have the analysis they asked
+    for.
+    """
+    digest = hashlib.blake2b(analysis.smushed().encode("UTF-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+def _group_ids(pairs: Iterable[Tuple[str, int]]) -> dict[str, list[int]]:
+    ret: dict[str, list[int]] = defaultdict(list)
+    for text, wordform_id in pairs:
+        ret[text].append(wordform_id)
+    for ids in ret.values():
+        ids.sort()
+    return dict(ret)
+
+
+class WordformIndex:
+    """
+    Maps from analyses, lemma text and source-language keywords to wordform IDs
+    """
+
+    def __init__(self, import_timestamp: Optional[float]):
+        self.import_timestamp = import_timestamp
+
+        logger.debug("building wordform index")
+
+        hashes = []
+        ids = []
+        for wordform_id, raw_analysis in (
+            Wordform.objects.filter(raw_analysis__isnull=False)
+            .values_list("id", "raw_analysis")
+            .iterator()
+        ):
+            hashes.append(_analysis_hash(RichAnalysis(raw_analysis)))
+            ids.append(wordform_id)
+
+        # Sorted by hash, for binary search
+        hash_array = np.array(hashes, dtype=np.int64)
+        order = np.argsort(hash_array, kind="stable")
+        self._analysis_hashes = hash_array[order]
+        self._analysis_ids = np.array(ids, dtype=np.int64)[order]
+
+        self._lemma_ids_by_text = _group_ids(
+            Wordform.objects.filter(is_lemma=True).values_list("text", "id")
+        )
+        self._ids_by_source_language_keyword = _group_ids(
+            SourceLanguageKeyword.objects.values_list("text", "wordform_id")
+        )
+
+        logger.debug("done building wordform index")
+
+    def ids_for_analyses(self, analyses: Iterable[RichAnalysis]) -> list[int]:
+        """
+        IDs of wordforms that may have any of the given analyses
+
+        There may be false positives from hash collisions.
+        """
+        keys = np.array([_analysis_hash(a) for a in analyses], dtype=np.int64)
+        starts = np.searchsorted(self._analysis_hashes, keys, side="left")
+        ends = np.searchsorted(self._analysis_hashes, keys, side="right")
+        return [
+            int(wordform_id)
+            for start, end in zip(starts, ends)
+            for wordform_id in self._analysis_ids[start:end]
+        ]
+
+    def lemma_ids_for_text(self, text: str) -> list[int]:
+        return self._lemma_ids_by_text.get(text, [])
+
+    def ids_for_source_language_keyword(self, keyword: str) -> list[int]:
+        return self._ids_by_source_language_keyword.get(keyword, [])
+
+
+class _Cache:
+    """Holds the process-wide WordformIndex, rebuilding it after imports"""
+
+    def __init__(self):
+        self._index: Optional[WordformIndex] = None
+        self._lock = threading.Lock()
+
+    def current(self) -> WordformIndex:
+        """
+        Return an index that is up-to-date with the most recent import
+        """
+        return self.for_timestamp(ImportStamp.current_timestamp())
+
+    def for_timestamp(self, timestamp: Optional[float]) -> WordformIndex:
+        """
+        Like current(), but for an import timestamp that the caller already has
+        """
+        index = self._index
+        if index is not None and index.import_timestamp == timestamp:
+            return index
+
+        with self._lock:
+            # Another thread may have rebuilt the index while we were waiting
+            if self._index is None or self._index.import_timestamp != timestamp:
+                self._index = WordformIndex(timestamp)
+            return self._index
+
+    def preload(self):
+        """Build the index now instead of on the first search
+
+        To be called on production server startup.
+        """
+        self.current()
+
+
+cache = _Cache()
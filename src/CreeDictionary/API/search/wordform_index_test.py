@@ -0,0 +1,46 @@
+import pytest
+
+from CreeDictionary.API.search import wordform_index
+from morphodict.lexicon.models import ImportStamp, SourceLanguageKeyword, Wordform
+
+
+@pytest.mark.django_db
+def test_index_finds_wordforms_by_analysis():
+    index = wordform_index.cache.current()
+
+    wordforms = Wordform.objects.filter(raw_analysis__isnull=False)[:20]
+    for wf in wordforms:
+        expected = set(
+            Wordform.objects.filter(raw_analysis=wf.raw_analysis).values_list(
+                "id", flat=True
+            )
+        )
+        assert expected <= set(index.ids_for_analyses([wf.analysis]))
+
+
+@pytest.mark.django_db
+def test_index_finds_lemmas_and_keywords():
+    index = wordform_index.cache.current()
+
+    lemma = Wordform.objects.get(slug="wâpamêw")
+    assert lemma.id in index.lemma_ids_for_text("wâpamêw")
+
+    keyword = SourceLanguageKeyword.objects.first()
+    assert keyword.wordform_id in index.ids_for_source_language_keyword(keyword.text)
+
+    assert index.lemma_ids_for_text("not a real wordform") == []
+    assert index.ids_for_source_language_keyword("not a real keyword") == []
+
+
+@pytest.mark.django_db
+def test_index_is_rebuilt_after_import():
+    index = wordform_index.cache.current()
+    assert wordform_index.cache.current() is index
+
+    stamp = ImportStamp.objects.get()
+    stamp.timestamp += 1
+    stamp.save()
+
+    new_index = wordform_index.cache.current()
+    assert new_index is not index
+    assert new_index.import_timestamp == stamp.timestamp
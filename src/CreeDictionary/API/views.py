@@ -1,14 +1,40 @@
+import hashlib
+import json
+import re
+from typing import Optional
+
 from django.conf import settings
+from django.core.cache import cache
 from django.http import HttpResponse, HttpResponseBadRequest, JsonResponse, Http404
 from django.shortcuts import render
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods
 
-from .search import simple_search
+from crkeng.app.preferences import DisplayMode, AnimateEmoji
+from morphodict import morphodict_language_pair
+from morphodict.lexicon.models import ImportStamp
+from .search import page_bounds, search, simple_search_many
+from .search.query import treat_query
 
 
 def click_in_text(request) -> HttpResponse:
     """
     click-in-text api
     see SerializedSearchResult in schema.py for API specifications
+
+    Third-party sites look up the same words over and over, so responses carry
+    an ETag that only changes with the query, the display preferences, and the
+    dictionary import; conditional requests get a 304, and the JSON body itself
+    is cached.
+
+    Results come a page at a time: the optional page param counts from 1, and
+    next_page in the response is the page to ask for next, or null.
     """
 
     q = request.GET.get("q")
@@ -17,13 +43,152 @@ def click_in_text(request) -> HttpResponse:
     elif q == "":
         return HttpResponseBadRequest("query param q is an empty string")
 
-    results = simple_search(q, include_auto_definitions=False)
+    try:
+        page = int(request.GET.get("page", 1))
+    except ValueError:
+        return HttpResponseBadRequest("query param page should be a number")
+    if page < 1:
+        return HttpResponseBadRequest("query param page should be at least 1")
+
+    # mypy cannot infer this property, but it exists!
+    display_mode = DisplayMode.current_value_from_request(request)  # type: ignore
+    animate_emoji = AnimateEmoji.current_value_from_request(request)  # type: ignore
+    import_timestamp = ImportStamp.current_timestamp()
+    etag = _click_in_text_etag(q, page, display_mode, animate_emoji, import_timestamp)
+    last_modified = int(import_timestamp) if import_timestamp is not None else None
+
+    response = get_conditional_response(
+        request, etag=quote_etag(etag), last_modified=last_modified
+    )
+    if response is None:
+        cache_key = f"morphodict-click-in-text:{etag}"
+        body = cache.get(cache_key)
+        if body is None:
+            limit, offset = page_bounds(page)
+            # Like simple_search(), but also telling whether there are more pages
+            search_run = search(
+                query=q,
+                include_affixes=False,
+                include_auto_definitions=False,
+                limit=limit,
+                offset=offset,
+            )
+            results = search_run.serialized_presentation_results(
+                display_mode=display_mode, animate_emoji=animate_emoji
+            )
+            next_page = page + 1 if search_run.has_more_results() else None
+            body = JsonResponse({"results": results, "next_page": next_page}).content
+            if settings.MORPHODICT_SEARCH_CACHE_TIMEOUT:
+                cache.set(cache_key, body, settings.MORPHODICT_SEARCH_CACHE_TIMEOUT)
+        response = HttpResponse(body, content_type="application/json")
+
+    response["ETag"] = quote_etag(etag)
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    patch_cache_control(
+        response, public=True, max_age=settings.MORPHODICT_CLICK_IN_TEXT_MAX_AGE
+    )
+    # Display preferences are read from cookies
+    patch_vary_headers(response, ["Cookie"])
+    response["Access-Control-Allow-Origin"] = "*"
+    return response
+
+
+def _click_in_text_etag(
+    q: str,
+    page: int,
+    display_mode: str,
+    animate_emoji: str,
+    import_timestamp: Optional[float],
+) -> str:
+    key_parts = [
+        morphodict_language_pair(),
+        import_timestamp,
+        treat_query(q),
+        page,
+        display_mode,
+        animate_emoji,
+    ]
+    return hashlib.sha256(
+        json.dumps(key_parts, ensure_ascii=False).encode("UTF-8")
+    ).hexdigest()
+
+
+# A word, possibly with hyphens between preverbs or an apostrophe for elision
+_TOKEN_RE = re.compile(r"[\w'’-]*\w[\w'’-]*")
+
+
+@csrf_exempt
+@require_http_methods(["POST", "OPTIONS"])
+def click_in_text_bulk(request) -> HttpResponse:
+    """
+    click-in-text api for many words at once
+
+    Takes a JSON body with either "tokens", a list of words, or "text", a
+    paragraph to split into words, and returns
+    {"results": {token: [...]}, "next_page": {token: ...}} with the same
+    per-token results as the first page of click_in_text. Pages that annotate
+    every word can make one request instead of one per word; repeated words are
+    only looked up once. Further pages for a token come from click_in_text.
+    """
+    if request.method == "OPTIONS":
+        response = HttpResponse()
+        _allow_cross_origin(response)
+        return response
+
+    try:
+        body = json.loads(request.body)
+    except ValueError:
+        return HttpResponseBadRequest("request body is not valid JSON")
+    if not isinstance(body, dict):
+        return HttpResponseBadRequest("request body must be a JSON object")
+
+    if "tokens" in body:
+        tokens = body["tokens"]
+        if not isinstance(tokens, list) or not all(isinstance(t, str) for t in tokens):
+            return HttpResponseBadRequest("tokens must be a list of strings")
+        tokens = [t for t in tokens if t.strip()]
+    elif "text" in body:
+        if not isinstance(body["text"], str):
+            return HttpResponseBadRequest("text must be a string")
+        tokens = _TOKEN_RE.findall(body["text"])
+    else:
+        return HttpResponseBadRequest("one of tokens or text is required")
+
+    unique_tokens = list(dict.fromkeys(tokens))
+    if len(unique_tokens) > settings.MORPHODICT_CLICK_IN_TEXT_BULK_MAX_TOKENS:
+        return HttpResponseBadRequest(
+            f"at most {settings.MORPHODICT_CLICK_IN_TEXT_BULK_MAX_TOKENS} distinct tokens allowed"
+        )
+
+    limit, _ = page_bounds(1)
+    results = simple_search_many(
+        unique_tokens,
+        include_auto_definitions=False,
+        # mypy cannot infer this property, but it exists!
+        display_mode=DisplayMode.current_value_from_request(request),  # type: ignore
+        animate_emoji=AnimateEmoji.current_value_from_request(request),  # type: ignore
+        limit=limit,
+    )
+    response = JsonResponse(
+        {
+            "results": {
+                token: token_results for token, (token_results, _) in results.items()
+            },
+            "next_page": {
+                token: 2 if has_more else None
+                for token, (_, has_more) in results.items()
+            },
+        }
+    )
+    _allow_cross_origin(response)
+    return response
 
-    response = {"results": results}
 
-    json_response = JsonResponse(response)
-    json_response["Access-Control-Allow-Origin"] = "*"
-    return json_response
+def _allow_cross_origin(response: HttpResponse):
+    response["Access-Control-Allow-Origin"] = "*"
+    response["Access-Control-Allow-Methods"] = "POST, OPTIONS"
+    response["Access-Control-Allow-Headers"] = "Content-Type"
 
 
 def click_in_text_embedded_test(request):
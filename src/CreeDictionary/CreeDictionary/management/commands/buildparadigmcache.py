@@ -0,0 +1,44 @@
+from argparse import ArgumentParser
+
+from django.core.management.base import BaseCommand
+from tqdm import tqdm
+
+from CreeDictionary.CreeDictionary.paradigm.generation import default_paradigm_manager
+from CreeDictionary.CreeDictionary.paradigm.table_cache import fill_cache, prune_cache
+from morphodict.lexicon.models import Wordform
+
+
+class Command(BaseCommand):
+    help = """Generate the paradigm tables of every lemma ahead of time
+
+    Word detail pages then take the forms from the cache instead of running the
+    generator FST. Entries that are already up-to-date are skipped, so it is
+    cheap to re-run after an import or after changing layouts or FSTs.
+    """
+
+    def add_arguments(self, parser: ArgumentParser):
+        parser.add_argument(
+            "--no-prune",
+            dest="prune",
+            action="store_false",
+            help="""
+                Keep cache entries for old layouts and FSTs, and for lemmas that
+                no longer exist
+            """,
+        )
+
+    def handle(self, *args, prune, **options):
+        lemmas = Wordform.objects.filter(
+            is_lemma=True, paradigm__isnull=False, slug__isnull=False
+        )
+        generated, up_to_date = fill_cache(
+            default_paradigm_manager(),
+            tqdm(lemmas.iterator(), total=lemmas.count()),
+        )
+        self.stdout.write(
+            f"Generated {generated:,} paradigm tables; {up_to_date:,} were already up-to-date"
+        )
+
+        if prune:
+            deleted = prune_cache()
+            self.stdout.write(f"Deleted {deleted:,} stale paradigm tables")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import re
 from functools import cache
@@ -51,18 +52,30 @@ class ParadigmManager:
 
         :raises ParadigmDoesNotExistError: when the paradigm name cannot be found.
         """
+        layout = self.layout_for(paradigm_name, size)
+
+        if lemma is not None:
+            return self._inflect(layout, lemma)
+        else:
+            return layout.as_static_paradigm()
+
+    def layout_for(
+        self, paradigm_name: str, size: Optional[str] = None
+    ) -> ParadigmLayout:
+        """
+        Returns the layout of the given paradigm name and size, or of its default
+        size if no size is given.
+
+        :raises ParadigmDoesNotExistError: when the paradigm name or size cannot be
+            found.
+        """
         layout_sizes = self._layout_sizes_or_raise(paradigm_name)
         if size is None:
             size = self.default_size(paradigm_name)
 
         if size not in layout_sizes:
             raise ParadigmDoesNotExistError(f"size {size!r} for {paradigm_name}")
-        layout = layout_sizes[size]
-
-        if lemma is not None:
-            return self._inflect(layout, lemma)
-        else:
-            return layout.as_static_paradigm()
+        return layout_sizes[size]
 
     def sizes_of(self, paradigm_name: str) -> Collection[str]:
         """
@@ -89,6 +102,19 @@ class ParadigmManager:
 
         return analyses
 
+    def layouts_digest(self) -> str:
+        """
+        Returns a hash of all the loaded layouts, which changes whenever any
+        layout changes.
+        """
+        digest = hashlib.sha256()
+        for paradigm_name in sorted(self._name_to_layout):
+            for size, layout in sorted(self._name_to_layout[paradigm_name].items()):
+                digest.update(f"{paradigm_name}\0{size}\0".encode("UTF-8"))
+                digest.update(layout.dumps().encode("UTF-8"))
+                digest.update(b"\0")
+        return digest.hexdigest()
+
     def default_size(self, paradigm_name: str):
         sizes = list(self.sizes_of(paradigm_name))
         return sizes[0]
@@ -157,17 +183,25 @@ class ParadigmManager:
                     raise Exception(f"Unsupported {settings.MORPHODICT_TAG_STYLE=!r}")
         return ret.values()
 
-    def _inflect(self, layout: ParadigmLayout, lemma: str) -> Paradigm:
+    def inflection_forms(
+        self, layout: ParadigmLayout, lemma: str
+    ) -> dict[str, set[str]]:
         """
-        Given a layout and a lemma, produce a paradigm with forms generated by the FST.
+        Given a layout and a lemma, returns the forms generated by the FST for each
+        analysis template in the layout.
         """
         template2analysis = layout.generate_fst_analyses(lemma=lemma)
         analysis2forms = self._generator.bulk_lookup(list(template2analysis.values()))
-        template2forms = {
+        return {
             template: analysis2forms[analysis]
             for template, analysis in template2analysis.items()
         }
-        return layout.fill(template2forms)
+
+    def _inflect(self, layout: ParadigmLayout, lemma: str) -> Paradigm:
+        """
+        Given a layout and a lemma, produce a paradigm with forms generated by the FST.
+        """
+        return layout.fill(self.inflection_forms(layout, lemma))
 
 
 _BRACKET_SEPATOR_RE = re.compile(
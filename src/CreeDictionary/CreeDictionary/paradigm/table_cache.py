@@ -0,0 +1,181 @@
+"""
+Persistent cache of the forms in generated paradigm tables
+
+Filling in a paradigm table runs every cell of the layout through the generator
+FST, but the forms for a given lemma, paradigm and size only change when the
+layouts or the generator FST change. The forms are saved in the
+ParadigmTableCache table, along with a version hash of the layouts and the FST,
+and entries with a different version are regenerated.
+
+The cache is only filled by the `buildparadigmcache` management command, to run
+after an import or a change to the layouts or FSTs, so that viewing a page never
+writes to the database. Paradigms missing from the cache, or out of date, are
+generated on every view until the command is run again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Iterable, Optional
+
+from django.conf import settings
+
+import morphodict.analysis
+from CreeDictionary.CreeDictionary.paradigm.generation import default_paradigm_manager
+from CreeDictionary.CreeDictionary.paradigm.manager import ParadigmManager
+from CreeDictionary.CreeDictionary.paradigm.panes import Paradigm, ParadigmLayout
+from morphodict.lexicon.models import ParadigmTableCache, Wordform
+from morphodict.site.util import cache_unless
+
+# Bump this when changing what gets stored
+CACHE_FORMAT = 1
+
+
+@cache_unless(settings.DEBUG_PARADIGM_TABLES)
+def cache_version() -> str:
+    """
+    Hash of everything that goes into generating paradigm tables
+    """
+    digest = hashlib.sha256(f"{CACHE_FORMAT}\0".encode("UTF-8"))
+    digest.update(default_paradigm_manager().layouts_digest().encode("UTF-8"))
+    generator_path = (
+        morphodict.analysis.FST_DIR / settings.STRICT_GENERATOR_FST_FILENAME
+    )
+    with open(generator_path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def paradigm_for_lemma(
+    manager: ParadigmManager,
+    lemma: Wordform,
+    paradigm_name: str,
+    fst_lemma: Optional[str],
+    size: Optional[str] = None,
+) -> Paradigm:
+    """
+    Like manager.paradigm_for(), but takes the forms from the cache if possible
+
+    This only reads the cache; on a miss, the paradigm is generated as usual.
+
+    :raises ParadigmDoesNotExistError: when the paradigm name or size cannot be
+        found.
+    """
+    if lemma.slug is None or fst_lemma is None or settings.DEBUG_PARADIGM_TABLES:
+        return manager.paradigm_for(paradigm_name, fst_lemma, size)
+
+    if size is None:
+        size = manager.default_size(paradigm_name)
+    layout = manager.layout_for(paradigm_name, size)
+    version = cache_version()
+
+    entry = ParadigmTableCache.objects.filter(
+        lemma_slug=lemma.slug, paradigm=paradigm_name, size=size
+    ).first()
+    if entry is not None and entry.version == version and entry.fst_lemma == fst_lemma:
+        return layout.fill(entry.forms)
+
+    return layout.fill(_generate_forms(manager, layout, fst_lemma))
+
+
+def fill_cache(
+    manager: ParadigmManager, lemmas: Iterable[Wordform], *, batch_size=500
+) -> tuple[int, int]:
+    """
+    Generates and saves every size of the paradigm tables for lemmas, skipping
+    entries that are already up-to-date.
+
+    :return: the numbers of entries generated and of entries already up-to-date
+    """
+    version = cache_version()
+    existing = {
+        (slug, paradigm, size): (entry_id, entry_version, fst_lemma)
+        for (
+            entry_id,
+            slug,
+            paradigm,
+            size,
+            entry_version,
+            fst_lemma,
+        ) in ParadigmTableCache.objects.values_list(
+            "id", "lemma_slug", "paradigm", "size", "version", "fst_lemma"
+        ).iterator()
+    }
+
+    to_create: list[ParadigmTableCache] = []
+    to_update: list[ParadigmTableCache] = []
+    generated = up_to_date = 0
+
+    def flush():
+        ParadigmTableCache.objects.bulk_create(to_create)
+        ParadigmTableCache.objects.bulk_update(
+            to_update, ["fst_lemma", "version", "forms"]
+        )
+        to_create.clear()
+        to_update.clear()
+
+    for lemma in lemmas:
+        fst_lemma = _fst_lemma_for(lemma)
+        if lemma.slug is None or lemma.paradigm is None or fst_lemma is None:
+            continue
+
+        for size in manager.sizes_of(lemma.paradigm):
+            key = (lemma.slug, lemma.paradigm, size)
+            entry_id = None
+            if key in existing:
+                entry_id, entry_version, entry_fst_lemma = existing[key]
+                if entry_version == version and entry_fst_lemma == fst_lemma:
+                    up_to_date += 1
+                    continue
+
+            entry = ParadigmTableCache(
+                id=entry_id,
+                lemma_slug=lemma.slug,
+                paradigm=lemma.paradigm,
+                size=size,
+                fst_lemma=fst_lemma,
+                version=version,
+                forms=_generate_forms(
+                    manager, manager.layout_for(lemma.paradigm, size), fst_lemma
+                ),
+            )
+            (to_create if entry_id is None else to_update).append(entry)
+            generated += 1
+
+            if len(to_create) + len(to_update) >= batch_size:
+                flush()
+    flush()
+
+    return generated, up_to_date
+
+
+def prune_cache() -> int:
+    """
+    Deletes entries generated from other layouts or FSTs, or for lemmas that no
+    longer exist.
+
+    :return: how many entries were deleted
+    """
+    stale = ParadigmTableCache.objects.exclude(version=cache_version())
+    orphaned = ParadigmTableCache.objects.exclude(
+        lemma_slug__in=Wordform.objects.filter(slug__isnull=False).values("slug")
+    )
+    deleted, _ = stale.delete()
+    deleted_orphans, _ = orphaned.delete()
+    return deleted + deleted_orphans
+
+
+def _fst_lemma_for(lemma: Wordform) -> Optional[str]:
+    if settings.MORPHODICT_ENABLE_FST_LEMMA_SUPPORT:
+        return lemma.fst_lemma
+    return lemma.text
+
+
+def _generate_forms(
+    manager: ParadigmManager, layout: ParadigmLayout, fst_lemma: str
+) -> dict[str, list[str]]:
+    return {
+        template: sorted(forms)
+        for template, forms in manager.inflection_forms(layout, fst_lemma).items()
+    }
@@ -38,6 +38,28 @@ def test_multiple_sizes(paradigm_manager: ParadigmManager):
     assert set(paradigm_manager.sizes_of("has-multiple-sizes")) == expected_sizes
 
 
+def test_inflection_forms(paradigm_manager: ParadigmManager):
+    layout = paradigm_manager.layout_for("has-only-one-size")
+    forms = paradigm_manager.inflection_forms(layout, "everything bagel")
+
+    assert {"everything bagel"} in forms.values()
+    assert set(forms.keys()) == set(layout.generate_fst_analyses("${lemma}").keys())
+
+
+def test_layouts_digest_changes_with_layouts(
+    coffee_layout_dir: Path, identity_transducer, tmp_path: Path
+):
+    manager = ParadigmManager(coffee_layout_dir, identity_transducer)
+    same_manager = ParadigmManager(coffee_layout_dir, identity_transducer)
+    assert manager.layouts_digest() == same_manager.layouts_digest()
+
+    (tmp_path / "has-only-one-size.tsv").write_text(
+        (coffee_layout_dir / "has-only-one-size.tsv").read_text()
+    )
+    fewer_layouts = ParadigmManager(tmp_path, identity_transducer)
+    assert fewer_layouts.layouts_digest() != manager.layouts_digest()
+
+
 def test_sizes_are_sorted(coffee_layout_dir: Path, identity_transducer):
     paradigm_name = "has-multiple-sizes"
     expected_sizes = ["tall", "grande", "venti"]
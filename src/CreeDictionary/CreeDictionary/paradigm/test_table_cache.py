@@ -0,0 +1,98 @@
+from typing import Iterable
+
+import pytest
+
+from CreeDictionary.CreeDictionary.paradigm import table_cache
+from CreeDictionary.CreeDictionary.paradigm.manager import ParadigmManager
+from CreeDictionary.CreeDictionary.paradigm.test_manager import (
+    IdentityTransducer,
+    coffee_layout_dir,
+    testdata,
+)
+from morphodict.lexicon.models import ParadigmTableCache, Wordform
+
+
+class CountingTransducer(IdentityTransducer):
+    def __init__(self):
+        self.num_lookups = 0
+
+    def bulk_lookup(self, analyses: Iterable[str]) -> dict[str, set[str]]:
+        self.num_lookups += 1
+        return super().bulk_lookup(analyses)
+
+
+@pytest.fixture
+def transducer():
+    return CountingTransducer()
+
+
+@pytest.fixture
+def manager(coffee_layout_dir, transducer):
+    return ParadigmManager(coffee_layout_dir, transducer)
+
+
+@pytest.fixture(autouse=True)
+def fixed_cache_version(monkeypatch):
+    monkeypatch.setattr(table_cache, "cache_version", lambda: "version-1")
+
+
+@pytest.fixture
+def lemma():
+    return Wordform(text="latte", slug="latte", paradigm="has-multiple-sizes")
+
+
+@pytest.mark.django_db
+def test_paradigm_comes_from_filled_cache(manager, transducer, lemma):
+    table_cache.fill_cache(manager, [lemma])
+    lookups_to_fill = transducer.num_lookups
+
+    paradigm = table_cache.paradigm_for_lemma(
+        manager, lemma, "has-multiple-sizes", "latte", "grande"
+    )
+
+    assert transducer.num_lookups == lookups_to_fill
+    assert list(paradigm.panes) == list(
+        manager.paradigm_for("has-multiple-sizes", "latte", "grande").panes
+    )
+
+
+@pytest.mark.django_db
+def test_cache_miss_is_generated_without_saving(manager, transducer, lemma):
+    paradigm = table_cache.paradigm_for_lemma(
+        manager, lemma, "has-multiple-sizes", "latte", "grande"
+    )
+
+    assert transducer.num_lookups == 1
+    assert not ParadigmTableCache.objects.exists()
+    assert list(paradigm.panes) == list(
+        manager.paradigm_for("has-multiple-sizes", "latte", "grande").panes
+    )
+
+
+@pytest.mark.django_db
+def test_stale_entry_is_not_used(manager, transducer, lemma, monkeypatch):
+    table_cache.fill_cache(manager, [lemma])
+    monkeypatch.setattr(table_cache, "cache_version", lambda: "version-2")
+    lookups_to_fill = transducer.num_lookups
+
+    table_cache.paradigm_for_lemma(
+        manager, lemma, "has-multiple-sizes", "latte", "grande"
+    )
+
+    assert transducer.num_lookups == lookups_to_fill + 1
+    entry = ParadigmTableCache.objects.get(lemma_slug="latte", size="grande")
+    assert entry.version == "version-1"
+
+
+@pytest.mark.django_db
+def test_fill_cache(manager, transducer, lemma):
+    generated, up_to_date = table_cache.fill_cache(manager, [lemma])
+    assert (generated, up_to_date) == (3, 0)
+
+    generated, up_to_date = table_cache.fill_cache(manager, [lemma])
+    assert (generated, up_to_date) == (0, 3)
+
+    table_cache.paradigm_for_lemma(
+        manager, lemma, "has-multiple-sizes", "latte", "venti"
+    )
+    assert transducer.num_lookups == 3
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import csv
 from enum import IntEnum
+from functools import lru_cache
 from threading import Lock
 from typing import Iterable, Optional, TextIO, Tuple, TypedDict
 
@@ -27,6 +28,11 @@ def _find_altlabel_file():
 
 ALTERNATE_LABELS_FILE = _find_altlabel_file()
 
+# How many distinct tag sequences each relabeller remembers the chunks and labels
+# of. Every paradigm cell and search result asks for a few, and there are only a
+# few thousand distinct ones in all the paradigms.
+_MEMO_SIZE = 8192
+
 
 class _LabelFriendliness(IntEnum):
     """
@@ -61,14 +67,17 @@ class Relabelling:
 
     def __init__(self, data: _DataStructure) -> None:
         self._data = data
+        trie = _TagTrie.from_data(data)
 
         self.linguistic_short = _RelabelFetcher(
-            data, _LabelFriendliness.LINGUISTIC_SHORT
+            data, trie, _LabelFriendliness.LINGUISTIC_SHORT
+        )
+        self.linguistic_long = _RelabelFetcher(
+            data, trie, _LabelFriendliness.LINGUISTIC_LONG
         )
-        self.linguistic_long = _RelabelFetcher(data, _LabelFriendliness.LINGUISTIC_LONG)
-        self.english = _RelabelFetcher(data, _LabelFriendliness.ENGLISH)
-        self.cree = _RelabelFetcher(data, _LabelFriendliness.NEHIYAWEWIN)
-        self.emoji = _RelabelFetcher(data, _LabelFriendliness.EMOJI)
+        self.english = _RelabelFetcher(data, trie, _LabelFriendliness.ENGLISH)
+        self.cree = _RelabelFetcher(data, trie, _LabelFriendliness.NEHIYAWEWIN)
+        self.emoji = _RelabelFetcher(data, trie, _LabelFriendliness.EMOJI)
 
     def __contains__(self, key: object) -> bool:
         if isinstance(key, str):
@@ -101,6 +110,48 @@ class Relabelling:
         return cls(res)
 
 
+class _TagTrie:
+    """
+    The tag sets of a relabelling, one tag per level, so that the longest tag set
+    starting a sequence of tags is found in one pass over the tags.
+    """
+
+    __slots__ = ("entry", "children")
+
+    def __init__(self):
+        # The labels for the tags leading to this node, if they are a tag set
+        self.entry: Optional[dict[_LabelFriendliness, Optional[Label]]] = None
+        self.children: dict[FSTTag, _TagTrie] = {}
+
+    @classmethod
+    def from_data(cls, data: Relabelling._DataStructure) -> _TagTrie:
+        root = cls()
+        for tag_set, entry in data.items():
+            node = root
+            for tag in tag_set:
+                node = node.children.setdefault(tag, cls())
+            node.entry = entry
+        return root
+
+    def longest_prefix(
+        self, tags: tuple[FSTTag, ...]
+    ) -> tuple[int, Optional[dict[_LabelFriendliness, Optional[Label]]]]:
+        """
+        Returns the length of the longest tag set that tags start with, and its
+        labels, or (0, None) if there is none.
+        """
+        length, entry = 0, None
+        node = self
+        for i, tag in enumerate(tags, start=1):
+            child = node.children.get(tag)
+            if child is None:
+                break
+            node = child
+            if node.entry is not None:
+                length, entry = i, node.entry
+        return length, entry
+
+
 class _RelabelFetcher:
     """
     Makes accessing relabellings for a particular label friendliness easier.
@@ -109,11 +160,20 @@ class _RelabelFetcher:
     def __init__(
         self,
         data: Relabelling._DataStructure,
+        trie: _TagTrie,
         label: _LabelFriendliness,
     ):
         self._data = data
+        self._trie = trie
         self._friendliness = label
 
+        # Memoized per instance, so a re-read relabelling starts afresh
+        self._get_longest_memo = lru_cache(maxsize=_MEMO_SIZE)(self._find_longest)
+        self._chunks_memo = lru_cache(maxsize=_MEMO_SIZE)(self._find_chunks)
+        self._full_relabelling_memo = lru_cache(maxsize=_MEMO_SIZE)(
+            self._find_full_relabelling
+        )
+
     def __getitem__(self, key: FSTTag) -> Optional[Label]:
         return self._data[(key,)][self._friendliness]
 
@@ -123,6 +183,14 @@ class _RelabelFetcher:
         """
         return self._data.get((key,), {}).get(self._friendliness, default)
 
+    def items(self) -> Iterable[tuple[FSTTag, Label]]:
+        """
+        (tag, relabelling) for every single FST tag that has a relabelling
+        """
+        for tags, labels in self._data.items():
+            if len(tags) == 1 and (label := labels[self._friendliness]) is not None:
+                yield tags[0], label
+
     def get_longest(self, tags: Iterable[FSTTag]) -> Optional[Label]:
         """
         Get a relabelling for the longest prefix of the given tags.
@@ -134,24 +202,49 @@ class _RelabelFetcher:
         """
         Chunk FST Labels that match relabellings and yield the tags.
         """
-        tag_set = tuple(tags)
+        return iter(self._chunks_memo(tuple(tags)))
+
+    def get_full_relabelling(self, tags: Iterable[FSTTag]) -> list[Label]:
+        """
+        Relabels all tags, trying to match prefixes
+        """
+        return list(self._full_relabelling_memo(tuple(tags)))
+
+    def _get_longest(
+        self, tags: Iterable[FSTTag]
+    ) -> tuple[tuple[FSTTag, ...], Optional[Label]]:
+        """
+        Returns the unmatched tags, and the relabelling of the matched tags from the
+        prefix.
+
+        Returns a tuple of all tags if no prefix matched.
+        """
+        return self._get_longest_memo(tuple(tags))
+
+    def _find_longest(
+        self, tags: tuple[FSTTag, ...]
+    ) -> tuple[tuple[FSTTag, ...], Optional[Label]]:
+        length, entry = self._trie.longest_prefix(tags)
+        if entry is None:
+            return tags, None
+        return tags[length:], entry[self._friendliness]
+
+    def _find_chunks(
+        self, tag_set: tuple[FSTTag, ...]
+    ) -> tuple[tuple[FSTTag, ...], ...]:
+        chunks = []
         while tag_set:
-            unmatched, _ = self._get_longest(tag_set)
-            prefix_length = len(tag_set) - len(unmatched)
+            prefix_length, _ = self._trie.longest_prefix(tag_set)
             if prefix_length == 0:
                 # There was no relabelling found, but we can just return the first tag.
                 prefix_length = 1
 
-            yield tag_set[:prefix_length]
+            chunks.append(tag_set[:prefix_length])
             tag_set = tag_set[prefix_length:]
+        return tuple(chunks)
 
-    def get_full_relabelling(self, tags: Iterable[FSTTag]) -> list[Label]:
-        """
-        Relabels all tags, trying to match prefixes
-        """
-
+    def _find_full_relabelling(self, tag_set: tuple[FSTTag, ...]) -> tuple[Label, ...]:
         labels = []
-        tag_set = tuple(tags)
         while tag_set:
             unmatched, maybe_label = self._get_longest(tag_set)
             if maybe_label is None:
@@ -164,31 +257,7 @@ class _RelabelFetcher:
                 label = maybe_label
                 tag_set = unmatched
             labels.append(label)
-
-        return labels
-
-    def _get_longest(
-        self, tags: Iterable[FSTTag]
-    ) -> tuple[tuple[FSTTag, ...], Optional[Label]]:
-        """
-        Returns the unmatched tags, and the relabelling of the matched tags from the
-        prefix.
-
-        Returns a tuple of all tags if no prefix matched.
-        """
-
-        # TODO: better algorithm than this. Probably a trie
-        try_tags = tuple(tags)
-        end = len(try_tags)
-        while end > 0:
-            try:
-                entry = self._data[try_tags[:end]]
-            except KeyError:
-                end -= 1
-            else:
-                return try_tags[end:], entry[self._friendliness]
-
-        return try_tags, None
+        return tuple(labels)
 
 
 def _label_from_column_or_none(column_no: _LabelFriendliness, row) -> Optional[Label]:
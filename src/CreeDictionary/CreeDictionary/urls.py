@@ -56,6 +56,11 @@ urlpatterns = [
         api_views.click_in_text,
         name="cree-dictionary-word-click-in-text-api",
     ),
+    path(
+        "click-in-text/bulk/",
+        api_views.click_in_text_bulk,
+        name="cree-dictionary-word-click-in-text-bulk-api",
+    ),
     path(
         "click-in-text-embedded-test/",
         api_views.click_in_text_embedded_test,
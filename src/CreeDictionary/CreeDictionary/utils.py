@@ -10,16 +10,19 @@ from urllib.parse import ParseResult, urlencode, urlunparse
 from django.urls import reverse
 
 
-def url_for_query(user_query: str) -> str:
+def url_for_query(user_query: str, page: int = 1) -> str:
     """
     Produces a relative URL to search for the given user query.
     """
+    query = [("q", user_query)]
+    if page != 1:
+        query.append(("page", str(page)))
     parts = ParseResult(
         scheme="",
         netloc="",
         params="",
         path=reverse("cree-dictionary-search"),
-        query=urlencode((("q", user_query),)),
+        query=urlencode(query),
         fragment="",
     )
     return urlunparse(parts)
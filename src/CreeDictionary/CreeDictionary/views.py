@@ -11,7 +11,7 @@ from django.shortcuts import redirect, render
 from django.views.decorators.http import require_GET
 
 import morphodict.analysis
-from CreeDictionary.API.search import presentation, search_with_affixes
+from CreeDictionary.API.search import page_bounds, presentation, search_with_affixes
 from CreeDictionary.CreeDictionary.forms import WordSearchForm
 from CreeDictionary.CreeDictionary.paradigm.generation import default_paradigm_manager
 from CreeDictionary.phrase_translate.translate import (
@@ -24,6 +24,7 @@ from morphodict.lexicon.models import Wordform
 
 from .paradigm.manager import ParadigmDoesNotExistError
 from .paradigm.panes import Paradigm
+from .paradigm.table_cache import paradigm_for_lemma
 from .utils import url_for_query
 
 # The index template expects to be rendered in the following "modes";
@@ -100,11 +101,15 @@ def index(request):  # pragma: no cover
 
     user_query = request.GET.get("q", None)
     search_run = None
+    page = page_from_request(request)
 
     if user_query:
+        limit, offset = page_bounds(page)
         search_run = search_with_affixes(
             user_query,
             include_auto_definitions=should_include_auto_definitions(request),
+            limit=limit,
+            offset=offset,
         )
         search_results = search_run.serialized_presentation_results(
             display_mode=DisplayMode.current_value_from_request(request),
@@ -127,6 +132,8 @@ def index(request):  # pragma: no cover
         query_string=user_query,
         search_results=search_results,
         did_search=did_search,
+        page=page,
+        next_page=page + 1 if search_run and search_run.has_more_results() else None,
     )
     if search_run and search_run.verbose_messages and search_run.query.verbose:
         context["verbose_messages"] = json.dumps(
@@ -139,9 +146,15 @@ def search_results(request, query_string: str):  # pragma: no cover
     """
     returns rendered boxes of search results according to user query
     """
-    results = search_with_affixes(
-        query_string, include_auto_definitions=should_include_auto_definitions(request)
-    ).serialized_presentation_results(
+    page = page_from_request(request)
+    limit, offset = page_bounds(page)
+    search_run = search_with_affixes(
+        query_string,
+        include_auto_definitions=should_include_auto_definitions(request),
+        limit=limit,
+        offset=offset,
+    )
+    results = search_run.serialized_presentation_results(
         # mypy cannot infer this property, but it exists!
         display_mode=DisplayMode.current_value_from_request(request),  # type: ignore
         animate_emoji=AnimateEmoji.current_value_from_request(request),  # type: ignore
@@ -149,7 +162,12 @@ def search_results(request, query_string: str):  # pragma: no cover
     return render(
         request,
         "CreeDictionary/search-results.html",
-        {"query_string": query_string, "search_results": results},
+        {
+            "query_string": query_string,
+            "search_results": results,
+            "page": page,
+            "next_page": page + 1 if search_run.has_more_results() else None,
+        },
     )
 
 
@@ -336,6 +354,18 @@ def should_include_auto_definitions(request):
     return request.user.is_authenticated
 
 
+def page_from_request(request) -> int:
+    """
+    The page of search results asked for, counting from 1; anything that is
+    not a page number gets the first page.
+    """
+    try:
+        page = int(request.GET.get("page", 1))
+    except ValueError:
+        return 1
+    return max(page, 1)
+
+
 def paradigm_for(wordform: Wordform, paradigm_size: str) -> Optional[Paradigm]:
     """
     Returns a paradigm for the given wordform at the desired size.
@@ -351,7 +381,9 @@ def paradigm_for(wordform: Wordform, paradigm_size: str) -> Optional[Paradigm]:
         if settings.MORPHODICT_ENABLE_FST_LEMMA_SUPPORT:
             fst_lemma = wordform.lemma.fst_lemma
 
-        if paradigm := manager.paradigm_for(name, fst_lemma, paradigm_size):
+        if paradigm := paradigm_for_lemma(
+            manager, wordform.lemma, name, fst_lemma, paradigm_size
+        ):
             return paradigm
         logger.warning(
             "Could not retrieve static paradigm %r " "associated with wordform %r",
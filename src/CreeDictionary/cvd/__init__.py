@@ -2,10 +2,14 @@ import logging
 import re
 from functools import cache
 from os import fspath
+from pathlib import Path
+from typing import Optional
 
 from django.conf import settings
 from gensim.models import KeyedVectors
 
+from CreeDictionary.cvd.ivf_index import IVFIndex
+from CreeDictionary.cvd.quantized import QuantizedVectors
 from morphodict.lexicon import MORPHODICT_LEXICON_RESOURCE_DIR
 
 logger = logging.getLogger(__name__)
@@ -28,6 +32,24 @@ def _load_vectors(path):
 
 @cache
 def google_news_vectors():
+    """The news vectors that query words are looked up in
+
+    When settings.MORPHODICT_CVD_TRIMMED_NEWS_VECTORS is on, these are the
+    much smaller trimmed news vectors from `manage.py trimnewsvectors`.
+    """
+    if settings.MORPHODICT_CVD_TRIMMED_NEWS_VECTORS:
+        path = trimmed_news_vectors_path()
+        try:
+            return _load_vectors(path)
+        except FileNotFoundError:
+            logger.warning(
+                f"No trimmed news vectors at {path}, falling back to full news vectors. Run `manage.py trimnewsvectors`."
+            )
+    return full_google_news_vectors()
+
+
+@cache
+def full_google_news_vectors():
     return _load_vectors(shared_vector_model_dir / "news_vectors.kv")
 
 
@@ -45,6 +67,23 @@ def definition_vectors_path():
     return language_specific_vector_model_dir / filename
 
 
+def trimmed_news_vectors_path():
+    filename = "news_vectors_trimmed.kv"
+    if settings.USE_TEST_DB:
+        filename = f"test_db_{filename}"
+    return language_specific_vector_model_dir / filename
+
+
+def definition_index_path(vectors_path: Path) -> Path:
+    """Where the approximate search index for the vectors in vectors_path goes"""
+    return vectors_path.with_suffix(".ivf.npz")
+
+
+def definition_quantized_path(vectors_path: Path) -> Path:
+    """Where the quantized copy of the vectors in vectors_path goes"""
+    return vectors_path.with_suffix(".quantized.npy")
+
+
 @cache
 def definition_vectors():
     try:
@@ -54,16 +93,86 @@ def definition_vectors():
         raise DefinitionVectorsNotFoundException
 
 
+@cache
+def definition_vector_index() -> Optional[IVFIndex]:
+    """The approximate search index for definition_vectors(), if there is one"""
+    path = definition_index_path(definition_vectors_path())
+    try:
+        index = IVFIndex.load(path)
+    except FileNotFoundError:
+        logger.warning(
+            f"No definition vector index at {path}, falling back to exact search. Run `manage.py builddefinitionvectors --ann-index`."
+        )
+        return None
+    if len(index) != len(definition_vectors()):
+        logger.warning(
+            f"Definition vector index at {path} does not match the definition vectors, falling back to exact search. Run `manage.py builddefinitionvectors --ann-index`."
+        )
+        return None
+    return index
+
+
+@cache
+def definition_vectors_quantized() -> Optional[QuantizedVectors]:
+    """The quantized copy of definition_vectors(), if there is one"""
+    path = definition_quantized_path(definition_vectors_path())
+    try:
+        quantized = QuantizedVectors.load(path)
+    except FileNotFoundError:
+        logger.warning(
+            f"No quantized definition vectors at {path}, falling back to full vectors. Run `manage.py builddefinitionvectors --quantize`."
+        )
+        return None
+    if len(quantized) != len(definition_vectors()):
+        logger.warning(
+            f"Quantized definition vectors at {path} do not match the definition vectors, falling back to full vectors. Run `manage.py builddefinitionvectors --quantize`."
+        )
+        return None
+    return quantized
+
+
+def similar_definitions(query_vector, topn: int) -> list[tuple[str, float]]:
+    """Return (cvd key, similarity) for the topn closest definition vectors
+
+    When settings.MORPHODICT_CVD_APPROXIMATE_SEARCH is on, only definitions in
+    the closest clusters of the definition vector index are compared.
+    Otherwise, when settings.MORPHODICT_CVD_QUANTIZED_VECTORS is set, every
+    definition is compared using the quantized copy of the vectors.
+    """
+    vectors = definition_vectors()
+    if settings.MORPHODICT_CVD_APPROXIMATE_SEARCH:
+        if (index := definition_vector_index()) is not None:
+            return [
+                (vectors.index_to_key[i], similarity)
+                for i, similarity in index.search(
+                    query_vector,
+                    topn,
+                    n_probe=settings.MORPHODICT_CVD_APPROXIMATE_SEARCH_PROBES,
+                )
+            ]
+    if settings.MORPHODICT_CVD_QUANTIZED_VECTORS:
+        if (quantized := definition_vectors_quantized()) is not None:
+            return [
+                (vectors.index_to_key[i], similarity)
+                for i, similarity in quantized.search(query_vector, topn)
+            ]
+    return vectors.similar_by_vector(query_vector, topn)
+
+
 def preload_models():
     try:
         definition_vectors()
+        if settings.MORPHODICT_CVD_APPROXIMATE_SEARCH:
+            definition_vector_index()
+        if settings.MORPHODICT_CVD_QUANTIZED_VECTORS:
+            definition_vectors_quantized()
     except DefinitionVectorsNotFoundException:
         logger.exception("")
 
-    # doing a similarity search compares against every other vector, so by doing
-    # similar_by_key for any key at all, we preload the entire vector model into
-    # memory.
-    google_news_vectors().similar_by_key("hello")
+    # computing the norms reads every vector, so this preloads the entire
+    # vector model into memory. (A key like "hello" might not be in the trimmed
+    # news vectors.)
+    google_news_vectors().fill_norms()
 
 
 # Implementation from https://stackoverflow.com/a/48027864/14558 which cites
@@ -1,9 +1,17 @@
 import random
+from os import fspath
 
+import numpy as np
 import pytest
+from django.core.management import call_command
+from gensim.models import KeyedVectors
 
 from morphodict.lexicon.models import Wordform, Definition
 from CreeDictionary.cvd import extract_keyed_words
+from CreeDictionary.cvd.management.commands import (
+    builddefinitionvectors,
+    trimnewsvectors,
+)
 from CreeDictionary.cvd.definition_keys import (
     definition_to_cvd_key,
     cvd_key_to_wordform_query,
@@ -66,3 +74,96 @@ def test_definition_keys(slug, expect_null_analysis, db):
         wordforms = Wordform.objects.filter(**kwargs)
         assert wordforms.count() == 1
         assert wordforms.get() == d.wordform
+
+
+@pytest.fixture
+def fake_news_vectors(monkeypatch):
+    """Small random news vectors, in place of the real ones"""
+    words = {
+        word
+        for d in Definition.objects.filter(auto_translation_source__isnull=True)
+        for word in d.semantic_definition.lower().split()
+    }
+    rng = np.random.default_rng(seed=1)
+    news_vectors = KeyedVectors(vector_size=4)
+    news_vectors.add_vectors(
+        sorted(words), rng.random((len(words), 4), dtype=np.float32)
+    )
+    monkeypatch.setattr(
+        builddefinitionvectors, "full_google_news_vectors", lambda: news_vectors
+    )
+    return news_vectors
+
+
+def build_definition_vectors(output_file, **kwargs):
+    call_command("builddefinitionvectors", output_file=output_file, **kwargs)
+    return KeyedVectors.load(fspath(output_file))
+
+
+def test_incremental_definition_vectors(db, tmp_path, fake_news_vectors):
+    output_file = tmp_path / "definitions.kv"
+    full = build_definition_vectors(output_file)
+    assert len(full) > 0
+
+    removed = Definition.objects.filter(auto_translation_source__isnull=True).first()
+    removed_key = definition_to_cvd_key(removed)
+    removed.delete()
+    # Make sure the reused vectors really come from the previous file
+    stale_key = next(key for key in full.index_to_key if key != removed_key)
+    full.vectors[full.get_index(stale_key)] = 0
+    full.save(fspath(output_file), separately=["vectors"])
+
+    incremental = build_definition_vectors(output_file, incremental=True)
+
+    assert removed_key not in incremental
+    assert set(incremental.index_to_key) == set(full.index_to_key) - {removed_key}
+    for key in incremental.index_to_key:
+        assert (incremental[key] == full[key]).all()
+    assert not incremental[stale_key].any()
+    assert not any(path.name.endswith(".tmp") for path in tmp_path.iterdir())
+
+
+def test_sum_rows(monkeypatch):
+    monkeypatch.setattr(builddefinitionvectors, "BATCH_SIZE", 2)
+    vectors = np.arange(12, dtype=np.float32).reshape(6, 2)
+    word_lists = [[0], [1, 2], [5, 3, 4], [2]]
+    rows = [3, 0, 2, 1]
+
+    out = np.zeros((4, 2), dtype=np.float32)
+    builddefinitionvectors.sum_rows(
+        vectors,
+        np.array([i for words in word_lists for i in words]),
+        np.array([0, 1, 3, 6]),
+        out,
+        rows,
+    )
+
+    for row, words in zip(rows, word_lists):
+        assert (out[row] == vectors[words].sum(axis=0)).all()
+
+
+def test_trim_news_vectors(db, tmp_path, fake_news_vectors, monkeypatch):
+    news_vectors = KeyedVectors(vector_size=4)
+    frequent_words = ["The", "the", "of", "and", "zebra"]
+    news_vectors.add_vectors(
+        frequent_words + fake_news_vectors.index_to_key,
+        np.concatenate(
+            [np.ones((len(frequent_words), 4)), fake_news_vectors.vectors]
+        ).astype(np.float32),
+    )
+    monkeypatch.setattr(
+        trimnewsvectors, "full_google_news_vectors", lambda: news_vectors
+    )
+    output_file = tmp_path / "trimmed.kv"
+
+    call_command("trimnewsvectors", output_file=output_file, top_words=3)
+
+    trimmed = KeyedVectors.load(fspath(output_file))
+    definition_words = {
+        word
+        for d in Definition.objects.all()
+        for word in extract_keyed_words(d.semantic_definition, news_vectors)
+    }
+    assert set(trimmed.index_to_key) == {"the", "of", "and"} | definition_words
+    for key in trimmed.index_to_key:
+        assert (trimmed[key] == news_vectors[key]).all()
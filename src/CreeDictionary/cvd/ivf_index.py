@@ -0,0 +1,232 @@
+"""
+An approximate nearest-neighbour index for definition vectors
+
+Exact CVD search compares the query vector with every definition vector. An
+inverted-file (IVF) index instead clusters the definition vectors ahead of
+time, and a search only compares the query with the vectors in the few
+clusters whose centres are closest to it. That can miss a result whose
+cluster was not searched, so `benchmarkcvdindex` measures how many of the
+exact results approximate search finds.
+
+The index keeps its own copy of the vectors, scaled to unit length and sorted
+by cluster, so that each cluster searched is a single matrix product over a
+contiguous slice. That copy is saved in a separate `.npy` file which is
+memory-mapped, so only the clusters that get searched are read from disk.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from morphodict.site.util import save_atomically
+
+# Bump this when changing what gets saved
+INDEX_FORMAT = 1
+
+# How many vectors to work on at a time while building
+_BATCH_SIZE = 8192
+
+
+class IVFIndex:
+    def __init__(
+        self,
+        centroids: np.ndarray,
+        order: np.ndarray,
+        offsets: np.ndarray,
+        vectors: np.ndarray,
+    ):
+        """
+        :param centroids: the unit-length centre of each cluster
+        :param order: indices of the original vectors, sorted by cluster
+        :param offsets: cluster i is order[offsets[i]:offsets[i + 1]]
+        :param vectors: the original vectors, scaled to unit length, in the
+            same order as `order`
+        """
+        self.centroids = centroids
+        self.order = order
+        self.offsets = offsets
+        self.vectors = vectors
+
+    def __len__(self):
+        """The number of vectors that were indexed"""
+        return len(self.order)
+
+    @property
+    def n_lists(self):
+        return len(self.centroids)
+
+    @classmethod
+    def build(
+        cls,
+        vectors: np.ndarray,
+        n_lists: Optional[int] = None,
+        iterations: int = 10,
+        seed: int = 0,
+    ) -> IVFIndex:
+        """
+        Cluster vectors by direction with spherical k-means
+
+        n_lists defaults to the square root of the number of vectors, which
+        keeps the work of comparing with the centroids and with the vectors
+        in the searched clusters about equal.
+        """
+        if len(vectors) == 0:
+            return cls(
+                np.zeros((0, vectors.shape[1]), dtype=np.float32),
+                np.zeros(0, dtype=np.int64),
+                np.zeros(1, dtype=np.int64),
+                np.zeros((0, vectors.shape[1]), dtype=np.float32),
+            )
+
+        norms = np.linalg.norm(vectors, axis=1)
+
+        if n_lists is None:
+            n_lists = int(np.sqrt(len(vectors)))
+        n_lists = max(1, min(n_lists, len(vectors)))
+
+        rng = np.random.default_rng(seed)
+        centroids = _unit(vectors[rng.choice(len(vectors), n_lists, replace=False)])
+        for _ in range(iterations):
+            assignments = _assign(vectors, norms, centroids)
+            sums = np.zeros_like(centroids)
+            for start in range(0, len(vectors), _BATCH_SIZE):
+                stop = start + _BATCH_SIZE
+                np.add.at(
+                    sums,
+                    assignments[start:stop],
+                    _unit(vectors[start:stop], norms[start:stop]),
+                )
+            # A cluster that ended up empty keeps its old centre
+            non_empty = np.any(sums != 0, axis=1)
+            centroids[non_empty] = _unit(sums[non_empty])
+
+        assignments = _assign(vectors, norms, centroids)
+        order = np.argsort(assignments, kind="stable")
+        offsets = np.searchsorted(
+            assignments[order], np.arange(n_lists + 1), side="left"
+        )
+
+        sorted_vectors = np.empty(vectors.shape, dtype=np.float32)
+        for start in range(0, len(order), _BATCH_SIZE):
+            batch = order[start : start + _BATCH_SIZE]
+            sorted_vectors[start : start + len(batch)] = _unit(
+                vectors[batch], norms[batch]
+            )
+
+        return cls(centroids, order, offsets, sorted_vectors)
+
+    def search(
+        self, query: np.ndarray, topn: int, n_probe: int
+    ) -> list[tuple[int, float]]:
+        """
+        Find the vectors with the highest cosine similarity to query, among
+        those in the n_probe clusters closest to it
+
+        :return: up to topn (index of original vector, similarity) pairs,
+            most similar first
+        """
+        query = _unit(np.asarray(query, dtype=np.float32))
+
+        n_probe = min(n_probe, self.n_lists)
+        if n_probe <= 0 or topn <= 0:
+            return []
+        probes = np.argpartition(-(self.centroids @ query), n_probe - 1)[:n_probe]
+        # Searching the clusters in order reads the memory-mapped vectors
+        # front to back
+        probes.sort()
+
+        positions = np.concatenate(
+            [np.arange(self.offsets[c], self.offsets[c + 1]) for c in probes]
+        )
+        similarities = np.concatenate(
+            [
+                self.vectors[self.offsets[c] : self.offsets[c + 1]] @ query
+                for c in probes
+            ]
+        )
+
+        if len(positions) > topn:
+            best = np.argpartition(-similarities, topn - 1)[:topn]
+        else:
+            best = np.arange(len(positions))
+        best = best[np.argsort(-similarities[best], kind="stable")]
+        return [(int(self.order[positions[i]]), float(similarities[i])) for i in best]
+
+    def save(self, path: Path):
+        """Save to path, and the vectors to vectors_path(path)
+
+        Existing files are only replaced once the new ones are complete.
+        """
+
+        def write_index(temp_path: Path):
+            with open(temp_path, "wb") as f:
+                np.savez(
+                    f,
+                    format=np.array(INDEX_FORMAT),
+                    centroids=self.centroids,
+                    order=self.order,
+                    offsets=self.offsets,
+                )
+
+        save_atomically(
+            vectors_path(path), lambda temp_path: _save_array(temp_path, self.vectors)
+        )
+        save_atomically(path, write_index)
+
+    @classmethod
+    def load(cls, path: Path) -> IVFIndex:
+        with np.load(path) as data:
+            if int(data["format"]) != INDEX_FORMAT:
+                raise ValueError(
+                    f"{path} has index format {int(data['format'])}, expected {INDEX_FORMAT}; re-run builddefinitionvectors"
+                )
+            index = cls(
+                data["centroids"],
+                data["order"],
+                data["offsets"],
+                np.load(vectors_path(path), mmap_mode="r"),
+            )
+        if len(index.vectors) != len(index.order):
+            raise ValueError(f"{path} and {vectors_path(path)} do not match")
+        return index
+
+    @staticmethod
+    def remove(path: Path):
+        """Delete the index saved at path, if there is one"""
+        path.unlink(missing_ok=True)
+        vectors_path(path).unlink(missing_ok=True)
+
+
+def vectors_path(path: Path) -> Path:
+    """Where the vectors for the index at path are saved"""
+    return path.with_name(path.name + ".vectors.npy")
+
+
+def _save_array(path: Path, array: np.ndarray):
+    # np.save() would add .npy to a path without it
+    with open(path, "wb") as f:
+        np.save(f, array)
+
+
+def _unit(vectors: np.ndarray, norms: Optional[np.ndarray] = None) -> np.ndarray:
+    """Scale vectors to unit length, leaving zero vectors alone"""
+    if norms is None:
+        norms = np.linalg.norm(vectors, axis=-1)
+    norms = np.where(norms == 0, 1, norms)
+    if vectors.ndim > 1:
+        norms = norms[:, np.newaxis]
+    return (vectors / norms).astype(np.float32)
+
+
+def _assign(vectors, norms, centroids) -> np.ndarray:
+    """The index of the closest centroid to each vector"""
+    assignments = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), _BATCH_SIZE):
+        stop = start + _BATCH_SIZE
+        assignments[start:stop] = np.argmax(
+            _unit(vectors[start:stop], norms[start:stop]) @ centroids.T, axis=1
+        )
+    return assignments
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from CreeDictionary.cvd.ivf_index import IVFIndex
+
+
+@pytest.fixture
+def vectors():
+    """Vectors bunched around a few directions, like related definitions"""
+    rng = np.random.default_rng(seed=1)
+    directions = rng.normal(size=(20, 16))
+    return (
+        directions[rng.integers(0, len(directions), 2000)]
+        + rng.normal(scale=0.3, size=(2000, 16))
+    ).astype(np.float32)
+
+
+def exact_search(vectors, query, topn):
+    similarities = (vectors @ query) / (
+        np.linalg.norm(vectors, axis=1) * np.linalg.norm(query)
+    )
+    return list(np.argsort(-similarities)[:topn])
+
+
+def test_every_vector_is_in_one_cluster(vectors):
+    index = IVFIndex.build(vectors, n_lists=30)
+
+    assert index.n_lists == 30
+    assert sorted(index.order) == list(range(len(vectors)))
+    assert index.offsets[0] == 0
+    assert index.offsets[-1] == len(vectors)
+
+
+def test_probing_every_cluster_is_exact(vectors):
+    index = IVFIndex.build(vectors, n_lists=30)
+    query = vectors[0] + vectors[1]
+
+    results = index.search(query, 10, n_probe=index.n_lists)
+
+    assert [i for i, similarity in results] == exact_search(vectors, query, 10)
+    similarities = [similarity for i, similarity in results]
+    assert similarities == sorted(similarities, reverse=True)
+    assert similarities[0] <= 1.0001
+
+
+def test_approximate_recall(vectors):
+    index = IVFIndex.build(vectors)
+    rng = np.random.default_rng(seed=2)
+
+    found = 0
+    queries = vectors[rng.integers(0, len(vectors), 50)]
+    for query in queries:
+        exact = set(exact_search(vectors, query, 10))
+        approximate = {i for i, similarity in index.search(query, 10, 8)}
+        found += len(exact & approximate)
+
+    assert found / (10 * len(queries)) > 0.9
+
+
+def test_save_and_load(vectors, tmp_path):
+    index = IVFIndex.build(vectors)
+    path = tmp_path / "index.ivf.npz"
+    index.save(path)
+
+    loaded = IVFIndex.load(path)
+
+    query = vectors[3]
+    assert loaded.search(query, 5, 4) == index.search(query, 5, 4)
+    assert isinstance(loaded.vectors, np.memmap)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "index.ivf.npz",
+        "index.ivf.npz.vectors.npy",
+    ]
+
+    IVFIndex.remove(path)
+    assert list(tmp_path.iterdir()) == []
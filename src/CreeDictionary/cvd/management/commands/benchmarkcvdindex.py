@@ -0,0 +1,115 @@
+import time
+from argparse import ArgumentParser
+
+import numpy as np
+
+from django.core.management import BaseCommand, CommandError
+
+from CreeDictionary.cvd import (
+    definition_vectors,
+    definition_vector_index,
+    definition_vectors_quantized,
+    extract_keyed_words,
+    google_news_vectors,
+    vector_for_keys,
+)
+from CreeDictionary.search_quality import DEFAULT_SAMPLE_FILE
+from CreeDictionary.search_quality.sample import load_sample_definition
+
+
+class Command(BaseCommand):
+    help = """Compare faster semantic search methods with exact search
+
+    Runs the queries in a search quality sample file through exact cosine
+    vector distance search, and through approximate search with the
+    definition vector index and search with the quantized definition vectors,
+    whichever have been built. For each, prints the recall, the fraction of
+    the exact results that were also found, and the average time per query.
+    For quantized vectors, also prints the largest error in a similarity.
+    """
+
+    def add_arguments(self, parser: ArgumentParser):
+        parser.add_argument("--csv-file", default=DEFAULT_SAMPLE_FILE)
+        parser.add_argument(
+            "--topn", type=int, default=50, help="How many results to compare"
+        )
+        parser.add_argument(
+            "--probes",
+            type=int,
+            nargs="+",
+            default=[1, 2, 4, 8, 16, 32],
+            help="Numbers of index clusters to search",
+        )
+
+    def handle(self, csv_file, topn, probes, **options):
+        vectors = definition_vectors()
+        index = definition_vector_index()
+        quantized = definition_vectors_quantized()
+        if index is None and quantized is None:
+            raise CommandError(
+                "No definition vector index or quantized vectors. Run `manage.py builddefinitionvectors --ann-index --quantize=int8`."
+            )
+
+        news_vectors = google_news_vectors()
+        query_vectors = []
+        for sample in load_sample_definition(csv_file):
+            keys = extract_keyed_words(sample["Query"], news_vectors)
+            if keys:
+                query_vectors.append(vector_for_keys(news_vectors, keys))
+        if not query_vectors:
+            raise CommandError(f"No queries in {csv_file} have news vectors")
+
+        self.stdout.write(
+            f"{len(query_vectors):,} queries, {len(vectors):,} definition vectors"
+        )
+
+        exact_results, exact_time = self.run(
+            lambda q: vectors.similar_by_vector(q, topn), query_vectors
+        )
+        self.stdout.write(f"exact: {exact_time * 1000:.2f}ms per query")
+
+        def recall(results):
+            found = total = 0
+            for exact, approximate in zip(exact_results, results):
+                found += len(
+                    {key for key, similarity in exact}
+                    & {vectors.index_to_key[i] for i, similarity in approximate}
+                )
+                total += len(exact)
+            return found / total
+
+        if index is not None:
+            self.stdout.write(f"index: {index.n_lists:,} clusters")
+            for n_probe in probes:
+                results, elapsed = self.run(
+                    lambda q: index.search(q, topn, n_probe), query_vectors
+                )
+                self.stdout.write(
+                    f"probes={n_probe}: recall@{topn} {recall(results):.3f}, {elapsed * 1000:.2f}ms per query"
+                )
+
+        if quantized is not None:
+            results, elapsed = self.run(
+                lambda q: quantized.search(q, topn), query_vectors
+            )
+            max_error = max(
+                np.max(
+                    np.abs(
+                        np.array([similarity for i, similarity in result])
+                        - vectors.cosine_similarities(
+                            q, vectors.vectors[[i for i, similarity in result]]
+                        )
+                    ),
+                    initial=0,
+                )
+                for q, result in zip(query_vectors, results)
+            )
+            self.stdout.write(
+                f"{quantized.dtype}: recall@{topn} {recall(results):.3f}, max similarity error {max_error:.4f}, {elapsed * 1000:.2f}ms per query"
+            )
+
+    def run(self, search, query_vectors):
+        """Return the results of search for each query, and the average time"""
+        start = time.perf_counter()
+        results = [search(q) for q in query_vectors]
+        return results, (time.perf_counter() - start) / len(query_vectors)
@@ -1,21 +1,29 @@
 import json
 import logging
-from argparse import ArgumentParser
+from argparse import ArgumentParser, BooleanOptionalAction
 from contextlib import contextmanager
 from os import fspath
+from pathlib import Path
 
-from django.core.management import BaseCommand
+import numpy as np
+import scipy.sparse
+from django.conf import settings
+from django.core.management import BaseCommand, call_command
 from gensim.models import KeyedVectors
 from tqdm import tqdm
 
 from CreeDictionary.cvd import (
-    google_news_vectors,
+    full_google_news_vectors,
     extract_keyed_words,
-    vector_for_keys,
     definition_vectors_path,
+    definition_index_path,
+    definition_quantized_path,
 )
 from CreeDictionary.cvd.definition_keys import definition_to_cvd_key
+from CreeDictionary.cvd.ivf_index import IVFIndex
+from CreeDictionary.cvd.quantized import DTYPES, QuantizedVectors
 from morphodict.lexicon.models import Definition
+from morphodict.site import util
 
 logger = logging.getLogger(__name__)
 
@@ -26,9 +34,48 @@ class Command(BaseCommand):
     def add_arguments(self, parser: ArgumentParser):
         parser.add_argument("--output-file", default=definition_vectors_path())
         parser.add_argument("--debug-output-file")
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="""
+                Reuse the vectors in the existing output file for definitions
+                that are still in the database, and only compute vectors for
+                new definitions.
 
-    def handle(self, output_file, debug_output_file, **options):
+                You will not want to use this if the news vectors have been
+                updated since the output file was built.
+            """,
+        )
+        parser.add_argument(
+            "--ann-index",
+            action=BooleanOptionalAction,
+            default=settings.MORPHODICT_CVD_APPROXIMATE_SEARCH,
+            help="""
+                Also build the index used for approximate semantic search,
+                next to the output file
+            """,
+        )
+        parser.add_argument(
+            "--quantize",
+            choices=[*DTYPES, "none"],
+            default=settings.MORPHODICT_CVD_QUANTIZED_VECTORS or "none",
+            help="""
+                Also save a copy of the vectors, scaled to unit length, in
+                this type, next to the output file
+            """,
+        )
+
+    def handle(
+        self,
+        output_file,
+        debug_output_file,
+        incremental=False,
+        ann_index=settings.MORPHODICT_CVD_APPROXIMATE_SEARCH,
+        quantize=settings.MORPHODICT_CVD_QUANTIZED_VECTORS or "none",
+        **options,
+    ):
         logger.info("Building definition vectors")
+        output_file = Path(output_file)
 
         definitions = Definition.objects.filter(
             auto_translation_source_id__isnull=True
@@ -36,17 +83,44 @@ class Command(BaseCommand):
 
         count = definitions.count()
 
-        news_vectors = google_news_vectors()
+        # Definitions can use words that were left out of the trimmed news
+        # vectors, until those are rebuilt below
+        news_vectors = full_google_news_vectors()
+
+        previous_vectors = None
+        if incremental:
+            previous_vectors = load_previous_vectors(
+                output_file, news_vectors.vector_size
+            )
 
         definition_vector_keys = []
-        definition_vector_vectors = []
+        # Rows of the output to copy from previous_vectors, and where from
+        reused_rows = []
+        reused_from = []
+        # Rows of the output to compute, and the news vector indices of their
+        # words, all in one flat list: the words for computed_rows[i] start
+        # at word_indices[word_offsets[i]].
+        computed_rows = []
+        word_indices = []
+        word_offsets = []
 
         unknown_words = set()
+        news_key_to_index = news_vectors.key_to_index
 
         with create_debug_output(debug_output_file) as debug_output:
             for d in tqdm(definitions.iterator(), total=count):
+                cvd_key = definition_to_cvd_key(d)
+                # The key includes the definition id, and the importer adds
+                # changed definitions with new ids instead of updating them,
+                # so a vector saved under the same key is still correct.
+                if previous_vectors is not None and cvd_key in previous_vectors:
+                    reused_rows.append(len(definition_vector_keys))
+                    reused_from.append(previous_vectors.get_index(cvd_key))
+                    definition_vector_keys.append(cvd_key)
+                    continue
+
                 keys = extract_keyed_words(
-                    d.semantic_definition, news_vectors, unknown_words
+                    d.semantic_definition, news_key_to_index, unknown_words
                 )
                 debug_output(
                     json.dumps(
@@ -59,17 +133,128 @@ class Command(BaseCommand):
                     )
                 )
                 if keys:
-                    vec_sum = vector_for_keys(news_vectors, keys)
+                    computed_rows.append(len(definition_vector_keys))
+                    word_offsets.append(len(word_indices))
+                    word_indices.extend(news_key_to_index[k] for k in keys)
+                    definition_vector_keys.append(cvd_key)
+
+        if previous_vectors is not None:
+            logger.info(
+                f"Reused {len(reused_rows):,} definition vectors, computed {len(computed_rows):,}, dropped {len(previous_vectors) - len(reused_rows):,}"
+            )
 
-                    definition_vector_keys.append(definition_to_cvd_key(d))
-                    definition_vector_vectors.append(vec_sum)
+        definition_vectors = KeyedVectors(
+            vector_size=news_vectors.vector_size, count=len(definition_vector_keys)
+        )
+        definition_vectors.index_to_key = definition_vector_keys
+        definition_vectors.key_to_index = {
+            key: i for i, key in enumerate(definition_vector_keys)
+        }
+        definition_vectors.next_index = len(definition_vector_keys)
 
-            definition_vectors = KeyedVectors(vector_size=news_vectors.vector_size)
-            definition_vectors.add_vectors(
-                definition_vector_keys, definition_vector_vectors
+        out = definition_vectors.vectors
+        if reused_rows:
+            copy_rows(previous_vectors.vectors, np.array(reused_from), out, reused_rows)
+        if computed_rows:
+            sum_rows(
+                news_vectors.vectors,
+                np.array(word_indices),
+                np.array(word_offsets),
+                out,
+                computed_rows,
             )
-            output_file.parent.mkdir(exist_ok=True)
-            definition_vectors.save(fspath(output_file))
+
+        output_file.parent.mkdir(exist_ok=True)
+        save_atomically(definition_vectors, output_file)
+
+        index_path = definition_index_path(output_file)
+        if ann_index:
+            logger.info("Building definition vector index")
+            IVFIndex.build(definition_vectors.vectors).save(index_path)
+        else:
+            # An index for older vectors would give wrong results
+            IVFIndex.remove(index_path)
+
+        quantized_path = definition_quantized_path(output_file)
+        if quantize != "none":
+            logger.info(f"Saving {quantize} definition vectors")
+            QuantizedVectors.quantize(definition_vectors.vectors, quantize).save(
+                quantized_path
+            )
+        else:
+            QuantizedVectors.remove(quantized_path)
+
+        if settings.MORPHODICT_CVD_TRIMMED_NEWS_VECTORS:
+            call_command("trimnewsvectors")
+
+
+# How many rows of the output to work on at a time, to keep temporary arrays
+# small
+BATCH_SIZE = 4096
+
+
+def copy_rows(vectors, indices, out, rows):
+    """Set out[rows[i]] = vectors[indices[i]]"""
+    for start in range(0, len(rows), BATCH_SIZE):
+        stop = start + BATCH_SIZE
+        out[rows[start:stop]] = vectors[indices[start:stop]]
+
+
+def sum_rows(vectors, indices, offsets, out, rows):
+    """
+    Set out[rows[i]] to the sum of vectors[indices[offsets[i]:offsets[i + 1]]],
+    going to the end of indices for the last row
+
+    Each batch of sums is a single product of a sparse matrix, with a 1 for
+    every word of every definition, and the vectors matrix. That only reads
+    the rows of vectors that are needed, which matters when vectors is a
+    memory-mapped file of millions of words.
+    """
+    for start in range(0, len(rows), BATCH_SIZE):
+        stop = start + BATCH_SIZE
+        batch_offsets = offsets[start:stop]
+        first = batch_offsets[0]
+        last = offsets[stop] if stop < len(offsets) else len(indices)
+        words = scipy.sparse.csr_matrix(
+            (
+                np.ones(last - first, dtype=vectors.dtype),
+                indices[first:last],
+                np.append(batch_offsets - first, last - first),
+            ),
+            shape=(len(batch_offsets), len(vectors)),
+        )
+        out[rows[start:stop]] = words @ vectors
+
+
+def load_previous_vectors(path: Path, vector_size: int):
+    """Load existing definition vectors for reuse, if they are usable"""
+    try:
+        previous_vectors = KeyedVectors.load(fspath(path), mmap="r")
+    except FileNotFoundError:
+        logger.info(f"No existing definition vectors at {path}, building all")
+        return None
+    if previous_vectors.vector_size != vector_size:
+        logger.info("Existing definition vectors have a different size, building all")
+        return None
+    return previous_vectors
+
+
+def save_atomically(keyed_vectors: KeyedVectors, path: Path):
+    """Save keyed_vectors to path, without leaving partly-written files there
+
+    The vectors array is always saved in its own `.vectors.npy` file, so that
+    it can be memory-mapped, and so that there is the same set of files to
+    rename every time.
+    """
+    # The two renames don’t happen at exactly the same time, but a reader
+    # would have to load the files in the instant between them to see a
+    # mismatched pair, and an interrupted build no longer leaves a truncated
+    # file behind.
+    util.save_atomically(
+        path,
+        lambda temp_path: keyed_vectors.save(fspath(temp_path), separately=["vectors"]),
+        suffixes=[".vectors.npy", ""],
+    )
 
 
 @contextmanager
@@ -0,0 +1,87 @@
+import logging
+from argparse import ArgumentParser
+from pathlib import Path
+
+import numpy as np
+from django.core.management import BaseCommand
+from gensim.models import KeyedVectors
+from tqdm import tqdm
+
+from CreeDictionary.cvd import (
+    extract_keyed_words,
+    full_google_news_vectors,
+    trimmed_news_vectors_path,
+)
+from CreeDictionary.cvd.management.commands.builddefinitionvectors import (
+    BATCH_SIZE,
+    save_atomically,
+)
+from morphodict.lexicon.models import Definition
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = """Save the news vectors that semantic search can actually use
+
+    Query words are lowercased before being looked up in the news vectors, so
+    keys with capital letters are never used. Of the rest, this keeps every
+    word used in a definition, and the most frequent English words, which are
+    the ones people are likely to search for. That is a small fraction of the
+    three million news vectors, so it is much faster to load. Set
+    MORPHODICT_CVD_TRIMMED_NEWS_VECTORS to use the result.
+    """
+
+    def add_arguments(self, parser: ArgumentParser):
+        parser.add_argument("--output-file", default=trimmed_news_vectors_path())
+        parser.add_argument(
+            "--top-words",
+            type=int,
+            default=100_000,
+            help="""
+                How many of the most frequent lowercase words to keep, in
+                addition to the words in definitions
+            """,
+        )
+
+    def handle(self, output_file, top_words, **options):
+        output_file = Path(output_file)
+        news_vectors = full_google_news_vectors()
+        key_to_index = news_vectors.key_to_index
+
+        # The news vectors are sorted by how often each word appears
+        keep = np.zeros(len(news_vectors), dtype=bool)
+        kept_top_words = 0
+        for i, key in enumerate(news_vectors.index_to_key):
+            if kept_top_words >= top_words:
+                break
+            if key == key.lower():
+                keep[i] = True
+                kept_top_words += 1
+
+        definitions = Definition.objects.only("text", "raw_semantic_definition")
+        unknown_words = set()
+        for d in tqdm(definitions.iterator(), total=definitions.count()):
+            for key in extract_keyed_words(
+                d.semantic_definition, key_to_index, unknown_words
+            ):
+                keep[key_to_index[key]] = True
+
+        indices = np.flatnonzero(keep)
+        trimmed = KeyedVectors(
+            vector_size=news_vectors.vector_size,
+            count=len(indices),
+            dtype=news_vectors.vectors.dtype,
+        )
+        trimmed.index_to_key = [news_vectors.index_to_key[i] for i in indices]
+        trimmed.key_to_index = {key: i for i, key in enumerate(trimmed.index_to_key)}
+        trimmed.next_index = len(indices)
+        for start in range(0, len(indices), BATCH_SIZE):
+            stop = start + BATCH_SIZE
+            trimmed.vectors[start:stop] = news_vectors.vectors[indices[start:stop]]
+
+        output_file.parent.mkdir(exist_ok=True)
+        save_atomically(trimmed, output_file)
+        logger.info(
+            f"Kept {len(trimmed):,} of {len(news_vectors):,} news vectors, {len(trimmed) - kept_top_words:,} of them only for definitions"
+        )
@@ -0,0 +1,139 @@
+"""
+Compact copies of definition vectors for exact search
+
+Semantic search only needs the direction of each definition vector, and not
+much precision. So instead of the float32 vectors in the KeyedVectors file,
+search can use a copy that is scaled to unit length ahead of time, and stored
+as float16, or as int8 with a scale factor per vector. Those take a half or a
+quarter of the memory, and of the memory bandwidth per query, at the cost of
+small errors in the similarities; `benchmarkcvdindex` measures how much the
+results change.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from morphodict.site.util import save_atomically
+
+DTYPES = {"float16": np.float16, "int8": np.int8}
+
+# How many vectors to convert to float32 at a time while searching, to keep
+# temporary arrays small
+_BATCH_SIZE = 16384
+
+
+class QuantizedVectors:
+    def __init__(self, vectors: np.ndarray, scales: Optional[np.ndarray]):
+        """
+        :param vectors: unit-length vectors, as float16, or as int8 to be
+            multiplied by scales
+        :param scales: for int8, the factor to multiply each vector by
+        """
+        self.vectors = vectors
+        self.scales = scales
+
+    def __len__(self):
+        return len(self.vectors)
+
+    @property
+    def dtype(self) -> str:
+        return self.vectors.dtype.name
+
+    @classmethod
+    def quantize(cls, vectors: np.ndarray, dtype: str) -> QuantizedVectors:
+        if dtype not in DTYPES:
+            raise ValueError(f"dtype must be one of {list(DTYPES)}, not {dtype!r}")
+
+        quantized = np.empty(vectors.shape, dtype=DTYPES[dtype])
+        scales = np.empty(len(vectors), dtype=np.float32) if dtype == "int8" else None
+        for start in range(0, len(vectors), _BATCH_SIZE):
+            stop = start + _BATCH_SIZE
+            batch = vectors[start:stop].astype(np.float32)
+            norms = np.linalg.norm(batch, axis=1, keepdims=True)
+            batch /= np.where(norms == 0, 1, norms)
+            if scales is None:
+                quantized[start:stop] = batch
+            else:
+                # Use the full int8 range for each vector
+                batch_scales = np.abs(batch).max(axis=1, initial=0) / 127
+                batch_scales[batch_scales == 0] = 1
+                quantized[start:stop] = np.rint(batch / batch_scales[:, np.newaxis])
+                scales[start:stop] = batch_scales
+        return cls(quantized, scales)
+
+    def similarities(self, query: np.ndarray) -> np.ndarray:
+        """The cosine similarity of query with every vector"""
+        query = np.asarray(query, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm != 0:
+            query = query / norm
+
+        similarities = np.empty(len(self.vectors), dtype=np.float32)
+        for start in range(0, len(self.vectors), _BATCH_SIZE):
+            stop = start + _BATCH_SIZE
+            similarities[start:stop] = (
+                self.vectors[start:stop].astype(np.float32) @ query
+            )
+        if self.scales is not None:
+            similarities *= self.scales
+        return similarities
+
+    def search(self, query: np.ndarray, topn: int) -> list[tuple[int, float]]:
+        """
+        :return: up to topn (index, similarity) pairs for the vectors most
+            similar to query, most similar first
+        """
+        if topn <= 0:
+            return []
+        similarities = self.similarities(query)
+        if len(similarities) > topn:
+            best = np.argpartition(-similarities, topn - 1)[:topn]
+        else:
+            best = np.arange(len(similarities))
+        best = best[np.argsort(-similarities[best], kind="stable")]
+        return [(int(i), float(similarities[i])) for i in best]
+
+    def save(self, path: Path):
+        """Save to path, and for int8 the scales to scales_path(path)
+
+        Existing files are only replaced once the new ones are complete.
+        """
+        if self.scales is not None:
+            scales = self.scales
+            save_atomically(
+                scales_path(path), lambda temp_path: _save_array(temp_path, scales)
+            )
+        else:
+            scales_path(path).unlink(missing_ok=True)
+        save_atomically(path, lambda temp_path: _save_array(temp_path, self.vectors))
+
+    @classmethod
+    def load(cls, path: Path) -> QuantizedVectors:
+        vectors = np.load(path, mmap_mode="r")
+        scales = None
+        if vectors.dtype == np.int8:
+            scales = np.load(scales_path(path))
+            if len(scales) != len(vectors):
+                raise ValueError(f"{path} and {scales_path(path)} do not match")
+        return cls(vectors, scales)
+
+    @staticmethod
+    def remove(path: Path):
+        """Delete the vectors saved at path, if there are any"""
+        path.unlink(missing_ok=True)
+        scales_path(path).unlink(missing_ok=True)
+
+
+def scales_path(path: Path) -> Path:
+    """Where the scales for int8 vectors saved at path go"""
+    return path.with_name(path.name + ".scales.npy")
+
+
+def _save_array(path: Path, array: np.ndarray):
+    # np.save() would add .npy to a path without it
+    with open(path, "wb") as f:
+        np.save(f, array)
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from CreeDictionary.cvd.quantized import QuantizedVectors
+
+
+@pytest.fixture
+def vectors():
+    rng = np.random.default_rng(seed=1)
+    return rng.normal(scale=3, size=(2000, 16)).astype(np.float32)
+
+
+def exact_similarities(vectors, query):
+    return (vectors @ query) / (np.linalg.norm(vectors, axis=1) * np.linalg.norm(query))
+
+
+@pytest.mark.parametrize("dtype", ["float16", "int8"])
+def test_quantized_search_is_close_to_exact(vectors, dtype):
+    quantized = QuantizedVectors.quantize(vectors, dtype)
+    rng = np.random.default_rng(seed=2)
+
+    assert quantized.dtype == dtype
+    found = 0
+    queries = vectors[rng.integers(0, len(vectors), 50)]
+    for query in queries:
+        exact = exact_similarities(vectors, query)
+        results = quantized.search(query, 10)
+
+        found += len(set(np.argsort(-exact)[:10]) & {i for i, s in results})
+        similarities = [similarity for i, similarity in results]
+        assert similarities == sorted(similarities, reverse=True)
+        for i, similarity in results:
+            assert similarity == pytest.approx(exact[i], abs=0.02)
+
+    assert found / (10 * len(queries)) > 0.9
+
+
+def test_save_and_load(vectors, tmp_path):
+    quantized = QuantizedVectors.quantize(vectors, "int8")
+    path = tmp_path / "vectors.quantized.npy"
+    quantized.save(path)
+
+    loaded = QuantizedVectors.load(path)
+
+    query = vectors[3]
+    assert loaded.search(query, 5) == quantized.search(query, 5)
+    assert isinstance(loaded.vectors, np.memmap)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "vectors.quantized.npy",
+        "vectors.quantized.npy.scales.npy",
+    ]
+
+    QuantizedVectors.quantize(vectors, "float16").save(path)
+    assert QuantizedVectors.load(path).dtype == "float16"
+    assert [p.name for p in tmp_path.iterdir()] == ["vectors.quantized.npy"]
+
+    QuantizedVectors.remove(path)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_unknown_dtype(vectors):
+    with pytest.raises(ValueError):
+        QuantizedVectors.quantize(vectors, "int4")
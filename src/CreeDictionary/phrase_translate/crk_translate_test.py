@@ -1,6 +1,11 @@
+from collections import Counter
+
 import pytest
 
-from CreeDictionary.phrase_translate.translate import inflect_english_phrase
+from CreeDictionary.phrase_translate.translate import (
+    TranslationStats,
+    inflect_english_phrase,
+)
 
 WAPAMEW_DEFINITION = "s/he sees s.o."
 
@@ -81,3 +86,23 @@ WAPAMEW_DEFINITION = "s/he sees s.o."
 )
 def test_translations(analysis, definition, english_phrase):
     assert inflect_english_phrase(analysis, definition) == english_phrase
+
+
+def test_translation_stats_add():
+    stats = TranslationStats(
+        wordforms_examined=3,
+        definitions_created=1,
+        unknown_tags_during_auto_translation=Counter({"+Foo": 1}),
+    )
+    stats += TranslationStats(
+        wordforms_examined=2,
+        preverb_form=1,
+        unknown_tags_during_auto_translation=Counter({"+Foo": 1, "+Bar": 2}),
+    )
+
+    assert stats == TranslationStats(
+        wordforms_examined=5,
+        definitions_created=1,
+        preverb_form=1,
+        unknown_tags_during_auto_translation=Counter({"+Foo": 2, "+Bar": 2}),
+    )
@@ -12,7 +12,7 @@ from argparse import (
 )
 from argparse import BooleanOptionalAction
 from collections import Counter
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, asdict, field, fields
 from functools import cache
 from pathlib import Path
 from typing import Iterable
@@ -22,6 +22,7 @@ import foma
 
 from CreeDictionary.phrase_translate.definition_processing import remove_parentheticals
 from morphodict.analysis import RichAnalysis
+from morphodict.analysis.lookup_cache import CachedFomaFST
 from morphodict.analysis.tag_map import UnknownTagError
 
 if typing.TYPE_CHECKING:
@@ -48,24 +49,31 @@ logger = logging.getLogger(__name__)
 
 @cache
 def eng_noun_entry_to_inflected_phrase_fst():
-    return foma.FST.load(
-        shared_fst_dir
-        / "transcriptor-cw-eng-noun-entry2inflected-phrase-w-flags.fomabin"
+    return CachedFomaFST(
+        "eng_noun_entry_to_inflected_phrase",
+        foma.FST.load(
+            shared_fst_dir
+            / "transcriptor-cw-eng-noun-entry2inflected-phrase-w-flags.fomabin"
+        ),
     )
 
 
 @cache
 def eng_verb_entry_to_inflected_phrase_fst():
-    return foma.FST.load(
-        shared_fst_dir
-        / "transcriptor-cw-eng-verb-entry2inflected-phrase-w-flags.fomabin"
+    return CachedFomaFST(
+        "eng_verb_entry_to_inflected_phrase",
+        foma.FST.load(
+            shared_fst_dir
+            / "transcriptor-cw-eng-verb-entry2inflected-phrase-w-flags.fomabin"
+        ),
     )
 
 
 @cache
 def eng_phrase_to_crk_features_fst():
-    return foma.FST.load(
-        shared_fst_dir / "transcriptor-eng-phrase2crk-features.fomabin"
+    return CachedFomaFST(
+        "eng_phrase_to_crk_features",
+        foma.FST.load(shared_fst_dir / "transcriptor-eng-phrase2crk-features.fomabin"),
     )
 
 
@@ -156,6 +164,13 @@ class TranslationStats:
     # How often are we seeing various unknown tags?
     unknown_tags_during_auto_translation: Counter = field(default_factory=Counter)
 
+    def __iadd__(self, other: TranslationStats):
+        """Add in the counts from other, e.g., from another worker process"""
+        for f in fields(self):
+            # Counter += Counter does the right thing too
+            setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
+        return self
+
     def __str__(self):
         ret = []
 
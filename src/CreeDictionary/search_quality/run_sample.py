@@ -7,6 +7,8 @@ import time
 from os import PathLike
 
 from CreeDictionary.API.search import search_with_affixes
+from CreeDictionary.API.search.query import Query
+from morphodict.analysis import rich_analyze_relaxed_many
 from . import SampleSearchResultsJson, DEFAULT_SAMPLE_FILE
 from .analyze_results import count_results
 from .sample import load_sample_definition
@@ -30,16 +32,25 @@ def gen_run_sample(
     if max is not None:
         samples = samples[:max]
 
-    for entry in samples:
+    queries = [
+        entry["Query"] + (" " + append_to_query if append_to_query else "")
+        for entry in samples
+    ]
+
+    # Run every query through the FST up front, so that the per-query times
+    # below are not dominated by analyzer warmup
+    start_time = time.time()
+    analyses = rich_analyze_relaxed_many(Query(q).query_string for q in queries)
+    yield f"Analyzed {len(analyses):,} distinct queries in {time.time() - start_time:0.3}s"
+
+    for entry, full_query in zip(samples, queries):
         query = entry["Query"]
 
         # If we were being rigorous about timing, we’d run all the queries
         # multiple times in randomized orders to spread out the effects of
         # warmup and caching
         start_time = time.time()
-        results = search_with_affixes(
-            query + (" " + append_to_query if append_to_query else "")
-        )
+        results = search_with_affixes(full_query)
         time_taken = time.time() - start_time
 
         combined_results[query] = {
@@ -52,3 +52,128 @@ def test_click_in_text_disables_affix_search(client):
         reverse("cree-dictionary-word-click-in-text-api") + f"?q={ASCII_WAPAMEW}"
     ).content.decode("utf-8")
     assert EXPECTED_SUFFIX_SEARCH_RESULT not in click_in_text_response
+
+
+@pytest.mark.django_db
+def test_click_in_text_conditional_requests(client):
+    url = reverse("cree-dictionary-word-click-in-text-api") + "?q=niskak"
+
+    response = client.get(url)
+    assert response.status_code == 200
+    assert "max-age" in response["Cache-Control"]
+    etag = response["ETag"]
+    assert not etag.startswith("W/")
+
+    not_modified = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert not_modified.status_code == 304
+    assert not_modified["ETag"] == etag
+
+    other_query = client.get(
+        reverse("cree-dictionary-word-click-in-text-api") + "?q=wapamew",
+        HTTP_IF_NONE_MATCH=etag,
+    )
+    assert other_query.status_code == 200
+    assert other_query["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_click_in_text_etag_depends_on_display_mode(client):
+    url = reverse("cree-dictionary-word-click-in-text-api") + "?q=niskak"
+
+    community = client.get(url)
+    client.cookies["mode"] = "linguistic"
+    linguistic = client.get(url)
+
+    assert community["ETag"] != linguistic["ETag"]
+
+
+@pytest.mark.django_db
+def test_click_in_text_bulk_tokens(client):
+    response = client.post(
+        reverse("cree-dictionary-word-click-in-text-bulk-api"),
+        {"tokens": ["niskak", "wapamew", "niskak"]},
+        content_type="application/json",
+    )
+
+    assert response.status_code == 200
+    assert response["Access-Control-Allow-Origin"] == "*"
+    results = response.json()["results"]
+    assert list(results.keys()) == ["niskak", "wapamew"]
+
+    single = client.get(
+        reverse("cree-dictionary-word-click-in-text-api") + "?q=niskak"
+    ).json()
+    assert results["niskak"] == single["results"]
+    assert response.json()["next_page"]["niskak"] == single["next_page"]
+
+
+@pytest.mark.django_db
+def test_click_in_text_bulk_pages(client, settings):
+    settings.MORPHODICT_SEARCH_RESULTS_PER_PAGE = 1
+    response = client.post(
+        reverse("cree-dictionary-word-click-in-text-bulk-api"),
+        {"tokens": [ASCII_WAPAMEW]},
+        content_type="application/json",
+    ).json()
+
+    assert len(response["results"][ASCII_WAPAMEW]) == 1
+    assert response["next_page"][ASCII_WAPAMEW] == 2
+
+
+@pytest.mark.django_db
+def test_click_in_text_bulk_text(client):
+    response = client.post(
+        reverse("cree-dictionary-word-click-in-text-bulk-api"),
+        {"text": "niskak, wâpamêw! niskak"},
+        content_type="application/json",
+    )
+
+    assert response.status_code == 200
+    assert list(response.json()["results"].keys()) == ["niskak", "wâpamêw"]
+
+
+@pytest.mark.parametrize(
+    "body", ["not json", "[]", '{"tokens": "niskak"}', '{"text": 1}', "{}"]
+)
+def test_click_in_text_bulk_bad_request(client, body):
+    response = client.post(
+        reverse("cree-dictionary-word-click-in-text-bulk-api"),
+        body,
+        content_type="application/json",
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_click_in_text_pages(client, settings):
+    settings.MORPHODICT_SEARCH_RESULTS_PER_PAGE = 1
+    url = reverse("cree-dictionary-word-click-in-text-api") + f"?q={ASCII_WAPAMEW}"
+
+    first = client.get(url).json()
+    second = client.get(url + "&page=2")
+
+    assert len(first["results"]) == 1
+    assert first["next_page"] == 2
+    assert second["ETag"] != client.get(url)["ETag"]
+    assert second.json()["results"] != first["results"]
+
+
+@pytest.mark.parametrize("page", ["0", "two"])
+def test_click_in_text_bad_page(client, page):
+    response = client.get(
+        reverse("cree-dictionary-word-click-in-text-api") + f"?q=niskak&page={page}"
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_search_page_links_to_more_results(client, settings):
+    settings.MORPHODICT_SEARCH_RESULTS_PER_PAGE = 1
+
+    response = client.get(
+        reverse("cree-dictionary-search") + f"?q={ASCII_WAPAMEW}"
+    ).content.decode("utf-8")
+
+    assert f"?q={ASCII_WAPAMEW}&amp;page=2" in response
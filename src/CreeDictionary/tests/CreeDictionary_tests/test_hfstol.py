@@ -3,6 +3,9 @@ import pytest
 from morphodict.analysis import (
     relaxed_analyzer,
     rich_analyze_relaxed,
+    rich_analyze_relaxed_many,
+    rich_analyze_strict,
+    rich_analyze_strict_many,
     strict_generator,
 )
 
@@ -42,6 +45,24 @@ def test_analyze_with_prefix(wordform, lemma, prefix):
     assert "+Cnj" in analysis.suffix_tags
 
 
+@pytest.mark.parametrize(
+    "analyze,analyze_many",
+    [
+        (rich_analyze_relaxed, rich_analyze_relaxed_many),
+        (rich_analyze_strict, rich_analyze_strict_many),
+    ],
+)
+def test_analyze_many(analyze, analyze_many):
+    wordforms = ["niskak", "wâpamêw", "pîpîpôpô", "niskak"]
+
+    analyses = analyze_many(wordforms)
+
+    assert list(analyses.keys()) == ["niskak", "wâpamêw", "pîpîpôpô"]
+    for wordform, wordform_analyses in analyses.items():
+        assert wordform_analyses == analyze(wordform)
+    assert analyses["pîpîpôpô"] == []
+
+
 def test_analyze_nonword():
     # "pîpîpôpô" is not a real word
     assert list(relaxed_analyzer().lookup("pîpîpôpô")) == []
@@ -80,3 +80,27 @@ def test_chunks_make_full_labels():
         ("Ind",),
         ("3Sg", "4Sg/PlO"),
     ]
+
+
+def test_longest_prefix_falls_back_to_a_shorter_tag_set():
+    """
+    V+TA+Bogus is not a tag set, so the first chunk falls back to V+TA; nor is
+    V+Prs, so V and Prs are chunked on their own.
+    """
+    assert list(labels.english.chunk(("V", "TA", "Bogus", "V", "Prs"))) == [
+        ("V", "TA"),
+        ("Bogus",),
+        ("V",),
+        ("Prs",),
+    ]
+
+
+def test_repeated_relabellings_can_be_changed_by_the_caller():
+    tag_set = ("V", "AI", "Prs")
+    first = labels.english.get_full_relabelling(tag_set)
+    first.append("changed")
+
+    assert labels.english.get_full_relabelling(tag_set) == [
+        "Action word - like: mîcisow, nipâw",
+        "something is happening now",
+    ]
@@ -2,9 +2,17 @@ from string import ascii_letters
 
 import pytest
 from hypothesis import assume, example, given
-from hypothesis.strategies import text
+from hypothesis.strategies import lists, text
 from Levenshtein import distance
-from CreeDictionary.utils import get_modified_distance
+from CreeDictionary.utils import get_modified_distance, modified_distance_many
+from CreeDictionary.utils.cree_lev_dist import (
+    del_dist,
+    ins_dist,
+    sub_dist,
+)
+
+# Enough Cree letters, diacritics and h’s to exercise every special case
+CREE_ALPHABET = "aâāeêēiîoôhHÂktw-"
 
 
 @given(text(alphabet=ascii_letters), text(alphabet=ascii_letters))
@@ -38,3 +46,47 @@ def test_get_distance_basic_lev(spelling: str, normal_form: str):
 )
 def test_get_distance(spelling: str, normal_form: str, expected_distance):
     assert get_modified_distance(spelling, normal_form) == expected_distance
+
+
+def reference_modified_distance(spelling: str, normal_form: str) -> float:
+    """
+    The original full-matrix implementation of get_modified_distance
+    """
+    spelling = spelling.lower()
+    normal_form = normal_form.lower()
+    n, m = len(spelling), len(normal_form)
+    d = [[0] * (m + 1) for _ in range(n + 1)]
+    for i in range(1, n + 1):
+        d[i][0] = d[i - 1][0] + del_dist(spelling, i - 1)
+    for j in range(1, m + 1):
+        d[0][j] = d[0][j - 1] + ins_dist(normal_form, normal_form[j - 1], j - 1)
+
+    for i in range(1, n + 1):
+        for j in range(1, m + 1):
+            _del_dist = d[i - 1][j] + del_dist(spelling, i - 1)
+            _ins_dist = d[i][j - 1] + ins_dist(normal_form, normal_form[j - 1], j - 1)
+            _sub_dist = d[i - 1][j - 1] + sub_dist(spelling, normal_form[j - 1], i - 1)
+            d[i][j] = min((_del_dist, _ins_dist, _sub_dist))
+
+    return d[-1][-1]
+
+
+@given(text(alphabet=CREE_ALPHABET), text(alphabet=CREE_ALPHABET))
+@example("", "")
+@example("h", "ah")
+@example("ha", "ah")
+def test_get_distance_matches_reference(spelling: str, normal_form: str):
+    assert get_modified_distance(spelling, normal_form) == reference_modified_distance(
+        spelling, normal_form
+    )
+
+
+@given(text(alphabet=CREE_ALPHABET), lists(text(alphabet=CREE_ALPHABET)))
+@example("", [])
+@example("atâhk", ["atâk", "", "atahk", "ATAK", "adak"])
+def test_modified_distance_many_matches_reference(query: str, candidates: list[str]):
+    distances = modified_distance_many(query, candidates)
+
+    assert len(distances) == len(candidates)
+    for candidate, computed in zip(candidates, distances):
+        assert computed == reference_modified_distance(candidate, query)
@@ -1,2 +1,2 @@
-from .cree_lev_dist import get_modified_distance
+from .cree_lev_dist import get_modified_distance, modified_distance_many
 from .shared_res_dir import shared_res_dir
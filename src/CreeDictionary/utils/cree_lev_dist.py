@@ -1,3 +1,7 @@
+from typing import Sequence
+
+import numpy as np
+
 VOWELS = {"a", "e", "i", "o"}
 
 
@@ -78,6 +82,33 @@ def ins_dist(string, char, i):
         return 1
 
 
+def _deletion_costs(lowered: str, folded: str) -> list[float]:
+    """
+    del_dist() for every index of a lowercased string, given its diacritic-free
+    form.
+    """
+    costs: list[float] = [1] * len(lowered)
+    for i in range(1, len(lowered)):
+        if lowered[i] == "h" and folded[i - 1] in VOWELS:
+            costs[i] = 0.5
+    return costs
+
+
+def _insertion_costs(lowered: str, folded: str) -> list[float]:
+    """
+    ins_dist() for inserting each character of a lowercased string at its own
+    index, given its diacritic-free form.
+
+    Like ins_dist(), inserting at index 0 looks at the *last* character of the
+    string.
+    """
+    costs: list[float] = [1] * len(lowered)
+    for j in range(len(lowered)):
+        if lowered[j] == "h" and folded[j - 1] in VOWELS:
+            costs[j] = 0.5
+    return costs
+
+
 def get_modified_distance(spelling: str, normal_form: str) -> float:
     """
     Compute our own metric of edit distance (adapted to Cree spelling)
@@ -96,26 +127,144 @@ def get_modified_distance(spelling: str, normal_form: str) -> float:
 
     This function neglects letter case
 
+    >>> get_modified_distance("atâk", "atâhk")
+    0.5
+    >>> get_modified_distance("wâpamew", "wâpamêw")
+    0
+
     :param spelling:
     :param normal_form:
     :return: Our own metric of edit distance
     """
     # see these slides for "weighted min edit distance"
     # https://web.stanford.edu/class/cs124/lec/med.pdf
+    #
+    # This computes the same matrix as applying del_dist(), ins_dist() and
+    # sub_dist() cell by cell, but folds diacritics once per string, looks up
+    # the per-index costs from precomputed tables, and only keeps two rows of
+    # the matrix around.
     spelling = spelling.lower()
     normal_form = normal_form.lower()
-    n, m = len(spelling), len(normal_form)
-    d = [[0] * (m + 1) for _ in range(n + 1)]
-    for i in range(1, n + 1):
-        d[i][0] = d[i - 1][0] + del_dist(spelling, i - 1)
-    for j in range(1, m + 1):
-        d[0][j] = d[0][j - 1] + ins_dist(normal_form, normal_form[j - 1], j - 1)
-
-    for i in range(1, n + 1):
-        for j in range(1, m + 1):
-            _del_dist = d[i - 1][j] + del_dist(spelling, i - 1)
-            _ins_dist = d[i][j - 1] + ins_dist(normal_form, normal_form[j - 1], j - 1)
-            _sub_dist = d[i - 1][j - 1] + sub_dist(spelling, normal_form[j - 1], i - 1)
-            d[i][j] = min((_del_dist, _ins_dist, _sub_dist))
-
-    return d[-1][-1]
+    spelling_folded = remove_cree_diacritics(spelling)
+    normal_form_folded = remove_cree_diacritics(normal_form)
+
+    deletion_costs = _deletion_costs(spelling, spelling_folded)
+    insertion_costs = _insertion_costs(normal_form, normal_form_folded)
+    m = len(normal_form)
+
+    previous: list[float] = [0] * (m + 1)
+    for j in range(m):
+        previous[j + 1] = previous[j] + insertion_costs[j]
+    current: list[float] = [0] * (m + 1)
+
+    for char, folded_char, deletion_cost in zip(
+        spelling, spelling_folded, deletion_costs
+    ):
+        current[0] = previous[0] + deletion_cost
+        for j in range(m):
+            if char == normal_form[j]:
+                substitution_cost: float = 0
+            elif folded_char == normal_form_folded[j]:
+                substitution_cost = 0 if folded_char == "e" else 0.5
+            else:
+                substitution_cost = 1
+
+            best = previous[j + 1] + deletion_cost
+            candidate = current[j] + insertion_costs[j]
+            if candidate < best:
+                best = candidate
+            candidate = previous[j] + substitution_cost
+            if candidate < best:
+                best = candidate
+            current[j + 1] = best
+        previous, current = current, previous
+
+    return previous[m]
+
+
+def _code_points(text: str) -> np.ndarray:
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.int64)
+
+
+_VOWEL_CODE_POINTS = np.array([ord(v) for v in VOWELS], dtype=np.int64)
+
+
+def modified_distance_many(query: str, candidates: Sequence[str]) -> np.ndarray:
+    """
+    Compute get_modified_distance(candidate, query) for many candidates at once.
+
+    The candidates are processed together, one matrix row at a time, so that
+    the cost of going through Python is paid per character of the longest
+    candidate instead of per cell of every candidate’s matrix.
+
+    >>> modified_distance_many("atâhk", ["atâk", "atahk", "adak"])
+    array([0.5, 0.5, 2. ])
+
+    :return: a float array with one distance per candidate, in order
+    """
+    query = query.lower()
+    query_folded = remove_cree_diacritics(query)
+    lowered = [c.lower() for c in candidates]
+
+    batch_size = len(lowered)
+    if batch_size == 0:
+        return np.zeros(0)
+
+    m = len(query)
+    query_codes = _code_points(query)
+    query_folded_codes = _code_points(query_folded)
+    # Substituting into a folded "e" is free, into other folded matches is ½
+    folded_match_costs = np.where(query_folded_codes == ord("e"), 0.0, 0.5)
+
+    # The insertion recurrence along a row is a running minimum of
+    # (cell − cumulative insertion cost), offset back by the cumulative cost.
+    cumulative_insertion = np.zeros(m + 1)
+    np.cumsum(_insertion_costs(query, query_folded), out=cumulative_insertion[1:])
+
+    lengths = np.fromiter(map(len, lowered), dtype=np.intp, count=batch_size)
+    longest = int(lengths.max())
+    # Padding with -1 never matches a real character
+    codes = np.full((batch_size, longest), -1, dtype=np.int64)
+    folded = np.full((batch_size, longest), -1, dtype=np.int64)
+    for k, text in enumerate(lowered):
+        codes[k, : len(text)] = _code_points(text)
+        folded[k, : len(text)] = _code_points(remove_cree_diacritics(text))
+
+    deletion_costs = np.ones((batch_size, longest))
+    if longest > 1:
+        deletion_costs[:, 1:][
+            (codes[:, 1:] == ord("h")) & np.isin(folded[:, :-1], _VOWEL_CODE_POINTS)
+        ] = 0.5
+
+    distances = np.empty(batch_size)
+    previous = np.tile(cumulative_insertion, (batch_size, 1))
+    distances[lengths == 0] = previous[lengths == 0, m]
+
+    current = np.empty_like(previous)
+    for i in range(longest):
+        deletion_cost = deletion_costs[:, i, np.newaxis]
+        substitution_costs = np.where(
+            codes[:, i, np.newaxis] == query_codes,
+            0.0,
+            np.where(
+                folded[:, i, np.newaxis] == query_folded_codes,
+                folded_match_costs,
+                1.0,
+            ),
+        )
+
+        current[:, :1] = previous[:, :1] + deletion_cost
+        np.minimum(
+            previous[:, 1:] + deletion_cost,
+            previous[:, :-1] + substitution_costs,
+            out=current[:, 1:],
+        )
+        current -= cumulative_insertion
+        np.minimum.accumulate(current, axis=1, out=current)
+        current += cumulative_insertion
+
+        finished = lengths == i + 1
+        distances[finished] = current[finished, m]
+        previous, current = current, previous
+
+    return distances
@@ -1,24 +1,36 @@
 from functools import cache
+from typing import Iterable
 
 from django.conf import settings
 from hfst_optimized_lookup import TransducerFile, Analysis
 
+from .lookup_cache import CachedTransducer, fst_cache_stats
+
 FST_DIR = settings.BASE_DIR / "resources" / "fst"
 
 
 @cache
 def strict_generator():
-    return TransducerFile(FST_DIR / settings.STRICT_GENERATOR_FST_FILENAME)
+    return CachedTransducer(
+        "strict_generator",
+        TransducerFile(FST_DIR / settings.STRICT_GENERATOR_FST_FILENAME),
+    )
 
 
 @cache
 def relaxed_analyzer():
-    return TransducerFile(FST_DIR / settings.RELAXED_ANALYZER_FST_FILENAME)
+    return CachedTransducer(
+        "relaxed_analyzer",
+        TransducerFile(FST_DIR / settings.RELAXED_ANALYZER_FST_FILENAME),
+    )
 
 
 @cache
 def strict_analyzer():
-    return TransducerFile(FST_DIR / settings.STRICT_ANALYZER_FST_FILENAME)
+    return CachedTransducer(
+        "strict_analyzer",
+        TransducerFile(FST_DIR / settings.STRICT_ANALYZER_FST_FILENAME),
+    )
 
 
 def rich_analyze_relaxed(text):
@@ -33,6 +45,23 @@ def rich_analyze_strict(text):
     )
 
 
+def rich_analyze_relaxed_many(texts: Iterable[str]) -> dict[str, list["RichAnalysis"]]:
+    """
+    rich_analyze_relaxed() for each of many strings
+
+    This is not batched analysis: the FST still looks up one string at a time.
+    But each distinct string is only analyzed once, and the analyzer remembers
+    recent lookups across calls, so bulk callers can pass in every word they
+    have and later single-string lookups of the same words are free.
+    """
+    return {text: rich_analyze_relaxed(text) for text in dict.fromkeys(texts)}
+
+
+def rich_analyze_strict_many(texts: Iterable[str]) -> dict[str, list["RichAnalysis"]]:
+    """rich_analyze_strict() for each of many strings; see rich_analyze_relaxed_many"""
+    return {text: rich_analyze_strict(text) for text in dict.fromkeys(texts)}
+
+
 class RichAnalysis:
     """The one true FST analysis class.
 
@@ -0,0 +1,164 @@
+"""
+Bounded LRU caches in front of FST lookups
+
+FST lookups are pure functions of the input string, and the same strings get
+looked up over and over: common queries, ESPT inflecting the same lemmas, and
+paradigm generation repeating analyses. The wrappers here remember recent
+results per FST, and count hits, misses, and evictions so that the cache sizes
+can be tuned.
+
+The caches are safe to use from several threads at once. A lookup happens
+outside the lock, so two threads missing on the same string at the same time
+may both do the lookup; both get the same answer.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Iterable, TypeVar
+
+from django.conf import settings
+
+T = TypeVar("T")
+
+# All the caches created in this process, by name, for reporting
+_caches: dict[str, "LRULookupCache"] = {}
+_caches_lock = threading.Lock()
+
+
+class LRULookupCache:
+    """A thread-safe, size-bounded memo with hit/miss/eviction counters"""
+
+    def __init__(self, name: str, maxsize: int):
+        self.name = name
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, object] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        if self.maxsize <= 0:
+            with self._lock:
+                self.misses += 1
+            return compute()
+
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value  # type: ignore
+
+        value = compute()
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def lookup_cache(name: str) -> LRULookupCache:
+    """
+    Return the process-wide cache with this name, creating it if needed
+
+    The size comes from settings.MORPHODICT_FST_CACHE_SIZES, falling back to
+    settings.MORPHODICT_FST_CACHE_SIZE.
+    """
+    with _caches_lock:
+        if name not in _caches:
+            maxsize = settings.MORPHODICT_FST_CACHE_SIZES.get(
+                name, settings.MORPHODICT_FST_CACHE_SIZE
+            )
+            _caches[name] = LRULookupCache(name, maxsize)
+        return _caches[name]
+
+
+def fst_cache_stats() -> dict[str, dict[str, int]]:
+    """Counters for every FST cache in this process, for monitoring"""
+    with _caches_lock:
+        caches = list(_caches.values())
+    return {cache.name: cache.stats() for cache in caches}
+
+
+class CachedTransducer:
+    """
+    Wraps an hfst_optimized_lookup.TransducerFile, caching its lookups
+
+    Cached values are stored as tuples and handed out as fresh lists, so
+    callers can’t change what is in the cache.
+    """
+
+    def __init__(self, name: str, transducer):
+        self._transducer = transducer
+        self._lookup_cache = lookup_cache(f"{name}.lookup")
+        self._lemma_with_affixes_cache = lookup_cache(
+            f"{name}.lookup_lemma_with_affixes"
+        )
+
+    def lookup(self, string: str) -> list[str]:
+        return list(
+            self._lookup_cache.get_or_compute(
+                string, lambda: tuple(self._transducer.lookup(string))
+            )
+        )
+
+    def lookup_lemma_with_affixes(self, string: str) -> list:
+        return list(
+            self._lemma_with_affixes_cache.get_or_compute(
+                string,
+                lambda: tuple(self._transducer.lookup_lemma_with_affixes(string)),
+            )
+        )
+
+    def bulk_lookup(self, strings: Iterable[str]) -> dict[str, set[str]]:
+        # Like TransducerFile.bulk_lookup(), one lookup at a time, but cached
+        return {string: set(self.lookup(string)) for string in strings}
+
+    def __getattr__(self, name):
+        # Anything not worth caching, e.g., lookup_symbols(), goes straight
+        # through.
+        return getattr(self._transducer, name)
+
+
+class CachedFomaFST:
+    """
+    Wraps a foma.FST, caching `fst[string]` lookups
+
+    Everything else is passed through to the wrapped FST.
+    """
+
+    def __init__(self, name: str, fst):
+        self._fst = fst
+        self._cache = lookup_cache(name)
+
+    def __getitem__(self, string: str) -> list[bytes]:
+        return list(
+            self._cache.get_or_compute(string, lambda: tuple(self._fst[string]))
+        )
+
+    def __getattr__(self, name):
+        return getattr(self._fst, name)
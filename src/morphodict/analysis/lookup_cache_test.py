@@ -0,0 +1,110 @@
+import threading
+
+from morphodict.analysis.lookup_cache import (
+    CachedFomaFST,
+    CachedTransducer,
+    LRULookupCache,
+    fst_cache_stats,
+)
+
+
+def test_lru_lookup_cache_counts_hits_misses_and_evictions():
+    cache = LRULookupCache("test", maxsize=2)
+    calls = []
+
+    def compute(key):
+        calls.append(key)
+        return key.upper()
+
+    assert cache.get_or_compute("a", lambda: compute("a")) == "A"
+    assert cache.get_or_compute("b", lambda: compute("b")) == "B"
+    assert cache.get_or_compute("a", lambda: compute("a")) == "A"
+    # evicts "b", the least recently used
+    assert cache.get_or_compute("c", lambda: compute("c")) == "C"
+    assert cache.get_or_compute("b", lambda: compute("b")) == "B"
+
+    assert calls == ["a", "b", "c", "b"]
+    assert cache.stats() == {
+        "size": 2,
+        "maxsize": 2,
+        "hits": 1,
+        "misses": 4,
+        "evictions": 2,
+    }
+
+
+def test_lru_lookup_cache_size_zero_disables_caching():
+    cache = LRULookupCache("test", maxsize=0)
+    calls = []
+    for _ in range(3):
+        cache.get_or_compute("a", lambda: calls.append("a"))
+    assert len(calls) == 3
+    assert cache.stats()["size"] == 0
+
+
+def test_lru_lookup_cache_is_thread_safe():
+    cache = LRULookupCache("test", maxsize=50)
+
+    def work():
+        for i in range(1000):
+            assert cache.get_or_compute(i % 100, lambda: i % 100) == i % 100
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    stats = cache.stats()
+    assert stats["hits"] + stats["misses"] == 4000
+    assert stats["size"] <= 50
+
+
+class FakeTransducer:
+    def __init__(self):
+        self.lookups = []
+
+    def lookup(self, string):
+        self.lookups.append(string)
+        return [string + "+N"]
+
+    def lookup_lemma_with_affixes(self, string):
+        self.lookups.append(string)
+        return [((), string, ("+N",))]
+
+    def symbol_count(self):
+        return 42
+
+
+def test_cached_transducer():
+    fake = FakeTransducer()
+    transducer = CachedTransducer("test_cached_transducer", fake)
+
+    assert transducer.lookup("atim") == ["atim+N"]
+    result = transducer.lookup("atim")
+    result.append("mutated")
+    assert transducer.bulk_lookup(["atim", "minôs"]) == {
+        "atim": {"atim+N"},
+        "minôs": {"minôs+N"},
+    }
+    assert transducer.lookup_lemma_with_affixes("atim") == [((), "atim", ("+N",))]
+    assert transducer.symbol_count() == 42
+
+    assert fake.lookups == ["atim", "minôs", "atim"]
+    stats = fst_cache_stats()
+    assert stats["test_cached_transducer.lookup"]["hits"] == 2
+    assert stats["test_cached_transducer.lookup"]["misses"] == 2
+
+
+def test_cached_foma_fst():
+    lookups = []
+
+    class FakeFomaFST(dict):
+        def __getitem__(self, key):
+            lookups.append(key)
+            return [key.encode("UTF-8")]
+
+    fst = CachedFomaFST("test_cached_foma_fst", FakeFomaFST())
+    assert fst["they swam"] == [b"they swam"]
+    assert fst["they swam"] == [b"they swam"]
+    assert lookups == ["they swam"]
@@ -0,0 +1,112 @@
+"""
+The parts of importjsondict’s automatic translation of inflected forms that can
+run in worker processes
+
+Generating every form in a lemma’s paradigm and translating each definition
+into each form is the slow part of an import with --translate-wordforms, and it
+needs nothing from the database. So importjsondict sends jobs describing a
+lemma to a pool of worker processes, and saves the forms and translations they
+send back.
+
+Worker processes are started fresh instead of being forked from the importer,
+because a forked child would share the importer’s database connection. So
+this module must be importable before Django is set up, and the Django-using
+imports happen inside the functions.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class TranslationJob:
+    """Everything needed to auto-translate the inflected forms of one lemma"""
+
+    fst_lemma: str
+    # The lemma’s own analysis, which is skipped when generating the paradigm
+    lemma_raw_analysis: Optional[Any]
+    paradigm: str
+    definitions: list[str]
+
+
+@dataclass
+class TranslatedForm:
+    text: str
+    raw_analysis: Any
+    # (index into TranslationJob.definitions, translated definition) pairs
+    translations: list[tuple[int, str]]
+
+
+def init_worker():
+    """Set up Django in a newly-started worker process"""
+    import django
+
+    django.setup()
+
+
+def translate_forms(job: TranslationJob):
+    """
+    Generate the inflected forms of the lemma in job, and translate its
+    definitions into each of them.
+
+    :return: (forms that got at least one translation, TranslationStats)
+    """
+    from CreeDictionary.CreeDictionary.paradigm.generation import (
+        default_paradigm_manager,
+    )
+    from CreeDictionary.phrase_translate.translate import (
+        TranslationStats,
+        translate_single_definition,
+    )
+    from morphodict.analysis import RichAnalysis, strict_generator
+    from morphodict.lexicon.models import Wordform
+
+    stats = TranslationStats()
+    lemma_analysis = (
+        RichAnalysis(job.lemma_raw_analysis)
+        if job.lemma_raw_analysis is not None
+        else None
+    )
+
+    analyses = [
+        RichAnalysis((prefix_tags, job.fst_lemma, suffix_tags))
+        for (
+            prefix_tags,
+            suffix_tags,
+        ) in default_paradigm_manager().all_analysis_template_tags(job.paradigm)
+    ]
+    # bulk_lookup() is a loop over cached single lookups, not a batched FST call
+    generated_by_analysis = strict_generator().bulk_lookup(
+        [analysis.smushed() for analysis in analyses]
+    )
+
+    forms = []
+    for analysis in analyses:
+        # Skip re-instantiating lemma
+        if analysis == lemma_analysis:
+            continue
+
+        for generated in sorted(generated_by_analysis[analysis.smushed()]):
+            inflected_wordform = Wordform(
+                text=generated, raw_analysis=analysis.tuple, is_lemma=False
+            )
+
+            translations = []
+            for i, definition in enumerate(job.definitions):
+                translation = translate_single_definition(
+                    inflected_wordform, definition, stats
+                )
+                if translation is not None:
+                    translations.append((i, translation))
+
+            if translations:
+                forms.append(
+                    TranslatedForm(
+                        text=generated,
+                        raw_analysis=analysis.tuple,
+                        translations=translations,
+                    )
+                )
+    return forms, stats
@@ -6,6 +6,7 @@ from django.db import IntegrityError
 from pytest_django.fixtures import _django_db_fixture_helper
 
 from morphodict.lexicon.models import (
+    Definition,
     Wordform,
     TargetLanguageKeyword,
     SourceLanguageKeyword,
@@ -147,8 +148,9 @@ def debug(wf):
 
 
 @parametrize_reimport
-def test_import_lemma_auto_translation(db, reimport):
-    import_test_file("single-word.importjson", reimport=reimport)
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_import_lemma_auto_translation(db, reimport, jobs):
+    import_test_file("single-word.importjson", reimport=reimport, jobs=jobs)
 
     debug(Wordform.objects.get(slug="maskwa"))
 
@@ -434,6 +436,33 @@ def test_entry_removed(db, incremental):
     assert Wordform.objects.get(slug="maskwa")
 
 
+@parametrize_translate_wordforms
+def test_deleting_entries_leaves_nothing_behind(db, translate_wordforms):
+    def row_counts():
+        return [
+            model.objects.count()
+            for model in [
+                Wordform,
+                Definition,
+                Definition.citations.through,
+                TargetLanguageKeyword,
+                SourceLanguageKeyword,
+            ]
+        ]
+
+    import_test_file("single-word.importjson", translate_wordforms=translate_wordforms)
+    counts_for_single_word = row_counts()
+
+    # Replaces maskwa, and adds amisk
+    import_test_file("two-words.importjson", translate_wordforms=translate_wordforms)
+    # Replaces maskwa again, and purges amisk
+    import_test_file(
+        "single-word.importjson", translate_wordforms=translate_wordforms, purge=True
+    )
+
+    assert row_counts() == counts_for_single_word
+
+
 @parametrize_incremental
 @parametrize_translate_wordforms
 def test_non_lemma_wordform_added(db, translate_wordforms, incremental):
@@ -0,0 +1,191 @@
+"""
+Reading importjson files without loading them all into memory at once
+
+An importjson file is a JSON array of entries. Entries with a "slug" are
+lemmas, and entries with a "formOf" are other wordforms of the lemma with that
+slug. The importer only needs to look at one lemma and its wordforms at a time,
+so these functions stream the entries from the file and group them by slug as
+they go. Files whose entries are not grouped by slug have to be read into memory
+all at once instead.
+
+Newline-delimited importjson, with one entry per line and no enclosing array,
+is read too.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from os import PathLike
+from typing import Iterable, Iterator, TextIO
+
+from morphodict.lexicon.management.commands.buildtestimportjson import entry_sort_key
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 1 << 20
+
+_decoder = json.JSONDecoder()
+
+
+class ImportjsonFormatError(Exception):
+    pass
+
+
+def iter_entries(json_file: PathLike) -> Iterator[dict]:
+    """Yield the entries of an importjson file one at a time"""
+    with open(json_file, "r", encoding="UTF-8") as f:
+        yield from _iter_json_values(f)
+
+
+def iter_grouped_entries(json_file: PathLike) -> Iterator[dict]:
+    """
+    Like iter_entries(), but with all the entries for a slug next to each other
+
+    Files that are already grouped, like those written by `sortimportjson`, are
+    streamed after a first pass to check. Other files are read into memory to
+    group their entries, with a warning.
+    """
+    if _slugs_are_grouped(iter_entries(json_file)):
+        yield from iter_entries(json_file)
+        return
+
+    logger.warning(
+        f"Entries in {json_file} are not grouped by slug, reading the whole file into memory; sort it with `manage.py sortimportjson` to avoid this"
+    )
+    groups: dict[str, list[dict]] = {}
+    for entry in iter_entries(json_file):
+        groups.setdefault(entry_slug(entry), []).append(entry)
+    for entries in groups.values():
+        yield from entries
+
+
+def entry_slug(entry: dict) -> str:
+    """The slug of the lemma that entry belongs to"""
+    if "slug" in entry:
+        return entry["slug"]
+    elif "formOf" in entry:
+        return entry["formOf"]
+    raise ImportjsonFormatError(
+        f"Encountered entry without 'slug' or 'formOf' fields: {entry!r}"
+    )
+
+
+def iter_slug_groups(entries: Iterable[dict]) -> Iterator[tuple[str, list[dict]]]:
+    """
+    Yield (slug, entries) for each lemma slug, with all the entries for it
+
+    Only one group is held in memory at a time, which requires all the entries
+    for a slug to be next to each other, as they are in files written by
+    `sortimportjson`.
+
+    :raises ImportjsonFormatError: if entries for a slug are split up
+    """
+    seen_slugs: set[str] = set()
+    current_slug = None
+    current_entries: list[dict] = []
+
+    for entry in entries:
+        slug = entry_slug(entry)
+        if slug != current_slug:
+            if current_slug is not None:
+                yield current_slug, current_entries
+            if slug in seen_slugs:
+                raise ImportjsonFormatError(
+                    f"Entries for slug {slug!r} are not all together; sort the file with `manage.py sortimportjson` first"
+                )
+            seen_slugs.add(slug)
+            current_slug = slug
+            current_entries = []
+        current_entries.append(entry)
+
+    if current_slug is not None:
+        yield current_slug, current_entries
+
+
+def _slugs_are_grouped(entries: Iterable[dict]) -> bool:
+    seen_slugs: set[str] = set()
+    current_slug = None
+    for entry in entries:
+        slug = entry_slug(entry)
+        if slug != current_slug:
+            if slug in seen_slugs:
+                return False
+            seen_slugs.add(slug)
+            current_slug = slug
+    return True
+
+
+def importjson_hash(entries: list[dict]) -> str:
+    """
+    Hash of a lemma’s entries, to check whether they have changed since the
+    last import
+
+    Does not depend on the order of the entries.
+    """
+    # Same sort order as what sortimportjson uses
+    entries = sorted(entries, key=entry_sort_key)
+    # sort_keys is important
+    entry_list_as_json = json.dumps(
+        entries, ensure_ascii=False, indent=0, sort_keys=True
+    ).encode("UTF-8")
+    return hashlib.sha256(entry_list_as_json).hexdigest()[:20]
+
+
+def _iter_json_values(f: TextIO) -> Iterator[dict]:
+    """
+    Yield the objects in a JSON array, or in a sequence of whitespace-separated
+    JSON objects, reading f a chunk at a time
+    """
+    buffer = ""
+    pos = 0
+    at_eof = False
+
+    def skip_whitespace():
+        nonlocal buffer, pos, at_eof
+        while True:
+            while pos < len(buffer) and buffer[pos].isspace():
+                pos += 1
+            if pos < len(buffer) or at_eof:
+                return
+            buffer, pos = f.read(_CHUNK_SIZE), 0
+            at_eof = buffer == ""
+
+    skip_whitespace()
+    in_array = buffer[pos : pos + 1] == "["
+    if in_array:
+        pos += 1
+
+    while True:
+        skip_whitespace()
+        if pos == len(buffer):
+            if in_array:
+                raise ImportjsonFormatError("Unexpected end of file, expected ‘]’")
+            return
+        if in_array and buffer[pos] == "]":
+            return
+
+        while True:
+            try:
+                value, end = _decoder.raw_decode(buffer, pos)
+                break
+            except json.JSONDecodeError:
+                if at_eof:
+                    raise
+                # The value may continue in the next chunk
+                more = f.read(_CHUNK_SIZE)
+                at_eof = more == ""
+                buffer, pos = buffer[pos:] + more, 0
+
+        if not isinstance(value, dict):
+            raise ImportjsonFormatError(f"Expected an entry object, got {value!r}")
+        yield value
+        buffer, pos = buffer[end:], 0
+
+        if in_array:
+            skip_whitespace()
+            if buffer[pos : pos + 1] == ",":
+                pos += 1
+            elif buffer[pos : pos + 1] != "]":
+                raise ImportjsonFormatError("Expected ‘,’ or ‘]’ after entry")
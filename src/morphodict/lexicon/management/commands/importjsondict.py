@@ -1,30 +1,38 @@
-import hashlib
 import json
 import logging
+import multiprocessing
+import os
 import time
 from argparse import (
     ArgumentParser,
     BooleanOptionalAction,
     ArgumentDefaultsHelpFormatter,
 )
-from collections import defaultdict
-from pathlib import Path
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Iterable, Optional
 
 from django.conf import settings
 from django.core.management import BaseCommand, call_command
 from django.db import transaction
-from django.db.models import Max
+from django.db.models import Max, Q
 from tqdm import tqdm
 
-from CreeDictionary.CreeDictionary.paradigm.generation import default_paradigm_manager
-from CreeDictionary.phrase_translate.translate import (
-    translate_single_definition,
-    TranslationStats,
-)
+from CreeDictionary.phrase_translate.translate import TranslationStats
 from CreeDictionary.utils.english_keyword_extraction import stem_keywords
-from morphodict.analysis import RichAnalysis, strict_generator
 from morphodict.lexicon import DEFAULT_IMPORTJSON_FILE
-from morphodict.lexicon.management.commands.buildtestimportjson import entry_sort_key
+from morphodict.lexicon.auto_translation import (
+    TranslatedForm,
+    TranslationJob,
+    init_worker,
+    translate_forms,
+)
+from morphodict.lexicon.importjson import (
+    importjson_hash,
+    iter_grouped_entries,
+    iter_slug_groups,
+)
 from morphodict.lexicon.models import (
     Wordform,
     Definition,
@@ -162,25 +170,176 @@ class InsertBuffer:
             self._buffer = []
 
 
+# How many lemmas to delete at once
+DELETE_BATCH_SIZE = 500
+
+
+class DeleteBuffer:
+    """A container for the IDs of lemmas to be deleted.
+
+    Deletes the lemmas, along with all their wordforms and everything that
+    refers to those, every `count` IDs. The caller is responsible for calling
+    `save()` one final time when done.
+    """
+
+    def __init__(self, count=DELETE_BATCH_SIZE):
+        self._count = count
+        self._buffer = []
+
+    def add(self, lemma_id):
+        if len(self._buffer) >= self._count:
+            self.save()
+        self._buffer.append(lemma_id)
+
+    def save(self):
+        if len(self._buffer) > 0:
+            delete_lemmas(self._buffer)
+            self._buffer = []
+
+
+def delete_lemmas(lemma_ids) -> dict[str, int]:
+    """Delete lemmas, their wordforms, and all the rows referring to them
+
+    Django’s own cascading `.delete()` first loads every related object into
+    memory, a batch of queries per lemma. Since we know everything that can
+    refer to a wordform, we delete from each table in turn with one query
+    instead.
+
+    :return: the number of rows deleted from each table, like the breakdown
+        returned by `QuerySet.delete()`
+    """
+    # Lemmas are their own lemma, so this gets both lemmas and inflections
+    wordforms = Wordform.objects.filter(Q(id__in=lemma_ids) | Q(lemma_id__in=lemma_ids))
+    definitions = Definition.objects.filter(wordform__in=wordforms)
+
+    breakdown = {}
+    for queryset in [
+        Definition.citations.through.objects.filter(definition__in=definitions),
+        TargetLanguageKeyword.objects.filter(wordform__in=wordforms),
+        SourceLanguageKeyword.objects.filter(wordform__in=wordforms),
+        # The auto_translation_source of a definition is always a definition
+        # of the same lemma, so these go together.
+        definitions,
+        wordforms,
+    ]:
+        count = _delete_without_collector(queryset)
+        if count:
+            breakdown[queryset.model._meta.label] = count
+    return breakdown
+
+
+def _delete_without_collector(queryset) -> int:
+    """Delete the rows of queryset with a single query, returning the count
+
+    This skips the collector that `.delete()` uses to find related rows, so
+    callers must have deleted those already. No signals are sent.
+
+    `QuerySet._raw_delete()` is private Django API, which is why it is only
+    called here. Check that it still exists, with the same signature, when
+    upgrading Django past 3.2.
+    """
+    return queryset._raw_delete(queryset.db)
+
+
+TranslationResult = tuple[list[TranslatedForm], TranslationStats]
+TranslationCallback = Callable[[list[TranslatedForm], TranslationStats], None]
+
+
+class TranslationQueue:
+    """Runs auto-translation jobs, in worker processes if jobs > 1
+
+    Results are handed to their callbacks in the main process, in the order
+    the jobs were submitted, so that the main process alone assigns IDs and
+    inserts rows, and imports come out the same however many jobs are used.
+
+    Use it as a context manager, so that the worker processes are shut down
+    even if the import fails.
+    """
+
+    def __init__(self, jobs: int):
+        self._executor = None
+        if jobs > 1:
+            self._executor = ProcessPoolExecutor(
+                jobs,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_worker,
+            )
+        # Enough work queued up to keep every worker busy, without holding
+        # every result of a big import in memory
+        self._max_pending = jobs * 8
+        # (future, callback) pairs, where a future of None marks a callback
+        # from after_pending()
+        self._pending: deque[
+            tuple[Optional[Future[TranslationResult]], Callable[..., None]]
+        ] = deque()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def submit(self, job: TranslationJob, callback: TranslationCallback):
+        """Run job, then call callback(forms, stats) with its results"""
+        if self._executor is None:
+            callback(*translate_forms(job))
+            return
+
+        self._pending.append((self._executor.submit(translate_forms, job), callback))
+        self._handle_ready_results()
+
+    def after_pending(self, callback: Callable[[], None]):
+        """Call callback() after the callbacks of every job submitted so far
+
+        Unlike finish(), this does not wait, so the workers stay busy.
+        """
+        if not self._pending:
+            callback()
+            return
+
+        self._pending.append((None, callback))
+        self._handle_ready_results()
+
+    def finish(self):
+        """Wait for all submitted jobs, and run their callbacks"""
+        while self._pending:
+            self._handle_next_result()
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+
+    def _handle_ready_results(self):
+        while self._pending:
+            future = self._pending[0][0]
+            if (
+                len(self._pending) <= self._max_pending
+                and future is not None
+                and not future.done()
+            ):
+                return
+            self._handle_next_result()
+
+    def _handle_next_result(self):
+        future, callback = self._pending.popleft()
+        if future is None:
+            callback()
+        else:
+            callback(*future.result())
+
+
 class FreshnessCheck:
     """
     Encapsulation of checking whether importjson content has changed since last
     import
 
     Checks are done by lemma. The lemma entry and all associated formOf entries
-    are combined into a list, sorted, converted to JSON, and then a hash is
-    taken of that string. If the hash already in the database matches the hash
-    computed from the importjson input file, then we can assume the DB entry is
-    fresh.
+    are hashed with `importjson_hash()`. If the hash already in the database
+    matches the hash computed from the importjson input file, then we can
+    assume the DB entry is fresh.
     """
 
-    def __init__(self, new_data):
-        """
-        Create a new FreshnessCheck that will compare the DB to `new_data`.
-
-        `new_data` should be a Python list of importjsondata; it could be loaded
-        with `json.loads(importjsonfile.read())`
-        """
+    def __init__(self):
         self._db_hashes_by_slug = {
             slug: hash
             for (slug, hash) in Wordform.objects.filter(
@@ -188,73 +347,63 @@ class FreshnessCheck:
             ).values_list("slug", "import_hash")
         }
 
-        entries_by_slug = defaultdict(list)
-        for entry in new_data:
-            if "slug" in entry:
-                slug = entry["slug"]
-            elif "formOf" in entry:
-                slug = entry["formOf"]
-            else:
-                raise Exception(
-                    f"Encountered entry without 'slug' or 'formOf' fields: {entry!r}"
-                )
-            entries_by_slug[slug].append(entry)
-
-        importjson_hashes_by_slug = {}
-        for slug, entries in entries_by_slug.items():
-            # Same sort order as what sortimportjson uses
-            entries.sort(key=entry_sort_key)
-            # sort_keys is important
-            entry_list_as_json = json.dumps(
-                entries, ensure_ascii=False, indent=0, sort_keys=True
-            ).encode("UTF-8")
-            hash = hashlib.sha256(entry_list_as_json).hexdigest()[:20]
-            importjson_hashes_by_slug[slug] = hash
-        self._importjson_hash_for_slug = importjson_hashes_by_slug
-
     def db_hash_for_slug(self, slug):
         return self._db_hashes_by_slug.get(slug)
 
-    def importjson_hash_for_slug(self, slug):
-        return self._importjson_hash_for_slug[slug]
-
-    def is_fresh(self, slug):
+    def is_fresh(self, slug, importjson_hash):
         db_hash = self.db_hash_for_slug(slug)
         if db_hash is None:
             return False
-        importjson_hash = self.importjson_hash_for_slug(slug)
         return db_hash == importjson_hash
 
 
 class Import:
+    # How many formOf entries to hold on to before adding them to the database
+    FORM_DEFINITION_BATCH_SIZE = 2000
+
     def __init__(
         self,
-        importjson: list,
+        importjson: Iterable[dict],
         translate_wordforms: bool,
         purge: bool,
         incremental: bool,
         atomic=True,
+        jobs=1,
     ):
         """
         Create an Import process.
 
         If atomic is False, this will use batch processing that still works when
         not in a transaction.
+
+        importjson can be a list of entries, or an iterator like the one from
+        `iter_grouped_entries()` that reads them from a file as needed. Entries
+        must be grouped by slug.
+
+        jobs is how many processes to use for auto-translation.
         """
         self.dictionary_source_cache = DictionarySourceCache()
         self.data = importjson
         self.translate_wordforms = translate_wordforms
+        self.jobs = jobs
         self.incremental = incremental
         self.purge = purge
 
         self._has_run = False
 
-        self.paradigm_manager = default_paradigm_manager()
         self.translation_stats = TranslationStats()
 
         trigger_deps = not atomic
 
-        self.wordform_buffer = InsertBuffer(Wordform.objects, assign_id=True)
+        # Lemmas being replaced must be gone before their replacements, which
+        # have the same slugs, are inserted.
+        self.stale_lemma_buffer = DeleteBuffer()
+        self.wordform_buffer = InsertBuffer(
+            Wordform.objects,
+            assign_id=True,
+            trigger_deps=True,
+            deps=[self.stale_lemma_buffer],
+        )
         self.definition_buffer = InsertBuffer(
             Definition.objects,
             assign_id=True,
@@ -286,100 +435,45 @@ class Import:
             raise Exception("run can only be called once")
         self._has_run = True
 
-        freshness_check = FreshnessCheck(self.data)
+        freshness_check = FreshnessCheck()
 
-        seen_slugs = set()
+        # Includes lemmas added during this import, for resolving formOf
+        self.lemma_ids_by_slug = self.gather_lemma_ids()
         if self.purge:
-            existing_slugs = self.gather_slugs()
+            existing_slugs = set(self.lemma_ids_by_slug.keys())
+        seen_slugs = set()
 
         form_definitions = []
 
-        for entry in tqdm(self.data, smoothing=0):
-            if "formOf" in entry:
-                form_definitions.append(entry)
-                continue
-
-            if len(entry["senses"]) == 0:
-                raise Exception(f'Error: no senses for slug {entry["slug"]}')
-            for sense in entry["senses"]:
-                if "definition" not in sense:
-                    raise Exception(
-                        f'Error: no "definition" in sense {sense!r} of slug {entry["slug"]}'
-                    )
-
-            seen_slugs.add(validate_slug_format(entry["slug"]))
-
-            if self.incremental and freshness_check.is_fresh(entry["slug"]):
-                continue
-
-            if existing := Wordform.objects.filter(slug=entry["slug"]).first():
-                # Cascade should take care of all related objects.
-                existing.delete()
-
-            fst_lemma = None
-            if "fstLemma" in entry:
-                fst_lemma = entry["fstLemma"]
-            elif (analysis := entry.get("analysis")) is not None:
-                fst_lemma = analysis[1]
-
-            wf = Wordform(
-                text=entry["head"],
-                raw_analysis=entry.get("analysis", None),
-                fst_lemma=fst_lemma,
-                paradigm=entry.get("paradigm", None),
-                slug=entry["slug"],
-                is_lemma=True,
-                linguist_info=entry.get("linguistInfo", {}),
-                import_hash=freshness_check.importjson_hash_for_slug(entry["slug"]),
-            )
-            self.wordform_buffer.add(wf)
-            assert wf.id is not None
-            wf.lemma_id = wf.id
-
-            if "senses" not in entry:
-                raise Exception(
-                    f"Invalid importjson: no senses for lemma text={wf.text} slug={wf.slug}"
-                )
-
-            self.populate_wordform_definitions(wf, entry["senses"])
-
-            # Avoid dupes for this wordform
-            seen_source_language_keywords: set[str] = set()
-
-            slug_base = wf.slug.split("@")[0]
-            if wf.text != slug_base and slug_base:
-                self.add_source_language_keyword(
-                    wf, slug_base, seen_source_language_keywords
-                )
-            if wf.fst_lemma and wf.text != wf.fst_lemma:
-                self.add_source_language_keyword(
-                    wf, wf.fst_lemma, seen_source_language_keywords
+        with TranslationQueue(
+            self.jobs if self.translate_wordforms else 1
+        ) as self.translation_queue:
+            for slug, entries in tqdm(
+                iter_slug_groups(self.data), smoothing=0, unit=" lemmas"
+            ):
+                import_hash = importjson_hash(entries)
+                is_fresh = self.incremental and freshness_check.is_fresh(
+                    slug, import_hash
                 )
-            if wf.raw_analysis is None:
-                self.index_unanalyzed_form(wf, seen_source_language_keywords)
 
-        # Make sure everything is saved for upcoming formOf queries
-        self.flush_insert_buffers()
+                for entry in entries:
+                    if "formOf" in entry:
+                        if not is_fresh:
+                            form_definitions.append(entry)
+                        continue
 
-        for entry in form_definitions:
-            if self.incremental and freshness_check.is_fresh(entry["formOf"]):
-                continue
+                    self.import_lemma(entry, is_fresh, import_hash, seen_slugs)
 
-            try:
-                lemma = Wordform.objects.get(slug=entry["formOf"])
-            except Wordform.DoesNotExist:
-                raise Exception(
-                    f"Encountered wordform with formOf for unknown slug={entry['formOf']!r}"
-                )
+                if len(form_definitions) >= self.FORM_DEFINITION_BATCH_SIZE:
+                    self.translation_queue.after_pending(
+                        partial(self.import_form_definitions, form_definitions)
+                    )
+                    form_definitions = []
 
-            # If translate_wordforms is enabled, a Wordform for this inflection
-            # may already have been created.
-            wf = Wordform.objects.get_or_create(
-                lemma=lemma,
-                text=entry["head"],
-                raw_analysis=entry["analysis"],
-            )[0]
-            self.create_definitions(wf, entry["senses"])
+            self.translation_queue.after_pending(
+                partial(self.import_form_definitions, form_definitions)
+            )
+            self.translation_queue.finish()
 
         self.flush_insert_buffers()
 
@@ -387,9 +481,15 @@ class Import:
             logger.info("Translation stats: %s", self.translation_stats)
 
         if self.purge:
-            rows, breakdown = Wordform.objects.filter(
-                slug__in=existing_slugs - seen_slugs
-            ).delete()
+            purged_ids = [
+                self.lemma_ids_by_slug[slug] for slug in existing_slugs - seen_slugs
+            ]
+            breakdown = {}
+            for i in range(0, len(purged_ids), DELETE_BATCH_SIZE):
+                batch = purged_ids[i : i + DELETE_BATCH_SIZE]
+                for label, count in delete_lemmas(batch).items():
+                    breakdown[label] = breakdown.get(label, 0) + count
+            rows = sum(breakdown.values())
             if rows:
                 logger.warning(
                     f"Purged {rows:,} rows from database for existing entries not found in import file: %r",
@@ -404,7 +504,104 @@ class Import:
             stamp.timestamp = time.time()
             stamp.save()
 
-        call_command("builddefinitionvectors")
+        call_command("buildaffixsearchers")
+        call_command("builddefinitionvectors", incremental=self.incremental)
+
+    def import_lemma(self, entry, is_fresh, import_hash, seen_slugs):
+        """Add a lemma entry and everything derived from it"""
+        if len(entry["senses"]) == 0:
+            raise Exception(f'Error: no senses for slug {entry["slug"]}')
+        for sense in entry["senses"]:
+            if "definition" not in sense:
+                raise Exception(
+                    f'Error: no "definition" in sense {sense!r} of slug {entry["slug"]}'
+                )
+
+        seen_slugs.add(validate_slug_format(entry["slug"]))
+
+        if is_fresh:
+            return
+
+        if (existing_id := self.lemma_ids_by_slug.get(entry["slug"])) is not None:
+            self.stale_lemma_buffer.add(existing_id)
+
+        fst_lemma = None
+        if "fstLemma" in entry:
+            fst_lemma = entry["fstLemma"]
+        elif (analysis := entry.get("analysis")) is not None:
+            fst_lemma = analysis[1]
+
+        wf = Wordform(
+            text=entry["head"],
+            raw_analysis=entry.get("analysis", None),
+            fst_lemma=fst_lemma,
+            paradigm=entry.get("paradigm", None),
+            slug=entry["slug"],
+            is_lemma=True,
+            linguist_info=entry.get("linguistInfo", {}),
+            import_hash=import_hash,
+        )
+        self.wordform_buffer.add(wf)
+        assert wf.id is not None
+        wf.lemma_id = wf.id
+        self.lemma_ids_by_slug[wf.slug] = wf.id
+
+        if "senses" not in entry:
+            raise Exception(
+                f"Invalid importjson: no senses for lemma text={wf.text} slug={wf.slug}"
+            )
+
+        self.populate_wordform_definitions(wf, entry["senses"])
+
+        # Avoid dupes for this wordform
+        seen_source_language_keywords: set[str] = set()
+
+        slug_base = wf.slug.split("@")[0]
+        if wf.text != slug_base and slug_base:
+            self.add_source_language_keyword(
+                wf, slug_base, seen_source_language_keywords
+            )
+        if wf.fst_lemma and wf.text != wf.fst_lemma:
+            self.add_source_language_keyword(
+                wf, wf.fst_lemma, seen_source_language_keywords
+            )
+        if wf.raw_analysis is None:
+            self.index_unanalyzed_form(wf, seen_source_language_keywords)
+
+    def import_form_definitions(self, form_definitions):
+        """Add non-lemma wordforms and their definitions
+
+        Call this through `translation_queue.after_pending()`, so that the
+        inflections generated for their lemmas are already in the buffers.
+        """
+        # Make sure everything is saved for the query for existing wordforms
+        self.flush_insert_buffers()
+
+        lemma_ids = set()
+        for entry in form_definitions:
+            if entry["formOf"] not in self.lemma_ids_by_slug:
+                raise Exception(
+                    f"Encountered wordform with formOf for unknown slug={entry['formOf']!r}"
+                )
+            lemma_ids.add(self.lemma_ids_by_slug[entry["formOf"]])
+
+        # If translate_wordforms is enabled, a Wordform for an inflection may
+        # already have been created.
+        existing_wordforms = self.gather_wordforms(lemma_ids)
+
+        for entry in form_definitions:
+            lemma_id = self.lemma_ids_by_slug[entry["formOf"]]
+            key = (lemma_id, entry["head"], _analysis_key(entry["analysis"]))
+            wf = existing_wordforms.get(key)
+            if wf is None:
+                wf = Wordform(
+                    lemma_id=lemma_id,
+                    text=entry["head"],
+                    raw_analysis=entry["analysis"],
+                )
+                self.wordform_buffer.add(wf)
+                existing_wordforms[key] = wf
+            self.create_definitions(wf, entry["senses"])
 
     def populate_wordform_definitions(self, wf, senses):
         should_do_translation = self.translate_wordforms
@@ -430,37 +627,22 @@ class Import:
             else wf.fst_lemma
         )
 
-        for (
-            prefix_tags,
-            suffix_tags,
-        ) in self.paradigm_manager.all_analysis_template_tags(wf.paradigm):
-            analysis = RichAnalysis((prefix_tags, lemma_text, suffix_tags))
-            for generated in strict_generator().lookup(analysis.smushed()):
-                # Skip re-instantiating lemma
-                if analysis == wf.analysis:
-                    continue
+        def add_translations(forms, stats):
+            self.translation_stats += stats
 
+            for form in forms:
                 inflected_wordform = Wordform(
                     # For now, leaving paradigm and linguist_info empty;
                     # code can get that info from the lemma instead.
-                    text=generated,
-                    raw_analysis=analysis.tuple,
+                    text=form.text,
+                    raw_analysis=form.raw_analysis,
                     lemma=wf,
                     is_lemma=False,
                 )
+                self.wordform_buffer.add(inflected_wordform)
 
-                for d, sources in definitions_and_sources:
-
-                    translation = translate_single_definition(
-                        inflected_wordform, d.text, self.translation_stats
-                    )
-                    if translation is None:
-                        continue
-
-                    is_inflected_wordform_unsaved = inflected_wordform.id is None
-                    if is_inflected_wordform_unsaved:
-                        self.wordform_buffer.add(inflected_wordform)
-
+                for i, translation in form.translations:
+                    d, sources = definitions_and_sources[i]
                     self._add_definition(
                         inflected_wordform,
                         translation,
@@ -468,6 +650,16 @@ class Import:
                         auto_translation_source=d,
                     )
 
+        self.translation_queue.submit(
+            TranslationJob(
+                fst_lemma=lemma_text,
+                lemma_raw_analysis=wf.raw_analysis,
+                paradigm=wf.paradigm,
+                definitions=[d.text for d, _ in definitions_and_sources],
+            ),
+            add_translations,
+        )
+
     def _add_definition(self, wordform, text, sources: list[str], **kwargs):
         """Lower-level method to add a definition.
 
@@ -519,14 +711,37 @@ class Import:
 
         return definitions_and_sources
 
-    def gather_slugs(self):
-        # For purging, this is used to track what existed initially
+    def gather_lemma_ids(self):
         return {
-            v[0]
-            for v in Wordform.objects.filter(slug__isnull=False).values_list("slug")
+            slug: id
+            for (slug, id) in Wordform.objects.filter(slug__isnull=False).values_list(
+                "slug", "id"
+            )
         }
 
+    def gather_wordforms(self, lemma_ids, batch_size=500):
+        """Existing wordforms of the given lemmas
+
+        :return: a dict from (lemma_id, text, _analysis_key(raw_analysis)) to
+            a Wordform with enough fields filled in to refer to it
+        """
+        lemma_ids = list(lemma_ids)
+        wordforms = {}
+        for i in range(0, len(lemma_ids), batch_size):
+            for id, lemma_id, text, raw_analysis in Wordform.objects.filter(
+                lemma_id__in=lemma_ids[i : i + batch_size]
+            ).values_list("id", "lemma_id", "text", "raw_analysis"):
+                key = (lemma_id, text, _analysis_key(raw_analysis))
+                wordforms.setdefault(
+                    key,
+                    Wordform(
+                        id=id, lemma_id=lemma_id, text=text, raw_analysis=raw_analysis
+                    ),
+                )
+        return wordforms
+
     def flush_insert_buffers(self):
+        self.stale_lemma_buffer.save()
         self.wordform_buffer.save()
         self.definition_buffer.save()
         self.citation_buffer.save()
@@ -597,6 +812,16 @@ class Command(BaseCommand):
                 inflected forms
             """,
         )
+        parser.add_argument(
+            "--jobs",
+            "-j",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="""
+                How many processes to use for automatic translation of
+                inflected forms
+            """,
+        )
         parser.add_argument(
             "--incremental",
             action=BooleanOptionalAction,
@@ -625,10 +850,11 @@ class Command(BaseCommand):
         atomic,
         translate_wordforms,
         incremental=False,
+        jobs=1,
         **options,
     ):
         logger.info(f"Importing {json_file}")
-        data = json.loads(Path(json_file).read_text())
+        data = iter_grouped_entries(json_file)
 
         imp = Import(
             importjson=data,
@@ -636,6 +862,7 @@ class Command(BaseCommand):
             atomic=atomic,
             translate_wordforms=translate_wordforms,
             incremental=incremental,
+            jobs=jobs,
         )
 
         if atomic:
@@ -659,3 +886,8 @@ def validate_slug_format(proposed_slug):
         )
 
     return proposed_slug
+
+
+def _analysis_key(raw_analysis):
+    """A hashable stand-in for a raw_analysis, for finding existing wordforms"""
+    return json.dumps(raw_analysis, ensure_ascii=False)
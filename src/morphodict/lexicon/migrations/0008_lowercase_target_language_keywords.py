@@ -0,0 +1,38 @@
+from django.db import migrations
+from django.db.migrations import RunPython
+from django.db.models import F
+from django.db.models.functions import Lower
+
+
+def lowercase_target_language_keywords(apps, schema_editor):
+    """
+    Search looks up target-language keywords with a case-sensitive `IN` query,
+    so make sure none were stored with uppercase letters.
+    """
+    TargetLanguageKeyword = apps.get_model("lexicon", "TargetLanguageKeyword")
+    for keyword in (
+        TargetLanguageKeyword.objects.annotate(lowercase_text=Lower("text"))
+        .exclude(text=F("lowercase_text"))
+        .iterator()
+    ):
+        if TargetLanguageKeyword.objects.filter(
+            text=keyword.lowercase_text, wordform_id=keyword.wordform_id
+        ).exists():
+            keyword.delete()
+        else:
+            keyword.text = keyword.lowercase_text
+            keyword.save()
+
+
+def noop(apps, schema_editor):
+    """Empty operation to allow this migration to be reversed"""
+    pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("lexicon", "0007_merge_20211001_1712"),
+    ]
+
+    operations = [RunPython(lowercase_target_language_keywords, noop)]
@@ -0,0 +1,58 @@
+from django.db import migrations, models
+
+import morphodict.lexicon.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("lexicon", "0008_lowercase_target_language_keywords"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ParadigmTableCache",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("lemma_slug", models.CharField(max_length=60)),
+                ("paradigm", models.CharField(max_length=60)),
+                ("size", models.CharField(max_length=60)),
+                (
+                    "fst_lemma",
+                    models.CharField(
+                        help_text="The lemma text that the forms were generated from",
+                        max_length=60,
+                    ),
+                ),
+                (
+                    "version",
+                    models.CharField(
+                        help_text="Hash of the layouts and generator FST used to generate the forms",
+                        max_length=64,
+                    ),
+                ),
+                (
+                    "forms",
+                    models.JSONField(
+                        encoder=morphodict.lexicon.models.DiacriticPreservingJsonEncoder,
+                        help_text="Maps each analysis template in the layout to its generated forms",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="paradigmtablecache",
+            constraint=models.UniqueConstraint(
+                fields=("lemma_slug", "paradigm", "size"),
+                name="unique_paradigm_table_per_lemma_and_size",
+            ),
+        ),
+    ]
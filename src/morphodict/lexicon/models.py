@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 from pathlib import Path
-from typing import Dict, Literal, Union
+from typing import Dict, Literal, Optional, Union
 
+import numpy as np
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.urls import reverse
@@ -14,6 +16,7 @@ from CreeDictionary.utils import (
     shared_res_dir,
 )
 from morphodict.analysis import RichAnalysis
+from morphodict.site.data_cache import load_arrays
 
 # How long a wordform or dictionary head can be. Not actually enforced in SQLite.
 MAX_WORDFORM_LENGTH = 60
@@ -279,6 +282,8 @@ class Definition(models.Model):
 
 
 class TargetLanguageKeyword(models.Model):
+    # Always a lowercased stem, as returned by stem_keywords(), so that search
+    # can match keywords with an exact, indexed lookup.
     text = models.CharField(max_length=MAX_WORDFORM_LENGTH)
 
     wordform = models.ForeignKey(
@@ -336,25 +341,120 @@ class ImportStamp(models.Model):
 
     timestamp = models.FloatField(help_text="epoch time of import")
 
+    @classmethod
+    def current_timestamp(cls) -> Optional[float]:
+        """
+        The timestamp of the last import, or None if nothing has been imported
+
+        Things derived from the dictionary contents can be cached for as long
+        as this value stays the same.
+        """
+        return cls.objects.values_list("timestamp", flat=True).first()
+
+
+class ParadigmTableCache(models.Model):
+    """Generated forms for one size of a lemma’s paradigm table
+
+    Filling in a paradigm table means running every cell of the layout through
+    the generator FST. The results only change when the layouts or the FST do,
+    so they are kept here, and word detail pages skip the FST.
+    """
+
+    lemma_slug = models.CharField(max_length=MAX_WORDFORM_LENGTH)
+    paradigm = models.CharField(max_length=MAX_WORDFORM_LENGTH)
+    size = models.CharField(max_length=MAX_WORDFORM_LENGTH)
+
+    fst_lemma = models.CharField(
+        max_length=MAX_WORDFORM_LENGTH,
+        help_text="The lemma text that the forms were generated from",
+    )
+    version = models.CharField(
+        max_length=64,
+        help_text="Hash of the layouts and generator FST used to generate the forms",
+    )
+    forms = models.JSONField(
+        encoder=DiacriticPreservingJsonEncoder,
+        help_text="Maps each analysis template in the layout to its generated forms",
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["lemma_slug", "paradigm", "size"],
+                name="unique_paradigm_table_per_lemma_and_size",
+            )
+        ]
+
+    def __repr__(self) -> str:
+        return f"<ParadigmTableCache({self.lemma_slug!r}, {self.paradigm!r}, {self.size!r})>"
+
+
+class MorphemeRankings:
+    """
+    Maps morphemes to their rankings, like a read-only dict
+
+    The morphemes are kept sorted in a numpy array for binary search, so
+    that worker processes can share them in a memory-mapped file.
+    """
+
+    def __init__(self, morphemes: np.ndarray, rankings: np.ndarray):
+        self.morphemes = morphemes
+        self.rankings = rankings
+
+    @classmethod
+    def from_dict(cls, rankings: Dict[str, float]) -> MorphemeRankings:
+        morphemes = sorted(rankings)
+        return cls(
+            np.array(morphemes, dtype=str),
+            np.array([rankings[m] for m in morphemes], dtype=np.float64),
+        )
+
+    def _index(self, morpheme: str) -> Optional[int]:
+        i = int(np.searchsorted(self.morphemes, morpheme))
+        if i < len(self.morphemes) and self.morphemes[i] == morpheme:
+            return i
+        return None
+
+    def get(self, morpheme: str, default: Optional[float] = None):
+        i = self._index(morpheme)
+        return default if i is None else float(self.rankings[i])
+
+    def __getitem__(self, morpheme: str) -> float:
+        i = self._index(morpheme)
+        if i is None:
+            raise KeyError(morpheme)
+        return float(self.rankings[i])
+
+    def __contains__(self, morpheme) -> bool:
+        return self._index(morpheme) is not None
+
+    def __len__(self):
+        return len(self.morphemes)
+
 
 class _WordformCache:
     @cached_property
-    def MORPHEME_RANKINGS(self) -> Dict[str, float]:
-        logger.debug("reading morpheme rankings")
-        ret = {}
-
-        lines = (
-            Path(shared_res_dir / "W_aggr_corp_morph_log_freq.txt")
-            .read_text()
-            .splitlines()
+    def MORPHEME_RANKINGS(self) -> MorphemeRankings:
+        contents = Path(shared_res_dir / "W_aggr_corp_morph_log_freq.txt").read_bytes()
+
+        def read_rankings():
+            logger.debug("reading morpheme rankings")
+            ret = {}
+            for line in contents.decode("UTF-8").splitlines():
+                cells = line.split("\t")
+                # todo: use the third row
+                if len(cells) >= 2:
+                    freq, morpheme, *_ = cells
+                    ret[morpheme] = float(freq)
+            rankings = MorphemeRankings.from_dict(ret)
+            return {"morphemes": rankings.morphemes, "rankings": rankings.rankings}
+
+        arrays = load_arrays(
+            "morpheme_rankings",
+            hashlib.sha256(contents).hexdigest()[:16],
+            read_rankings,
         )
-        for line in lines:
-            cells = line.split("\t")
-            # todo: use the third row
-            if len(cells) >= 2:
-                freq, morpheme, *_ = cells
-                ret[morpheme] = float(freq)
-        return ret
+        return MorphemeRankings(arrays["morphemes"], arrays["rankings"])
 
     def preload(self):
         # Accessing these cached properties will preload them
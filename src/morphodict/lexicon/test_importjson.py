@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+from morphodict.lexicon import importjson
+from morphodict.lexicon.importjson import (
+    ImportjsonFormatError,
+    importjson_hash,
+    iter_entries,
+    iter_grouped_entries,
+    iter_slug_groups,
+)
+
+ENTRIES = [
+    {"head": "maskwa", "senses": [{"definition": "bear"}], "slug": "maskwa"},
+    {"analysis": [[], "maskwa", ["+N", "+Pl"]], "formOf": "maskwa", "head": "maskwak"},
+    {"head": "nipâw", "senses": [{"definition": "s/he sleeps"}], "slug": "nipâw"},
+]
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(importjson, "_CHUNK_SIZE", 5)
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_iter_entries_json_array(tmp_path, small_chunks, indent):
+    path = tmp_path / "test.importjson"
+    path.write_text(json.dumps(ENTRIES, ensure_ascii=False, indent=indent))
+
+    assert list(iter_entries(path)) == ENTRIES
+
+
+def test_iter_entries_newline_delimited(tmp_path, small_chunks):
+    path = tmp_path / "test.importjson"
+    path.write_text("".join(json.dumps(e, ensure_ascii=False) + "\n" for e in ENTRIES))
+
+    assert list(iter_entries(path)) == ENTRIES
+
+
+@pytest.mark.parametrize(
+    "text", ["[", '[{"slug": "a"}', '[{"slug": "a"} {"slug": "b"}]', "[1]"]
+)
+def test_iter_entries_invalid(tmp_path, text):
+    path = tmp_path / "test.importjson"
+    path.write_text(text)
+
+    with pytest.raises((ImportjsonFormatError, json.JSONDecodeError)):
+        list(iter_entries(path))
+
+
+def test_iter_slug_groups():
+    assert list(iter_slug_groups(ENTRIES)) == [
+        ("maskwa", ENTRIES[:2]),
+        ("nipâw", ENTRIES[2:]),
+    ]
+
+
+def test_iter_slug_groups_requires_grouped_entries():
+    with pytest.raises(ImportjsonFormatError):
+        list(iter_slug_groups([ENTRIES[0], ENTRIES[2], ENTRIES[1]]))
+
+
+@pytest.mark.parametrize(
+    "entries",
+    [
+        ENTRIES,
+        [ENTRIES[0], ENTRIES[2], ENTRIES[1]],
+        [ENTRIES[1], ENTRIES[2], ENTRIES[0]],
+    ],
+)
+def test_iter_grouped_entries(tmp_path, entries):
+    path = tmp_path / "test.importjson"
+    path.write_text(json.dumps(entries, ensure_ascii=False))
+
+    assert sorted(iter_slug_groups(iter_grouped_entries(path))) == [
+        ("maskwa", [e for e in entries if e is not ENTRIES[2]]),
+        ("nipâw", [ENTRIES[2]]),
+    ]
+
+
+def test_importjson_hash_ignores_order():
+    assert importjson_hash(ENTRIES[:2]) == importjson_hash(ENTRIES[1::-1])
+    assert importjson_hash(ENTRIES[:2]) != importjson_hash(ENTRIES[:1])
@@ -0,0 +1,29 @@
+import pytest
+
+from morphodict.lexicon.models import MorphemeRankings, _WordformCache
+
+
+def test_morpheme_rankings_work_like_a_dict():
+    rankings = MorphemeRankings.from_dict({"nipâw": 2.5, "atim": 1.0, "a": 0.0})
+
+    assert len(rankings) == 3
+    assert rankings["atim"] == 1.0
+    assert rankings.get("nipâw") == 2.5
+    assert rankings.get("a") == 0.0
+    assert rankings.get("nipâwak") is None
+    assert rankings.get("", 7.0) == 7.0
+    assert "atim" in rankings
+    assert "at" not in rankings
+    with pytest.raises(KeyError):
+        rankings["zzzzzzzzzzzzzz"]
+
+
+def test_morpheme_rankings_file_is_shared(settings, tmp_path):
+    settings.MORPHODICT_DATA_CACHE_DIR = tmp_path
+
+    rankings = _WordformCache().MORPHEME_RANKINGS
+    again = _WordformCache().MORPHEME_RANKINGS
+
+    assert len(rankings) > 10_000
+    assert rankings.get("aya") == again.get("aya") == pytest.approx(3.43806)
+    assert len(list(tmp_path.iterdir())) == 1
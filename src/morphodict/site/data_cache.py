@@ -0,0 +1,76 @@
+"""
+Arrays saved in files that worker processes share by memory-mapping them
+
+uWSGI loads the app in its master process and then forks the workers, so
+everything built while loading starts out shared between them. But a Python
+object is copied into a worker as soon as its reference count changes, which
+for big dicts and lists happens on the first few requests. The data in numpy
+arrays memory-mapped from a file is never copied: every worker reads the same
+pages of the OS page cache, and so do worker processes that get restarted.
+"""
+
+from __future__ import annotations
+
+import logging
+import shutil
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+from django.conf import settings
+
+from morphodict.site.util import save_atomically
+
+logger = logging.getLogger(__name__)
+
+
+def load_arrays(
+    name: str, key: str, build: Callable[[], dict[str, np.ndarray]]
+) -> dict[str, np.ndarray]:
+    """
+    Return the arrays saved under name, first building and saving them if
+    none were saved for key
+
+    key must change whenever the input to build does, e.g., by being a hash
+    of the files that it reads. The arrays are memory-mapped read-only. If
+    they cannot be saved, the arrays are returned from memory instead.
+    """
+    directory = settings.MORPHODICT_DATA_CACHE_DIR / f"{name}-{key}"
+    if not directory.exists():
+        logger.debug(f"building {directory}")
+        arrays = build()
+        try:
+            _save(directory, arrays)
+        except OSError:
+            logger.warning(
+                f"Could not save {directory}, keeping {name} in memory",
+                exc_info=True,
+            )
+            return arrays
+        _remove_old_versions(directory, name)
+
+    return {path.stem: np.load(path, mmap_mode="r") for path in directory.glob("*.npy")}
+
+
+def _save(directory: Path, arrays: dict[str, np.ndarray]):
+    """Save arrays to directory, which appears only once it is complete"""
+
+    def write(temp_dir: Path):
+        temp_dir.mkdir()
+        for array_name, array in arrays.items():
+            np.save(temp_dir / f"{array_name}.npy", array)
+
+    directory.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        save_atomically(directory, write)
+    except OSError:
+        # Another process saved the same arrays first
+        if not directory.exists():
+            raise
+
+
+def _remove_old_versions(directory: Path, name: str):
+    # Processes still using the old files keep them open until they exit
+    for old in directory.parent.glob(f"{name}-*"):
+        if old != directory:
+            shutil.rmtree(old, ignore_errors=True)
@@ -14,6 +14,8 @@ https://docs.djangoproject.com/en/3.2/ref/settings/
 
 import os
 import secrets
+import tempfile
+from pathlib import Path
 from typing import Optional
 
 from environs import Env
@@ -228,6 +230,26 @@ else:
         )
     }
 
+# Caching
+
+# Defaults to a per-process in-memory cache. Set CACHE_URL to, e.g.,
+# file:///var/tmp/morphodict-cache to share cached search results between
+# worker processes.
+CACHES = {"default": env.dj_cache_url("CACHE_URL", default="locmem://")}
+
+# Where to save data that is expensive to build, in files that worker processes
+# memory-map so that they all share one copy of it in the OS page cache. The
+# database directory is already a writable volume in production. Tests keep it
+# out of the source tree.
+MORPHODICT_DATA_CACHE_DIR = env.path(
+    "MORPHODICT_DATA_CACHE_DIR",
+    default=(
+        Path(tempfile.gettempdir()) / f"morphodict-{BASE_DIR.name}-test-cache"
+        if USE_TEST_DB
+        else BASE_DIR / "db" / "cache"
+    ),
+)
+
 # Django sites framework
 
 # See: https://docs.djangoproject.com/en/2.2/ref/contrib/sites/#enabling-the-sites-framework
@@ -350,6 +372,28 @@ LOGGING = {
 # We only apply affix search for user queries longer than the threshold length
 AFFIX_SEARCH_THRESHOLD = 4
 
+# Source-language affix search results are dropped before being looked up in
+# the database if their edit distance from the query is more than this beyond
+# the difference in their lengths, i.e., the part of the word that the query
+# does not cover. Set to None to keep every affix match.
+AFFIX_SEARCH_MAX_EXTRA_EDIT_DISTANCE: Optional[float] = 2
+
+# How many seconds to keep the results of a search in the cache. Cached results
+# are also dropped when a new dictionary is imported. Set to 0 to disable.
+MORPHODICT_SEARCH_CACHE_TIMEOUT = 60 * 60
+
+# How many results a page of search results shows, on the search page and in
+# click-in-text responses. Only the results on the requested page get fully
+# ranked and presented.
+MORPHODICT_SEARCH_RESULTS_PER_PAGE = 50
+
+# How many seconds browsers and proxies may reuse a click-in-text API response
+# before revalidating it with its ETag.
+MORPHODICT_CLICK_IN_TEXT_MAX_AGE = 5 * 60
+
+# The most distinct words one bulk click-in-text request may look up
+MORPHODICT_CLICK_IN_TEXT_BULK_MAX_TOKENS = 1000
+
 # This defaults to False, because in order to work it requires that there
 # be correct tag mappings for all analyzable forms.
 MORPHODICT_SUPPORTS_AUTO_DEFINITIONS = False
@@ -358,6 +402,32 @@ MORPHODICT_SUPPORTS_AUTO_DEFINITIONS = False
 # requires libraries we do not currently build, and a smaller vector file.
 MORPHODICT_ENABLE_CVD = True
 
+# Whether semantic search only compares the query with the definition vectors
+# in the closest clusters of an index built by `builddefinitionvectors
+# --ann-index`, instead of with every definition vector. Faster for large
+# dictionaries, but can miss results; `benchmarkcvdindex` measures how many.
+MORPHODICT_CVD_APPROXIMATE_SEARCH = False
+
+# How many index clusters approximate semantic search looks in. More clusters
+# find more of the exact results, but take longer.
+MORPHODICT_CVD_APPROXIMATE_SEARCH_PROBES = 32
+
+# Set to "float16" or "int8" to have `builddefinitionvectors` also save the
+# definition vectors scaled to unit length in that type, and to have semantic
+# search compare queries with those instead of the float32 vectors. They take
+# a half or a quarter of the memory, at the cost of small errors in the
+# similarities; `benchmarkcvdindex` measures how much results change. NumPy
+# converts int8 to float32 much faster than float16, so int8 is usually also
+# the faster of the two to search.
+MORPHODICT_CVD_QUANTIZED_VECTORS: Optional[str] = None
+
+# Look up query words in the trimmed news vectors from `manage.py
+# trimnewsvectors` instead of all three million Google News vectors, which
+# makes startup faster and uses much less memory. Query words that were
+# trimmed are ignored. `builddefinitionvectors` still uses the full news
+# vectors, and rebuilds the trimmed ones when this is on.
+MORPHODICT_CVD_TRIMMED_NEWS_VECTORS = False
+
 # Enable affix search. Optional because it requires a C++ library which we do
 # not currently build for mobile.
 MORPHODICT_ENABLE_AFFIX_SEARCH = True
@@ -366,6 +436,12 @@ MORPHODICT_ENABLE_AFFIX_SEARCH = True
 # lemma text when generating wordforms
 MORPHODICT_ENABLE_FST_LEMMA_SUPPORT = False
 
+# How many distinct lookups to remember for each FST. Sizes for particular
+# caches, e.g., "strict_generator.lookup" or "eng_phrase_to_crk_features", can
+# be set in MORPHODICT_FST_CACHE_SIZES. A size of 0 disables caching.
+MORPHODICT_FST_CACHE_SIZE = 10_000
+MORPHODICT_FST_CACHE_SIZES: dict[str, int] = {}
+
 # Default names for FST files
 STRICT_ANALYZER_FST_FILENAME = "analyser-gt-norm.hfstol"
 RELAXED_ANALYZER_FST_FILENAME = "analyser-gt-desc.hfstol"
@@ -0,0 +1,42 @@
+import numpy as np
+
+from morphodict.site.data_cache import load_arrays
+
+
+def test_arrays_are_built_once_and_memory_mapped(settings, tmp_path):
+    settings.MORPHODICT_DATA_CACHE_DIR = tmp_path / "cache"
+    builds = []
+
+    def build():
+        builds.append(1)
+        return {"numbers": np.arange(5), "words": np.array(["a", "bc"])}
+
+    first = load_arrays("things", "v1", build)
+    second = load_arrays("things", "v1", build)
+
+    assert len(builds) == 1
+    for arrays in [first, second]:
+        assert isinstance(arrays["numbers"], np.memmap)
+        assert list(arrays["numbers"]) == [0, 1, 2, 3, 4]
+        assert list(arrays["words"]) == ["a", "bc"]
+
+
+def test_new_key_replaces_old_arrays(settings, tmp_path):
+    settings.MORPHODICT_DATA_CACHE_DIR = tmp_path
+
+    load_arrays("things", "v1", lambda: {"numbers": np.arange(5)})
+    arrays = load_arrays("things", "v2", lambda: {"numbers": np.arange(3)})
+
+    assert list(arrays["numbers"]) == [0, 1, 2]
+    assert [p.name for p in tmp_path.iterdir()] == ["things-v2"]
+
+
+def test_unwritable_cache_dir_keeps_arrays_in_memory(settings, tmp_path):
+    not_a_directory = tmp_path / "file"
+    not_a_directory.write_text("")
+    settings.MORPHODICT_DATA_CACHE_DIR = not_a_directory / "cache"
+
+    arrays = load_arrays("things", "v1", lambda: {"numbers": np.arange(5)})
+
+    assert list(arrays["numbers"]) == [0, 1, 2, 3, 4]
+    assert not isinstance(arrays["numbers"], np.memmap)
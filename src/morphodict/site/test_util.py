@@ -0,0 +1,34 @@
+import pytest
+
+from morphodict.site.util import save_atomically
+
+
+def test_save_atomically_replaces_files(tmp_path):
+    path = tmp_path / "data"
+    path.write_text("old")
+
+    def write(temp_path):
+        assert not path.with_name(temp_path.name + ".extra").exists()
+        temp_path.write_text("new")
+        temp_path.with_name(temp_path.name + ".extra").write_text("extra")
+
+    save_atomically(path, write, suffixes=[".extra", ""])
+
+    assert path.read_text() == "new"
+    assert (tmp_path / "data.extra").read_text() == "extra"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["data", "data.extra"]
+
+
+def test_save_atomically_cleans_up_after_failure(tmp_path):
+    path = tmp_path / "data"
+    path.write_text("old")
+
+    def write(temp_path):
+        temp_path.write_text("partial")
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        save_atomically(path, write)
+
+    assert path.read_text() == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["data"]
@@ -1,4 +1,9 @@
+import os
+import shutil
+import tempfile
 from functools import cache
+from pathlib import Path
+from typing import Callable, Sequence
 
 
 def cache_unless(arg: bool, /):
@@ -16,3 +21,28 @@ def cache_unless(arg: bool, /):
     if arg:
         return lambda x: x
     return cache
+
+
+def save_atomically(
+    path: Path, write: Callable[[Path], None], suffixes: Sequence[str] = ("",)
+):
+    """
+    Call write(temp_path) to save a file or directory at temp_path, then rename
+    it to path, so that path never holds something partly written
+
+    If write saves more than one file, by adding suffixes to the path it is
+    given, list those suffixes; they are renamed in that order, so put the file
+    that readers look at first last.
+
+    Every call writes to its own temporary directory next to path, so processes
+    saving the same thing at once do not clash, and it is removed afterwards,
+    along with anything left in it if writing or renaming fails.
+    """
+    temp_dir = Path(tempfile.mkdtemp(dir=path.parent, prefix=".tmp-"))
+    try:
+        temp_path = temp_dir / path.name
+        write(temp_path)
+        for suffix in suffixes:
+            os.replace(f"{temp_path}{suffix}", f"{path}{suffix}")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)